@@ -0,0 +1,47 @@
+# Copyright (c) 2026 Andrii Shekhovtsov
+from pymcdm import methods
+from pymcdm.methods.comet_tools import MethodExpert, triads_consistency
+
+from .common import N_VALUES, decision_problem, skip_if_too_large
+
+# Number of criteria in COMET is limited, as the number of characteristic objects grows exponentially
+COMET_M_VALUES = [2, 3, 4, 5]
+
+
+class COMETSuite:
+    """ Identification and evaluation with COMET, with 3 characteristic values for each criterion. """
+    params = [N_VALUES, COMET_M_VALUES]
+    param_names = ['n', 'm']
+    timeout = 600
+
+    def setup(self, n, m):
+        skip_if_too_large(n * 2 ** m)
+        self.matrix, self.weights, self.types = decision_problem(n, m)
+        self.cvalues = methods.COMET.make_cvalues(self.matrix)
+        self.expert = MethodExpert(methods.TOPSIS(), self.weights, self.types)
+        self.comet = methods.COMET(self.cvalues, self.expert)
+
+    def time_identification(self, n, m):
+        methods.COMET(self.cvalues, self.expert)
+
+    def time_evaluation(self, n, m):
+        self.comet(self.matrix, self.weights, self.types, validation=False)
+
+    def time_get_MEJ(self, n, m):
+        self.comet.mej = None
+        self.comet.get_MEJ()
+
+
+class TriadsConsistencySuite:
+    """ Consistency of the triads in the MEJ of the COMET model. """
+    params = [[2, 3]]
+    param_names = ['m']
+    timeout = 600
+
+    def setup(self, m):
+        matrix, weights, types = decision_problem(10, m)
+        self.comet = methods.COMET(methods.COMET.make_cvalues(matrix),
+                                   MethodExpert(methods.TOPSIS(), weights, types))
+
+    def time_triads_consistency(self, m):
+        triads_consistency(self.comet)
@@ -0,0 +1,81 @@
+# Copyright (c) 2026 Andrii Shekhovtsov
+import numpy as np
+
+from pymcdm import methods
+from pymcdm.methods import partial
+from pymcdm.methods.mcda_method import MCDA_method
+
+from .common import N_VALUES, M_VALUES, decision_problem, skip_if_too_large
+
+
+def _bounds(matrix):
+    return methods.SPOTIS.make_bounds(matrix)
+
+
+def _ideal(matrix, types):
+    bounds = _bounds(matrix)
+    return np.where(types == 1, bounds[:, 1], bounds[:, 0]), np.where(types == 1, bounds[:, 0], bounds[:, 1])
+
+
+# Constructors of the methods which require parameters based on the decision problem
+_FACTORIES = {
+    'SPOTIS': lambda matrix, types: methods.SPOTIS(_bounds(matrix)),
+    'BalancedSPOTIS': lambda matrix, types: methods.BalancedSPOTIS(_bounds(matrix), np.mean(matrix, axis=0)),
+    'RIM': lambda matrix, types: methods.RIM(_bounds(matrix)),
+    'RAFSI': lambda matrix, types: methods.RAFSI(*_ideal(matrix, types)),
+    'ERVD': lambda matrix, types: methods.ERVD(np.mean(matrix, axis=0)),
+    'PROMETHEE_I': lambda matrix, types: partial.PROMETHEE_I('usual'),
+    'PROMETHEE_II': lambda matrix, types: methods.PROMETHEE_II('usual'),
+}
+
+# Methods which compare all pairs of alternatives
+_PAIRWISE = {'CODAS', 'PROBID', 'SPROBID'}
+
+# COMET based methods are benchmarked in bench_comet
+_EXCLUDED = {'COMET', 'StructuralCOMET'}
+
+METHODS = sorted(
+    [name for name, obj in vars(methods).items()
+     if isinstance(obj, type) and issubclass(obj, MCDA_method) and name not in _EXCLUDED]
+    + ['PROMETHEE_I']
+)
+
+
+def make_method(name, matrix, types):
+    if name in _FACTORIES:
+        return _FACTORIES[name](matrix, types)
+    return getattr(methods, name)()
+
+
+class MethodsSuite:
+    """ Evaluation of the decision problems with each MCDA method. """
+    params = [METHODS, N_VALUES, M_VALUES]
+    param_names = ['method', 'n', 'm']
+    timeout = 600
+
+    def setup(self, method, n, m):
+        skip_if_too_large(n * n * m if method in _PAIRWISE else n * m)
+        self.matrix, self.weights, self.types = decision_problem(n, m)
+        self.method = make_method(method, self.matrix, self.types)
+
+    def time_call(self, method, n, m):
+        self.method(self.matrix, self.weights, self.types, validation=False)
+
+    def time_call_validated(self, method, n, m):
+        self.method(self.matrix, self.weights, self.types)
+
+
+class BatchSuite:
+    """ Evaluation of the decision problem for a stack of weight vectors. """
+    params = [['TOPSIS', 'VIKOR', 'WSM', 'SPOTIS', 'EDAS'], [10, 1000, 100_000], [3, 10, 50], [100]]
+    param_names = ['method', 'n', 'm', 'k']
+    timeout = 600
+
+    def setup(self, method, n, m, k):
+        skip_if_too_large(n * m * k)
+        self.matrix, _, self.types = decision_problem(n, m)
+        self.weights = np.random.default_rng(0).dirichlet(np.ones(m), size=k)
+        self.method = make_method(method, self.matrix, self.types)
+
+    def time_batch(self, method, n, m, k):
+        self.method.batch(self.matrix, self.weights, self.types, validation=False)
@@ -0,0 +1,67 @@
+# Copyright (c) 2026 Andrii Shekhovtsov
+import numpy as np
+
+from pymcdm import correlations, distances, helpers
+
+from .common import N_VALUES, rankings, skip_if_too_large
+
+CORRELATIONS = [name for name in correlations.__all__ if name not in ('wsc', 'wsc2')]
+WEIGHTS_SIMILARITY = ['wsc', 'wsc2']
+
+
+class CorrelationsSuite:
+    """ Correlation coefficients between two rankings. """
+    params = [CORRELATIONS, N_VALUES]
+    param_names = ['correlation', 'n']
+
+    def setup(self, name, n):
+        skip_if_too_large(n)
+        self.x, self.y = rankings(n)
+        self.function = getattr(correlations, name)
+
+    def time_correlation(self, name, n):
+        self.function(self.x, self.y)
+
+
+class WeightsSimilaritySuite:
+    """ Similarity coefficients between two weight vectors. """
+    params = [WEIGHTS_SIMILARITY, N_VALUES]
+    param_names = ['correlation', 'n']
+
+    def setup(self, name, n):
+        skip_if_too_large(n)
+        rng = np.random.default_rng(0)
+        self.x, self.y = rng.dirichlet(np.ones(n), size=2)
+        self.function = getattr(correlations, name)
+
+    def time_correlation(self, name, n):
+        self.function(self.x, self.y)
+
+
+class DistancesSuite:
+    """ Distances between two rankings. """
+    params = [distances.__all__, N_VALUES]
+    param_names = ['distance', 'n']
+
+    def setup(self, name, n):
+        skip_if_too_large(n)
+        self.x, self.y = rankings(n)
+        self.function = getattr(distances, name)
+
+    def time_distance(self, name, n):
+        self.function(self.x, self.y)
+
+
+class CorrelationMatrixSuite:
+    """ Correlation matrix of many rankings. """
+    params = [['spearman', 'weighted_spearman', 'kendall_tau'], [10, 100, 1000], [10, 100]]
+    param_names = ['correlation', 'n', 'k']
+
+    def setup(self, name, n, k):
+        skip_if_too_large(n * k * k)
+        rng = np.random.default_rng(0)
+        self.rankings = helpers.rankdata(rng.random((k, n)))
+        self.function = getattr(correlations, name)
+
+    def time_correlation_matrix(self, name, n, k):
+        helpers.correlation_matrix(self.rankings, self.function)
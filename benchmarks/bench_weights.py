@@ -0,0 +1,24 @@
+# Copyright (c) 2026 Andrii Shekhovtsov
+from pymcdm import weights
+
+from .common import N_VALUES, M_VALUES, decision_problem, skip_if_too_large
+
+WEIGHTS = [name for name in weights.__all__ if name != 'subjective']
+
+# Weighting methods which compare all pairs of alternatives
+_PAIRWISE = {'gini_weights'}
+
+
+class WeightsSuite:
+    """ Objective weighting methods. """
+    params = [WEIGHTS, N_VALUES, M_VALUES]
+    param_names = ['weights', 'n', 'm']
+    timeout = 600
+
+    def setup(self, name, n, m):
+        skip_if_too_large(n * n * m if name in _PAIRWISE else n * m)
+        self.matrix, _, self.types = decision_problem(n, m)
+        self.function = getattr(weights, name)
+
+    def time_weights(self, name, n, m):
+        self.function(self.matrix, self.types)
@@ -0,0 +1,52 @@
+# Copyright (c) 2026 Andrii Shekhovtsov
+""" Shared helpers for the benchmark suites.
+
+    Benchmarks follow the airspeed velocity (asv) conventions: suites are
+    classes with `params`, `param_names`, `setup` and `time_*` methods, and
+    `setup` raises NotImplementedError to skip a combination of parameters.
+"""
+import os
+
+import numpy as np
+
+# Grid of the decision problem sizes (number of alternatives and criteria)
+N_VALUES = [10, 100, 1000, 10_000, 100_000, 1_000_000]
+M_VALUES = [3, 10, 50, 200]
+
+# Combinations which need more work (approximately, in elements processed)
+# are skipped, so the full grid finishes in reasonable time
+MAX_WORK = int(os.environ.get('PYMCDM_BENCH_MAX_WORK', 10 ** 8))
+
+
+def skip_if_too_large(work):
+    """ Skip the benchmark if it needs more than `MAX_WORK` elements of work. """
+    if work > MAX_WORK:
+        raise NotImplementedError(f'Work {work} exceeds {MAX_WORK}.')
+
+
+def decision_problem(n, m, seed=0):
+    """ Random decision problem with `n` alternatives and `m` criteria.
+
+        Returns
+        -------
+            matrix : ndarray
+                Decision matrix with values in [1, 100].
+
+            weights : ndarray
+                Random weights which sum up to 1.
+
+            types : ndarray
+                Alternating profit and cost criteria types.
+    """
+    rng = np.random.default_rng(seed)
+    matrix = rng.uniform(1, 100, (n, m))
+    weights = rng.dirichlet(np.ones(m))
+    types = np.where(np.arange(m) % 2 == 0, 1, -1)
+    return matrix, weights, types
+
+
+def rankings(n, seed=0):
+    """ Two random rankings (with ties) of `n` alternatives. """
+    rng = np.random.default_rng(seed)
+    from pymcdm.helpers import rankdata
+    return rankdata(rng.integers(0, n, n)), rankdata(rng.integers(0, n, n))
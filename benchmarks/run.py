@@ -0,0 +1,137 @@
+# Copyright (c) 2026 Andrii Shekhovtsov
+""" Run the benchmark suites without asv and store the results in JSON.
+
+    Usage examples (from the repository root)::
+
+        python -m benchmarks.run --quick
+        python -m benchmarks.run --filter TOPSIS --output new.json --compare old.json
+
+    Each result is identified by the benchmark name and its parameters, and
+    stores the best time (in seconds) of a single call. With `--compare`, the
+    benchmarks which are slower than in the given results file by more than
+    `--threshold` are reported and the script exits with status 1.
+"""
+import argparse
+import importlib
+import itertools
+import json
+import platform
+import re
+import sys
+import subprocess
+import timeit
+from datetime import datetime, timezone
+
+import numpy as np
+
+from . import common
+
+SUITES = ['bench_methods', 'bench_weights', 'bench_rankings', 'bench_comet']
+
+
+def _benchmarks(pattern):
+    """ Yield (name, suite class, time method name, parameters) for each benchmark. """
+    for module_name in SUITES:
+        module = importlib.import_module(f'{__package__}.{module_name}')
+        for cls_name, cls in vars(module).items():
+            if not (isinstance(cls, type) and cls.__module__ == module.__name__ and hasattr(cls, 'params')):
+                continue
+            for attr in sorted(vars(cls)):
+                if not attr.startswith('time_'):
+                    continue
+                name = f'{module_name}.{cls_name}.{attr}'
+                for params in itertools.product(*cls.params):
+                    if pattern is None or re.search(pattern, f'{name}{params}'):
+                        yield name, cls, attr, params
+
+
+def _time(func, repeat):
+    """ Best time of a single call of `func`. """
+    timer = timeit.Timer(func)
+    number, total = timer.autorange()
+    times = [total / number] + [t / number for t in timer.repeat(repeat - 1, number)]
+    return min(times)
+
+
+def run(pattern=None, repeat=3, verbose=True):
+    results = []
+    for name, cls, attr, params in _benchmarks(pattern):
+        suite = cls()
+        result = {'name': name, 'params': dict(zip(cls.param_names, params))}
+        try:
+            suite.setup(*params)
+        except NotImplementedError:
+            continue
+        result['time'] = _time(lambda: getattr(suite, attr)(*params), repeat)
+        results.append(result)
+        if verbose:
+            print(f'{name}{params}: {result["time"]:.6g} s', flush=True)
+    return results
+
+
+def _key(result):
+    return result['name'], json.dumps(result['params'], sort_keys=True)
+
+
+def compare(results, baseline, threshold):
+    """ Return pairs of (baseline, new) results which are slower than `threshold` times. """
+    old = {_key(r): r for r in baseline}
+    return [(old[_key(r)], r) for r in results
+            if _key(r) in old and old[_key(r)]['time'] and r['time'] > threshold * old[_key(r)]['time']]
+
+
+def _commit():
+    """ Current git commit of the repository, or None. """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run pymcdm benchmarks.')
+    parser.add_argument('--filter', default=None,
+                        help='Regular expression, run only benchmarks which name and parameters match it.')
+    parser.add_argument('--quick', action='store_true',
+                        help='Skip benchmarks which need more than 10^6 elements of work.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of repeats of each measurement.')
+    parser.add_argument('--output', default='benchmark_results.json', help='Output JSON file.')
+    parser.add_argument('--compare', default=None, help='JSON file with the results to compare with.')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='Report benchmarks which are slower than threshold times the compared results.')
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        common.MAX_WORK = 10 ** 6
+
+    results = run(args.filter, args.repeat)
+    output = {
+        'meta': {
+            'date': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'commit': _commit(),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for old, new in regressions:
+            print(f'Regression: {new["name"]}{tuple(new["params"].values())}: '
+                  f'{old["time"]:.6g} s -> {new["time"]:.6g} s')
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,21 @@
-from . import io
+from importlib import import_module
+
 from . import methods
 from . import correlations
 from . import distances
 from . import normalizations
-from . import weights
 from . import helpers
-from . import visuals
+from . import smaa
+
+# Submodules with heavy dependencies (pandas, scipy, matplotlib) are imported on first access
+_LAZY_SUBMODULES = ('io', 'weights', 'visuals')
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return import_module(f'.{name}', __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
@@ -2,7 +2,6 @@
 # Copyright (c) 2021-2026 Bartłomiej Kizielewicz
 
 from functools import wraps
-from itertools import permutations
 import numpy as np
 from warnings import warn
 
@@ -34,6 +33,77 @@ def _cov(x, y):
     return np.cov(x, y, bias=True)[0][1]
 
 
+def _tied_pairs(x):
+    """ Number of pairs of equal elements in `x`. """
+    _, counts = np.unique(x, return_counts=True)
+    return int(np.sum(counts * (counts - 1) // 2))
+
+
+def _count_inversions(a):
+    """ Number of pairs i < j for which a[i] > a[j], counted in O(n log n).
+
+        Ranks of the elements are stable partitioned by their bits, from the
+        most significant one, in the same way as in the radix sort. Pair
+        i < j is an inversion if elements have the same higher bits and a[i]
+        has the first differing bit set, so inversions are counted for each
+        bit in linear time.
+    """
+    _, a = np.unique(a, return_inverse=True)
+    a = a.astype(np.int64).ravel()
+    n = a.shape[0]
+    if n < 2:
+        return 0
+
+    inversions = 0
+    idx = np.arange(n)
+    for bit in range(int(a.max()).bit_length() - 1, -1, -1):
+        # Elements with the same higher bits are contiguous and keep their original order
+        prefix = a >> (bit + 1)
+        starts = np.ones(n, dtype=bool)
+        starts[1:] = prefix[1:] != prefix[:-1]
+        group = np.cumsum(starts) - 1
+        group_start = np.flatnonzero(starts)
+
+        b = (a >> bit) & 1
+        ones_before = np.cumsum(b) - b
+        ones_before = ones_before - ones_before[group_start][group]
+        zeros_before = idx - group_start[group] - ones_before
+        inversions += int(np.sum(ones_before[b == 0]))
+
+        # Stable partition of each group: elements without the bit first
+        zeros = np.add.reduceat(1 - b, group_start)[group]
+        position = group_start[group] + np.where(b == 0, zeros_before, zeros + ones_before)
+        partitioned = np.empty_like(a)
+        partitioned[position] = a
+        a = partitioned
+    return inversions
+
+
+def _pair_counts(x, y):
+    """ Count pairs of elements in two vectors.
+
+        Returns
+        -------
+            tuple
+                Total number of pairs, pairs tied in `x`, pairs tied in `y`,
+                pairs tied in both `x` and `y`, and discordant pairs.
+    """
+    n = x.shape[0]
+    order = np.lexsort((y, x))
+    x, y = x[order], y[order]
+
+    # Pairs tied in both vectors are adjacent after sorting by x and y
+    joint_starts = np.ones(n, dtype=bool)
+    joint_starts[1:] = np.logical_or(x[1:] != x[:-1], y[1:] != y[:-1])
+    counts = np.diff(np.append(np.flatnonzero(joint_starts), n))
+    joint_ties = int(np.sum(counts * (counts - 1) // 2))
+
+    # Ties in x are sorted by y, so only discordant pairs are inversions of y
+    discordant = _count_inversions(y)
+
+    return n * (n - 1) // 2, _tied_pairs(x), _tied_pairs(y), joint_ties, discordant
+
+
 @_correlation_decorator
 def spearman(x, y):
     """ Calculate Spearman correlation between two rankings vectors [#spearman1]_.
@@ -211,12 +281,9 @@ def kendall_tau(x, y):
         .. [#kendall_tau1] Kendall tau rank correlation coefficient, Wikipedia.
                Available at: https://en.wikipedia.org/wiki/Kendall_rank_correlation_coefficient
     """
-    n = len(x)
-    res = 0
-    for j in range(n):
-        for i in range(j):
-            res += np.sign(x[i] - x[j]) * np.sign(y[i] - y[j])
-    return 2/(n*(n-1)) * res
+    pairs, x_ties, y_ties, joint_ties, discordant = _pair_counts(x, y)
+    concordant = pairs - x_ties - y_ties + joint_ties - discordant
+    return np.float64(concordant - discordant) / pairs
 
 
 @_correlation_decorator
@@ -247,18 +314,12 @@ def goodman_kruskal_gamma(x, y):
         .. [#goodman_kruskal_gamma1] Goodman and Kruskal's gamma, Wikipedia.
                Available at: https://en.wikipedia.org/wiki/Goodman_and_Kruskal%27s_gamma
     """
-    num = 0
-    den = 0
-    for i, j in permutations(range(len(x)), 2):
-        x_dir = x[i] - x[j]
-        y_dir = y[i] - y[j]
-        sign = np.sign(x_dir * y_dir)
-        num += sign
-        if sign:
-            den += 1
-    if den == 0:
+    pairs, x_ties, y_ties, joint_ties, discordant = _pair_counts(x, y)
+    comparable = pairs - x_ties - y_ties + joint_ties
+    concordant = comparable - discordant
+    if comparable == 0:
         warn("Goodman's and Kruskal's Gamma is undefined when there are no comparable pairs (denominator is zero).", UserWarning)
-    return num / float(den)
+    return np.float64(concordant - discordant) / comparable
 
 
 @_correlation_decorator
@@ -316,3 +377,71 @@ def wsc2(w0, w1):
                Procedia Computer Science, 225, 4785-4794.
     """
     return 1 - (np.sum(np.abs(w0 - w1)) / 2 )
+
+
+def _pearson_matrix(R):
+    Z = R - np.mean(R, axis=1, keepdims=True)
+    cov = Z @ Z.T / R.shape[1]
+    std = np.sqrt(np.diag(cov))
+    if np.any(std == 0):
+        warn('Correlation is undefined when one of the vectors has zero variance.', UserWarning)
+    return cov / np.outer(std, std)
+
+
+def _upper_triangle_rows(R, func):
+    """ Build symmetric matrix from rows func(R[i], R[i:]) of its upper triangle. """
+    k = R.shape[0]
+    corr = np.zeros((k, k))
+    for i in range(k):
+        corr[i, i:] = func(R[i], R[i:])
+        corr[i:, i] = corr[i, i:]
+    return corr
+
+
+def _weighted_spearman_matrix(R):
+    N = R.shape[1]
+    d = N**4 + N**3 - N**2 - N
+    return _upper_triangle_rows(
+        R, lambda x, Y: 1 - 6 * np.sum((x - Y)**2 * ((N - x + 1) + (N - Y + 1)), axis=1) / d
+    )
+
+
+def _rank_similarity_coef_matrix(R):
+    N = R.shape[1]
+    corr = np.zeros((R.shape[0], R.shape[0]))
+    for i, x in enumerate(R):
+        d = np.max((np.fabs(1 - x), np.fabs(N - x)), axis=0)
+        corr[i] = 1 - np.fabs(x - R) @ (2.0**(-1.0 * x) / d)
+    return corr
+
+
+def _l1_distance_matrix(R):
+    return _upper_triangle_rows(R, lambda x, Y: np.sum(np.abs(x - Y), axis=1))
+
+
+def _wsc_matrix(R):
+    return 1 - (_l1_distance_matrix(R) / 2 * (1 - np.min(R, axis=1, keepdims=True)))
+
+
+def _wsc2_matrix(R):
+    return 1 - (_l1_distance_matrix(R) / 2)
+
+
+# Functions which compute the full correlation matrix for vectors in rows of 2d array
+_CORRELATION_MATRIX_KERNELS = {
+    spearman: _pearson_matrix,
+    rs: _pearson_matrix,
+    pearson: _pearson_matrix,
+    r: _pearson_matrix,
+    weighted_spearman: _weighted_spearman_matrix,
+    rw: _weighted_spearman_matrix,
+    rank_similarity_coef: _rank_similarity_coef_matrix,
+    ws: _rank_similarity_coef_matrix,
+    wsc: _wsc_matrix,
+    wsc2: _wsc2_matrix,
+}
+
+# Correlation functions for which f(x, y) == f(y, x)
+_SYMMETRIC_CORRELATIONS = {
+    spearman, rs, pearson, r, weighted_spearman, rw, kendall_tau, goodman_kruskal_gamma, wsc2
+}
@@ -4,6 +4,8 @@
 from functools import wraps
 import numpy as np
 
+from .correlations import _pair_counts
+
 __all__ = [
     'draWS',
     'kemeny',
@@ -38,20 +40,33 @@ def _r_to_psm(r: np.ndarray) -> np.ndarray:
     psm : ndarray
         Preference Score Matrix.
     """
-    n = len(r)
-    psm = np.zeros((n, n))
-    for i in range(n):
-        for j in range(i, n):
-            if r[i] < r[j]:
-                val = 1
-            elif r[i] > r[j]:
-                val = -1
-            else:
-                val = 0
-
-            psm[i, j] = val
-            psm[j, i] = -val
-    return psm
+    r = np.asarray(r)
+    return np.sign(r[np.newaxis, :] - r[:, np.newaxis]).astype(float)
+
+
+def _psm_differences(r1, r2):
+    """
+    Count pairs of objects on which two rankings disagree, without
+    building Preference Score Matrices.
+
+    Parameters
+    ----------
+    r1 : ndarray
+        First ranking vector in indices format.
+    r2 : ndarray
+        Second ranking vector in indices format.
+
+    Returns
+    -------
+    reversed : int
+        Number of pairs ordered oppositely in the rankings,
+        i.e. pairs for which PSM values differ by 2.
+    half_tied : int
+        Number of pairs tied in only one of the rankings,
+        i.e. pairs for which PSM values differ by 1.
+    """
+    _, r1_ties, r2_ties, joint_ties, discordant = _pair_counts(r1, r2)
+    return discordant, r1_ties + r2_ties - 2 * joint_ties
 
 
 @_distance_decorator
@@ -79,8 +94,8 @@ def draWS(x, y):
                in decision-making problems.
                In 2023 18th Conference on Computer Science and Intelligence Systems (FedCSIS) (pp. 731-738). IEEE.
     """
-    return sum(2 ** -i * int(xi != yi)
-               for i, (xi, yi) in enumerate(zip(x, y), 1)) / (1 - 2**(-len(x)))
+    w = 2.0 ** -np.arange(1, len(x) + 1)
+    return np.sum(w * (x != y)) / (1 - 2**(-len(x)))
 
 
 @_distance_decorator
@@ -107,9 +122,8 @@ def kemeny(r1, r2):
     ----------
     .. [#kemeny1] Kemeny, J. G. (1959). Mathematics without numbers. Daedalus, 88(4), 577-591.
     """
-    m1 = _r_to_psm(r1)
-    m2 = _r_to_psm(r2)
-    return 0.5 * np.sum(np.abs(m1 - m2))
+    reversed_pairs, half_tied = _psm_differences(r1, r2)
+    return float(2 * reversed_pairs + half_tied)
 
 
 @_distance_decorator
@@ -136,6 +150,5 @@ def frobenius(r1, r2):
     ----------
     .. [#frobenius1] Dezert, J., Shekhovtsov, A., & Sałabun, W. (2024). A new distance between rankings. Heliyon, 10(7).
     """
-    m1 = _r_to_psm(r1)
-    m2 = _r_to_psm(r2)
-    return np.sqrt(np.sum(np.abs(m1 - m2)**2))
+    reversed_pairs, half_tied = _psm_differences(r1, r2)
+    return np.sqrt(2 * (4 * reversed_pairs + half_tied))
@@ -5,21 +5,25 @@ from typing import Callable, Iterable
 
 import numpy as np
 
-from collections import Counter
-
 from . import normalizations
+from . import correlations
+
+# Maximum number of elements in the (dominators x candidates) arrays
+# created during the search for Pareto-dominated alternatives
+_SKYLINE_BLOCK_SIZE = 2 ** 22
 
 __all__ = [
     'rankdata',
     'rrankdata',
     'correlation_matrix',
     'normalize_matrix',
+    'pareto_dominance',
     'leave_one_out_rr',
     'param_sensitivity'
 ]
 
 
-def rankdata(a, reverse=False):
+def rankdata(a, reverse=False, axis=-1):
     """
     Assign ranks to data in vector `a`.
 
@@ -32,41 +36,65 @@ def rankdata(a, reverse=False):
     Parameters
     ----------
     a : iterable
-        The array of values to be ranked.
+        The array of values to be ranked. Could be a multidimensional
+        array, then each vector along `axis` is ranked separately.
 
     reverse : bool, optional
         If True, larger elements get first posisions in ranking.
         If False, smaller elements get first positions in ranking.
 
+    axis : int, optional
+        Axis along which the elements are ranked. Default is -1 (last axis),
+        i.e. for 2d array each row is ranked separately.
+
     Returns
     -------
     ndarray
-        An array of rank scores for the input data.
+        An array of rank scores for the input data, same shape as `a`.
 
     Examples
     --------
     >>> from pymcdm.helpers import rankdata
     >>> rankdata([0, 3, 2, 5])
-    array([1, 3, 2, 4])
+    array([1., 3., 2., 4.])
     >>> rankdata([0, 3, 2, 5], reverse=True)
-    array([4, 2, 3, 1])
+    array([4., 2., 3., 1.])
     >>> rankdata([0, 3, 2, 3])
     array([1. , 3.5, 2. , 3.5])
     >>> rankdata([0, 3, 2, 3], reverse=True)
     array([4. , 1.5, 3. , 1.5])
+    >>> rankdata([[0, 3, 2, 3], [1, 1, 2, 0]])
+    array([[1. , 3.5, 2. , 3.5],
+           [2.5, 2.5, 4. , 1. ]])
     """
-    c = Counter(a)
-    rv = {}
-    i = 1
-    for k in sorted(c.keys(), reverse=reverse):
-        if c[k] == 1:
-            rv[k] = i
-            i += 1
-        else:
-            v = c[k]
-            rv[k] = (2*i + v - 1)/2
-            i += v
-    return np.array([rv[k] for k in a], dtype='float')
+    a = np.moveaxis(np.asarray(a), axis, -1)
+    shape = a.shape
+    if a.size == 0:
+        return np.moveaxis(np.zeros(shape, dtype='float'), -1, axis)
+
+    n = shape[-1]
+    a = a.reshape(-1, n)
+
+    sorter = np.argsort(a, axis=1, kind='stable')
+    sorted_a = np.take_along_axis(a, sorter, axis=1)
+
+    # Start of each group of tied elements (first element of each row included)
+    starts = np.ones(a.shape, dtype=bool)
+    starts[:, 1:] = sorted_a[:, 1:] != sorted_a[:, :-1]
+    starts = starts.ravel()
+
+    # Average position of each group of ties, positions begin at 1
+    idx = np.flatnonzero(starts)
+    counts = np.diff(np.append(idx, starts.shape[0]))
+    average = idx % n + (counts + 1) / 2
+    sorted_ranks = average[np.cumsum(starts) - 1].reshape(a.shape)
+
+    ranks = np.empty(a.shape, dtype='float')
+    np.put_along_axis(ranks, sorter, sorted_ranks, axis=1)
+    if reverse:
+        ranks = n + 1 - ranks
+
+    return np.moveaxis(ranks.reshape(shape), -1, axis)
 
 
 def rrankdata(a):
@@ -77,6 +105,12 @@ def rrankdata(a):
 def correlation_matrix(rankings, method, columns=False):
     """ Creates a correlation matrix for given vectors from the numpy array.
 
+        For the correlation functions from `pymcdm.correlations` (e.g.
+        `spearman`, `pearson`, `weighted_spearman`, `rank_similarity_coef`,
+        `wsc` and `wsc2`) the whole matrix is computed at once with vectorized
+        kernels. Other functions are called for each pair of vectors, and for
+        symmetric ones (e.g. `kendall_tau`) only once per pair.
+
         Parameters
         ----------
             rankings : ndarray
@@ -97,17 +131,26 @@ def correlation_matrix(rankings, method, columns=False):
     rankings = np.array(rankings)
     if columns:
         rankings = rankings.T
+
+    kernel = correlations._CORRELATION_MATRIX_KERNELS.get(method)
+    if kernel is not None:
+        return kernel(rankings.astype('float'))
+
+    symmetric = method in correlations._SYMMETRIC_CORRELATIONS
     n = rankings.shape[0]
     corr = np.zeros((n, n))
     for i in range(n):
-        for j in range(n):
+        for j in range(i if symmetric else 0, n):
             corr[i, j] = method(rankings[i], rankings[j])
+            if symmetric:
+                corr[j, i] = corr[i, j]
     return corr
 
 
 def normalize_matrix(matrix: np.ndarray | list | tuple,
                      method: Callable | Iterable[Callable] | str | Iterable[str],
-                     criteria_types: None | Iterable[int]) -> np.ndarray:
+                     criteria_types: None | Iterable[int],
+                     statistics=None) -> np.ndarray:
     """ Normalize each column in `matrix`, using `method`normalization
         function according to `criteria_types`.
 
@@ -131,6 +174,13 @@ def normalize_matrix(matrix: np.ndarray | list | tuple,
                 1 if criteria is profit and -1 if criteria is cost for each criteria in `matrix`.
                 If None all criteria are considered as profit
 
+            statistics : _ColumnStatistics or None
+                Column statistics of the whole decision matrix, if `matrix`
+                is only a chunk of its rows. Then the chunk is normalized in
+                the same way as it would be normalized in the whole matrix.
+                Only functions from `pymcdm.normalizations` are supported.
+                Default is None.
+
         Returns
         -------
             ndarray
@@ -139,7 +189,14 @@ def normalize_matrix(matrix: np.ndarray | list | tuple,
         Raises
         ------
             ValueError
-                If `criteria_types` and `matrix` has different number of criteria.
+                If `criteria_types` and `matrix` has different number of criteria,
+                or if `statistics` are used with unsupported normalization function.
+
+        Notes
+        -----
+            Functions from `pymcdm.normalizations` normalize all profit and all
+            cost columns which use the same function at once. Other functions
+            are called for each column separately.
     """
     matrix = np.asarray(matrix, dtype='float')
 
@@ -170,15 +227,126 @@ def normalize_matrix(matrix: np.ndarray | list | tuple,
     elif not isinstance(method, Iterable):
         raise ValueError(f'Method type is {type(method)}, which is unsupported.')
 
-    nmatrix = matrix.astype('float')
-    for i, (crit_type, met) in enumerate(zip(criteria_types, method)):
-        if crit_type == 1:  # If profit
-            nmatrix[:, i] = met(matrix[:, i], cost=False)
+    # Group columns by normalization function
+    columns = {}
+    for i, met in enumerate(method):
+        columns.setdefault(met, []).append(i)
+
+    cost = criteria_types == -1
+    nmatrix = np.empty(matrix.shape)
+    for met, cols in columns.items():
+        if statistics is not None:
+            if met not in normalizations._STATISTICS_NORMALIZATIONS:
+                raise ValueError(f'Normalization {getattr(met, "__name__", met)} can not be computed from '
+                                 'the column statistics.')
+            cols = np.array(cols)
+            for is_cost in (False, True):
+                mask = cols[cost[cols] == is_cost]
+                if mask.size == matrix.shape[1]:
+                    return normalizations._STATISTICS_NORMALIZATIONS[met](matrix, statistics, is_cost)
+                elif mask.size > 0:
+                    nmatrix[:, mask] = normalizations._STATISTICS_NORMALIZATIONS[met](
+                        matrix[:, mask], statistics[mask], is_cost)
+        elif met in normalizations._COLUMN_NORMALIZATIONS:
+            cols = np.array(cols)
+            for is_cost in (False, True):
+                mask = cols[cost[cols] == is_cost]
+                if mask.size == matrix.shape[1]:
+                    # All columns are normalized with one call, so its result is returned as is
+                    return met(matrix, cost=is_cost)
+                elif mask.size > 0:
+                    nmatrix[:, mask] = met(matrix[:, mask], cost=is_cost)
         else:
-            nmatrix[:, i] = met(matrix[:, i], cost=True)
+            for i in cols:
+                nmatrix[:, i] = met(matrix[:, i], cost=bool(cost[i]))
     return nmatrix
 
 
+def pareto_dominance(matrix: np.ndarray | list | tuple,
+                     types: np.ndarray | list | tuple) -> np.ndarray:
+    """ Find alternatives which are Pareto-dominated by any other alternative,
+        i.e. there is an alternative which is not worse in all criteria and
+        better in at least one criterion.
+
+        The skyline (set of non-dominated alternatives) is found with the
+        sort-filter-skyline algorithm. Alternatives are sorted so that each
+        alternative can be dominated only by the preceding ones, then they are
+        compared in blocks with the skyline found so far.
+
+        Parameters
+        ----------
+            matrix : np.ndarray | list | tuple
+                Decision matrix. The rows are considered as alternatives and
+                the columns are considered as criteria.
+
+            types : np.ndarray | list | tuple
+                Criteria types. 1 if criteria is profit and -1 if criteria is
+                cost for each criteria in `matrix`.
+
+        Returns
+        -------
+            ndarray
+                Boolean vector, True for the alternatives which are dominated.
+
+        Raises
+        ------
+            ValueError
+                If `matrix` is not two-dimensional or `types` has different
+                number of criteria than `matrix`.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from pymcdm.helpers import pareto_dominance
+        >>> matrix = np.array([[1, 5], [2, 4], [1, 4], [3, 3]])
+        >>> pareto_dominance(matrix, [1, 1])
+        array([False, False,  True, False])
+    """
+    oriented = np.asarray(matrix, dtype='float')
+    types = np.asarray(types)
+    if oriented.ndim != 2:
+        raise ValueError(f'Matrix should be 2D, but it is {oriented.ndim}D.')
+    if oriented.shape[1] != len(types):
+        raise ValueError(f'Matrix has {oriented.shape[1]} criteria, types has {len(types)}. However, those values should be equal.')
+
+    oriented = oriented * types
+    # An alternative is greater than all alternatives it dominates both in
+    # the sum of the values and in the lexicographical order
+    order = np.lexsort(list(-oriented.T[::-1]) + [-oriented.sum(axis=1)])
+    oriented = oriented[order]
+
+    n = oriented.shape[0]
+    block = max(1, int(np.sqrt(_SKYLINE_BLOCK_SIZE)))
+    sorted_dominated = np.zeros(n, dtype=bool)
+    skyline = oriented[:0]
+    for start in range(0, n, block):
+        candidates = oriented[start:start + block]
+        dominated = _dominated_by(skyline, candidates)
+        rest = candidates[~dominated]
+        dominated[~dominated] = _dominated_by(rest, rest)
+        sorted_dominated[start:start + block] = dominated
+        skyline = np.vstack((skyline, candidates[~dominated]))
+
+    dominated = np.empty(n, dtype=bool)
+    dominated[order] = sorted_dominated
+    return dominated
+
+
+def _dominated_by(dominators, candidates):
+    """ Check which of the `candidates` are dominated by any of the `dominators`. """
+    dominated = np.zeros(candidates.shape[0], dtype=bool)
+    chunk = max(1, _SKYLINE_BLOCK_SIZE // max(1, candidates.shape[0]))
+    for start in range(0, dominators.shape[0], chunk):
+        d = dominators[start:start + chunk]
+        not_worse = np.ones((d.shape[0], candidates.shape[0]), dtype=bool)
+        better = np.zeros((d.shape[0], candidates.shape[0]), dtype=bool)
+        for j in range(candidates.shape[1]):
+            not_worse &= d[:, j, np.newaxis] >= candidates[:, j]
+            better |= d[:, j, np.newaxis] > candidates[:, j]
+        dominated |= np.any(not_worse & better, axis=0)
+    return dominated
+
+
 def leave_one_out_rr(method, matrix, weights, types,
                      corr_function,
                      ideal_corr_value=1,
@@ -271,17 +439,21 @@ def leave_one_out_rr(method, matrix, weights, types,
     rr_ranks = [(None, true_rank)]
     corr_values = [ideal_corr_value]
 
+    prefs = []
+    prefs1 = []
     for i in range(matrix.shape[0]):
         indices = list(range(i)) + list(range(i + 1, matrix.shape[0]))
 
         matrix1 = matrix[indices]
 
-        pref = true_pref[indices]
-        pref1 = method(matrix1, weights, types)
+        prefs.append(true_pref[indices])
+        prefs1.append(method(matrix1, weights, types))
 
-        rank = method.rank(pref)
-        rank1 = method.rank(pref1)
+    # All preference vectors have the same length, so they are ranked at once
+    ranks = method.rank(np.array(prefs))
+    ranks1 = method.rank(np.array(prefs1))
 
+    for i, (rank, rank1) in enumerate(zip(ranks, ranks1)):
         cr = corr_function(rank, rank1)
         rank1 = list(rank1)
         rank1.insert(i, 0)
@@ -365,9 +537,9 @@ def param_sensitivity(Method,
     for value in param_values:
         init_kwargs[param_name] = value
         method_instance = Method(**init_kwargs)
-        pref = method_instance(matrix, weights, types)
-        rank = method_instance.rank(pref)
-        prefs.append(pref)
-        ranks.append(rank)
+        prefs.append(method_instance(matrix, weights, types))
+
+    if prefs:
+        ranks = list(method_instance.rank(np.array(prefs)))
 
     return param_values, prefs, ranks
@@ -1,8 +1,14 @@
 # Copyright (c) 2024-2026 Andrii Shekhovtsov
+from importlib import import_module
+
 from .tabledesc import TableDesc
-from .table import Table
-from .mcda_problem import MCDA_problem
-from .mcda_results import MCDA_results
+
+# Classes which depend on pandas are imported on first access
+_LAZY_CLASSES = {
+    'Table': 'table',
+    'MCDA_problem': 'mcda_problem',
+    'MCDA_results': 'mcda_results'
+}
 
 __all__ = [
     'TableDesc',
@@ -10,3 +16,13 @@ __all__ = [
     'MCDA_problem',
     'MCDA_results'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_CLASSES:
+        return getattr(import_module(f'.{_LAZY_CLASSES[name]}', __name__), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_CLASSES))
@@ -1,5 +1,6 @@
 # Copyright (c) 2024-2026 Andrii Shekhovtsov
 from typing import List, TypeVar
+from json import dumps
 import os
 
 import numpy as np
@@ -21,6 +22,8 @@ class MCDA_results:
         The decision matrix used as input for the analysis.
     results : list of Table
         A list of `Table` objects representing the analysis results.
+    profile : list of dict, optional
+        Wall-time and peak memory allocation of the steps of the method, see `profile` attribute.
 
     Attributes
     ----------
@@ -32,16 +35,22 @@ class MCDA_results:
         The decision matrix used as input for the MCDA method.
     results : list of Table
         A list of `Table` objects representing the analysis results.
+    profile : list of dict or None
+        Measurements of the steps of the method if it was called with `profile=True`, otherwise None.
+        Each element is a dict with the 'step' name, wall-time in seconds ('time') and peak memory
+        allocated during the step in bytes ('peak_memory').
     """
 
     def __init__(self,
                  method: MCDA_method,
                  matrix: np.ndarray | list | tuple,
-                 results: List[Table]):
+                 results: List[Table],
+                 profile: List[dict] | None = None):
         self.method = method
         self.method_name = method.__class__.__name__
         self.matrix = matrix
         self.results = results
+        self.profile = profile
 
     def prepare_tables(self,
                        group_tables: bool = True,
@@ -196,8 +205,12 @@ class MCDA_results:
         -------
         dict
             Dictionary where keys are captions of the tables in `results` and values are the np.array objects.
+            If the results were profiled, the 'Profile' key contains the `profile` list.
         """
-        return {t.desc.caption: t.data for t in self.results}
+        output = {t.desc.caption: t.data for t in self.results}
+        if self.profile is not None:
+            output['Profile'] = self.profile
+        return output
 
     def to_csv(self, output_dir, **kwargs):
         """
@@ -239,10 +252,21 @@ class MCDA_results:
         - 'data' - Rows of the table (list of mixed values: string, float or int).
           First element will be row's label, other elements are data of the row.
 
+        If the results were profiled, the last object has the 'profile' label and contains
+        the name, wall-time in seconds and peak memory allocation in bytes of each step.
+
         Returns
         -------
         str
             JSON representation of the MCDA results.
         """
-        tables = self.prepare_tables(**kwargs)
-        return f'[{",".join(t.to_json() for t in tables)}]'
+        tables = [t.to_json() for t in self.prepare_tables(**kwargs)]
+        if self.profile is not None:
+            tables.append(dumps({
+                'label': 'profile',
+                'caption': 'Profile of the method steps',
+                'symbol': None,
+                'columns': ['Step', 'Time [s]', 'Peak memory [B]'],
+                'data': [[s['step'], s['time'], s['peak_memory']] for s in self.profile]
+            }))
+        return f'[{",".join(tables)}]'
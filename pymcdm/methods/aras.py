@@ -87,6 +87,34 @@ class ARAS(MCDA_method):
             self.esp = esp
 
     def _method(self, matrix, weights, types):
+        exmatrix = self._extended_matrix(matrix, types)
+        self._checkpoint()
+
+        # Every row of nmatrix is multiplayed by weights
+        nmatrix = helpers.normalize_matrix(exmatrix, self.normalization, types)
+        self._checkpoint()
+        weighted_matrix = nmatrix * weights
+        self._checkpoint()
+
+        # Values of optimality function
+        S = weighted_matrix.sum(axis=1)
+        self._checkpoint()
+
+        # Utility degree
+        K = S[1:] / S[0]
+        self._checkpoint()
+
+        return exmatrix, nmatrix, weighted_matrix, S, K
+
+    def _method_batch(self, matrix, weights, types):
+        exmatrix = self._extended_matrix(matrix, types)
+        nmatrix = helpers.normalize_matrix(exmatrix, self.normalization, types)
+
+        S = weights @ nmatrix.T
+
+        return S[:, 1:] / S[:, :1]
+
+    def _extended_matrix(self, matrix, types):
         n, m = matrix.shape
 
         # Extended initial decision matrix
@@ -102,14 +130,4 @@ class ARAS(MCDA_method):
         else:
             exmatrix[0] = self.esp
 
-        # Every row of nmatrix is multiplayed by weights
-        nmatrix = helpers.normalize_matrix(exmatrix, self.normalization, types)
-        weighted_matrix = nmatrix * weights
-
-        # Values of optimality function
-        S = weighted_matrix.sum(axis=1)
-
-        # Utility degree
-        K = S[1:] / S[0]
-
-        return exmatrix, nmatrix, weighted_matrix, S, K
+        return exmatrix
@@ -67,15 +67,22 @@ class AROMAN(MCDA_method):
         beta, lam = self.beta, self.lam
 
         lin_matrix = normalize_matrix(matrix, minmax_normalization, None)
+        self._checkpoint()
         vec_matrix = normalize_matrix(matrix, vector_normalization, None)
+        self._checkpoint()
 
         avg_matrix = (beta * lin_matrix + (1 - beta) * vec_matrix) / 2
+        self._checkpoint()
 
         weighted_matrix = avg_matrix * weights
+        self._checkpoint()
 
         Li = np.sum(weighted_matrix[:, types == -1], axis=1)
+        self._checkpoint()
         Ai = np.sum(weighted_matrix[:, types == 1], axis=1)
+        self._checkpoint()
 
         ri = Li**lam + Ai**(1 - lam)
+        self._checkpoint()
 
         return lin_matrix, vec_matrix, avg_matrix, weighted_matrix, Li, Ai, ri
\ No newline at end of file
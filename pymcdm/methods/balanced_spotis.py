@@ -78,19 +78,36 @@ class BalancedSPOTIS(SPOTIS):
         alpha = self.alpha
         bounds = self.bounds
         esp = self.esp
+        self._checkpoint()
         isp = bounds[np.arange(bounds.shape[0]), ((types + 1) // 2).astype('int')]
+        self._checkpoint()
 
         dij = matrix.astype(float)
 
         dij_esp = np.abs((dij - esp) /
                          (bounds[:, 0] - bounds[:, 1]))
+        self._checkpoint()
 
         dij_isp = np.abs((dij - isp) /
                          (bounds[:, 0] - bounds[:, 1]))
+        self._checkpoint()
 
         Di_esp = np.sum(dij_esp * weights, axis=1)
+        self._checkpoint()
         D_isp = np.sum(dij_isp * weights, axis=1)
+        self._checkpoint()
 
         P_i = (1 - alpha) * D_isp + alpha * Di_esp
+        self._checkpoint()
 
-        return esp, isp, dij_esp, dij_isp, Di_esp, D_isp, P_i
\ No newline at end of file
+        return esp, isp, dij_esp, dij_isp, Di_esp, D_isp, P_i
+
+    def _method_batch(self, matrix, weights, types):
+        alpha = self.alpha
+        bounds = self.bounds
+        isp = bounds[np.arange(bounds.shape[0]), ((types + 1) // 2).astype('int')]
+
+        dij_esp = np.abs((matrix - self.esp) / (bounds[:, 0] - bounds[:, 1]))
+        dij_isp = np.abs((matrix - isp) / (bounds[:, 0] - bounds[:, 1]))
+
+        return weights @ ((1 - alpha) * dij_isp + alpha * dij_esp).T
\ No newline at end of file
@@ -82,16 +82,23 @@ class COCOSO(MCDA_method):
     def _method(self, matrix, weights, types):
         l = self.l
         nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        self._checkpoint()
         # Vectors of S and P
         S = np.sum(nmatrix * weights, axis=1)
+        self._checkpoint()
         P = np.sum(nmatrix ** weights, axis=1)
+        self._checkpoint()
 
         # Calculate score strategies
         ksi_a = (P + S) / np.sum(P + S, axis=0)
+        self._checkpoint()
         ksi_b = S / np.min(S) + P / np.min(P)
+        self._checkpoint()
         ksi_c = (l * S + (1 - l) * P) / (l * np.max(S) + (1 - l) * np.max(P))
+        self._checkpoint()
 
         # Compute the prefomance score
         ksi = np.power(ksi_a * ksi_b * ksi_c, 1/3) + 1/3 * (ksi_a + ksi_b + ksi_c)
+        self._checkpoint()
 
         return nmatrix, S, P, ksi_a, ksi_b, ksi_c, ksi
@@ -7,11 +7,12 @@ from .. import helpers
 from .mcda_method import MCDA_method
 from ..io import TableDesc
 
+# Maximum number of elements of the relative assessment matrix held in memory at once
+_BLOCK_SIZE = 2 ** 22
+
 
 def _psi(x, tau=0.02):
-    if np.abs(x) >= tau:
-        return 1
-    return 0
+    return (np.abs(x) >= tau).astype(int)
 
 
 class CODAS(MCDA_method):
@@ -28,6 +29,12 @@ class CODAS(MCDA_method):
                 where `x` is a vector which should be normalized and `cost` is a bool variable which says if `x` is a
                 cost or profit criterion.
 
+            block_size : int or None
+                Number of alternatives (rows of the relative assessment matrix) processed at once.
+                The assessment scores are calculated block by block, so the full relative
+                assessment matrix is calculated only if `verbose=True`. If None, block size
+                is chosen automatically. Default is None.
+
         References
         ----------
         .. [#codas1] Keshavarz Ghorabaee, M., Zavadskas, E. K., Turskis, Z., & Antucheviciene, J. (2016). A new combinative
@@ -50,6 +57,7 @@ class CODAS(MCDA_method):
         >>> [round(preference, 4) for preference in body(matrix, weights, types)]
         [1.3914, 0.3411, -0.2170, -0.5381, -0.7292, -0.2481]
     """
+    _save_results = True
     _tables = [
         TableDesc(caption='Normalized decision matrix',
                   label='nmatrix', symbol='$r_{ij}$', rows='A', cols='C'),
@@ -67,28 +75,46 @@ class CODAS(MCDA_method):
                   label='pref', symbol='$H_i$', rows='A', cols=None)
     ]
 
-    def __init__(self, normalization_function=normalizations.linear_normalization):
+    def __init__(self, normalization_function=normalizations.linear_normalization, block_size=None):
         self.normalization = normalization_function
+        self.block_size = block_size
 
-    def _method(self, matrix, weights, types):
+    def _method(self, matrix, weights, types, save_results=False):
         nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        self._checkpoint()
         # Every row of nmatrix is multiplayed by weights
         weighted_matrix = nmatrix * weights
         n, m = weighted_matrix.shape
+        self._checkpoint()
 
         # Vector of NIS
         nis = np.min(weighted_matrix, axis=0)
+        self._checkpoint()
 
         # Euclidean and Taxicab distances from negative-ideal solution
         E = np.sqrt(np.sum((weighted_matrix - nis) ** 2, axis=1))
+        self._checkpoint()
         T = np.sum(np.abs(weighted_matrix - nis), axis=1)
-
-        # Construct the relative assessment matrix
-        h = np.zeros((n, n))
-        for i in range(n):
-            for j in range(n):
-                h[i, j] = (E[i] - E[j]) + (_psi(E[i] - E[j]) * (T[i] - T[j]))
-
-        H = np.sum(h, axis=1)
+        self._checkpoint()
+
+        if save_results:
+            # Construct the relative assessment matrix
+            h = self._relative_assessment(E, T, E, T)
+            self._checkpoint()
+            H = np.sum(h, axis=1)
+            self._checkpoint()
+        else:
+            h = None
+            block_size = self.block_size or max(1, _BLOCK_SIZE // n)
+            H = np.concatenate([
+                np.sum(self._relative_assessment(E[i:i + block_size], T[i:i + block_size], E, T), axis=1)
+                for i in range(0, n, block_size)
+            ])
 
         return nmatrix, weighted_matrix, nis, E, T, h, H
+
+    @staticmethod
+    def _relative_assessment(E_rows, T_rows, E, T):
+        """ Rows of the relative assessment matrix for the alternatives with distances `E_rows` and `T_rows`. """
+        E_diff = E_rows.reshape(-1, 1) - E
+        return E_diff + _psi(E_diff) * (T_rows.reshape(-1, 1) - T)
@@ -1,14 +1,17 @@
 # Copyright (c) 2020-2026 Andrii Shekhovtsov
 
 from itertools import product
-from functools import reduce
+from functools import partial
 
 import numpy as np
 
 from .mcda_method import MCDA_method
-from ..validators import cvalues_validator, matrix_cvalues_validator
+from ..validators import array_dimension_validator, cvalues_validator, matrix_cvalues_validator
 from ..io import TableDesc
 
+# Maximum number of (alternative, corner CO) pairs evaluated at once
+_EVAL_CHUNK_SIZE = 2 ** 20
+
 
 def _gray_code_product(*args):
     pools = [tuple(pool) for pool in args]
@@ -18,20 +21,220 @@ def _gray_code_product(*args):
     return result
 
 
-def _TFN(a, m, b):
-    def tfn(x):
-        res = np.zeros(x.shape)
-        mask = x == m
-        res[mask] = 1
+class CharacteristicObjects:
+    """ Space of the characteristic objects (COs) of the COMET model, in
+        which COs are computed from their indices when they are accessed,
+        so the Cartesian product of the characteristic values is never
+        stored as a whole.
+
+        Index of the CO is a mixed-radix number, where the digits are
+        indices of the characteristic values of the criteria. In the Gray
+        code ordering values of the criterion are reversed when the prefix
+        of the CO has odd index, same as in `_gray_code_product`.
+
+        Parameters
+        ----------
+            cvalues : ndarray or list of lists
+                Each row represent characteristic values for each criteria.
+
+            gray_code : bool, optional
+                If True, COs are enumerated in the Gray code ordering,
+                otherwise in the Cartesian product ordering. Default is False.
+
+        Examples
+        --------
+        >>> space = CharacteristicObjects([[0, 1, 2], [10, 20]])
+        >>> len(space)
+        6
+        >>> space[3]
+        array([ 1, 20])
+        >>> space.index([1, 20])
+        3
+        >>> [chunk.tolist() for chunk in space.chunks(4)]
+        [[[0, 10], [0, 20], [1, 10], [1, 20]], [[2, 10], [2, 20]]]
+    """
+    def __init__(self, cvalues, gray_code=False):
+        self.cvalues = [np.asarray(cv) for cv in cvalues]
+        self.gray_code = gray_code
+        self.dtype = np.result_type(*self.cvalues)
+        self._radices = np.array([cv.shape[0] for cv in self.cvalues], dtype=np.int64)
+        # Number of COs between consecutive values of each criterion
+        self._strides = np.ones(len(self.cvalues), dtype=np.int64)
+        self._strides[:-1] = np.cumprod(self._radices[:0:-1])[::-1]
+        self._length = int(np.prod(self._radices))
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def shape(self):
+        return self._length, len(self.cvalues)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._objects(np.arange(*key.indices(self._length), dtype=np.int64))
+
+        indices = np.asarray(key)
+        if indices.dtype.kind not in 'iu':
+            raise IndexError('Characteristic objects can be indexed only with integers or slices.')
+        indices = np.where(indices < 0, indices + self._length, indices).astype(np.int64)
+        if np.any((indices < 0) | (indices >= self._length)):
+            raise IndexError(f'Index out of range for {self._length} characteristic objects.')
+        if indices.ndim == 0:
+            return self._objects(indices[None])[0]
+        return self._objects(indices.ravel()).reshape(*indices.shape, -1)
+
+    def __array__(self, dtype=None, copy=None):
+        co = self[:]
+        return co if dtype is None else co.astype(dtype)
+
+    def _objects(self, indices):
+        digits = (indices[:, None] // self._strides) % self._radices
+        if self.gray_code:
+            prefixes = indices[:, None] // (self._strides * self._radices)
+            digits = np.where(prefixes % 2 == 1, self._radices - 1 - digits, digits)
+
+        co = np.empty((indices.shape[0], len(self.cvalues)), dtype=self.dtype)
+        for j, cv in enumerate(self.cvalues):
+            co[:, j] = cv[digits[:, j]]
+        return co
+
+    def index(self, co):
+        """ Return indices of the characteristic objects.
+
+            Parameters
+            ----------
+                co : ndarray
+                    Characteristic object (vector) or objects in rows.
+
+            Returns
+            -------
+                int or ndarray
+                    Index of the characteristic object or vector of indices.
+
+            Raises
+            ------
+                ValueError
+                    If a value of the object is not a characteristic value
+                    of the criterion.
+        """
+        co = np.asarray(co)
+        single = co.ndim == 1
+        co = np.atleast_2d(co)
+        if co.shape[1] != len(self.cvalues):
+            raise ValueError(f'Characteristic objects should have {len(self.cvalues)} values, '
+                             f'but they have {co.shape[1]}.')
+
+        positions = np.zeros(co.shape[0], dtype=np.int64)
+        for values, cv, k in zip(co.T, self.cvalues, self._radices):
+            digits = np.clip(np.searchsorted(cv, values), 0, k - 1)
+            if np.any(cv[digits] != values):
+                raise ValueError('Values of the characteristic objects should be characteristic values.')
+            if self.gray_code:
+                digits = np.where(positions % 2 == 1, k - 1 - digits, digits)
+            positions = positions * k + digits
+        return int(positions[0]) if single else positions
+
+    def chunks(self, size=None):
+        """ Iterate over the characteristic objects in chunks.
+
+            Parameters
+            ----------
+                size : int or None, optional
+                    Number of COs in each chunk. If None, chunks have about
+                    1 million elements. Default is None.
+
+            Returns
+            -------
+                Iterator[ndarray]
+                    Matrices with consecutive COs in rows.
+        """
+        if size is None:
+            size = max(1, _EVAL_CHUNK_SIZE // len(self.cvalues))
+        elif size < 1:
+            raise ValueError(f'size should be positive, but its value is {size}.')
+        for start in range(0, self._length, size):
+            yield self[start:start + size]
+
+
+def _tfn_memberships(values, cv):
+    """ Memberships of `values` to the triangular fuzzy numbers (TFNs) of
+        sorted characteristic values `cv`.
+
+        TFNs form a partition of unity, so each value in the domain belongs
+        only to the TFNs of two characteristic values, which bound the
+        interval containing it. Returns index of this interval `cell` and
+        memberships to the TFNs of `cv[cell]` (`left`) and `cv[cell + 1]`
+        (`right`). Values outside of the domain have both memberships equal
+        to zero.
+    """
+    k = cv.shape[0]
+    cell = np.clip(np.searchsorted(cv, values, side='right') - 1, 0, k - 2)
+    a, b = cv[cell], cv[cell + 1]
+
+    inside = np.logical_and(cv[0] <= values, values <= cv[-1])
+    left = np.where(inside, (b - values) / (b - a), 0)
+    right = np.where(inside, (values - a) / (b - a), 0)
+    return cell, left, right
 
-        mask = np.logical_and(x > a, x < m)
-        res[mask] = (x[mask] - a) / (m - a)
 
-        mask = np.logical_and(x < b, x > m)
-        res[mask] = (b - x[mask]) / (b - m)
-        return res
+def _tfn_membership_matrix(values, cv):
+    """ Memberships of `values` to all TFNs of `cv`, as an (n, k) matrix. """
+    values = np.asarray(values, dtype='float')
+    cell, left, right = _tfn_memberships(values, cv)
+    mu = np.zeros((values.shape[0], cv.shape[0]))
+    rows = np.arange(values.shape[0])
+    mu[rows, cell] = left
+    mu[rows, cell + 1] = right
+    return mu
 
-    return tfn
+
+def _tfn_membership(x, cv, index):
+    """ Membership of `x` to the TFN of the characteristic value `cv[index]`. """
+    x = np.asarray(x, dtype='float')
+    return _tfn_membership_matrix(x.ravel(), cv)[:, index].reshape(x.shape)
+
+
+def _mej_values(pi, pj):
+    """ MEJ values for the COs with preferences `pi` and `pj`. """
+    return np.greater(pi, pj) + np.equal(pi, pj) / 2
+
+
+class _MEJView:
+    """ MEJ matrix of the COs with preferences `p`, which values are
+        computed only for the requested elements, rows or blocks.
+
+        Indexing with two integer arrays selects elements pointwise, as
+        for ndarray. If any of the indices is a slice, the block of the
+        selected rows and columns is returned.
+    """
+    ndim = 2
+    dtype = np.dtype('float')
+
+    def __init__(self, p):
+        self.p = np.asarray(p)
+        self.shape = (self.p.shape[0], self.p.shape[0])
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        rows, cols = key
+        pi, pj = self.p[rows], self.p[cols]
+        if (isinstance(rows, slice) or isinstance(cols, slice)) and np.ndim(pi) and np.ndim(pj):
+            pi = pi[:, None]
+        return _mej_values(pi, pj)
+
+    def __array__(self, dtype=None, copy=None):
+        k = self.shape[0]
+        # Rows are computed in chunks to bound memory of the temporary arrays
+        chunk = max(1, _EVAL_CHUNK_SIZE // max(1, k))
+        mej = np.empty(self.shape, dtype=dtype or self.dtype)
+        for start in range(0, k, chunk):
+            mej[start:start + chunk] = self[start:start + chunk]
+        return mej
 
 
 class COMET(MCDA_method):
@@ -60,6 +263,11 @@ class COMET(MCDA_method):
                in the pymcdm.comet_tools submodule if you want to create your
                own custom expert_function.
 
+               If the expert function has attribute `_lazy_co` set to True,
+               `CharacteristicObjects` space is passed instead of the matrix,
+               so COs could be evaluated in chunks without storing all of
+               them.
+
            co_ordering : {'product', 'gray_code'}, optional
                Ordering used to enumerate characteristic objects (COs). If
                `'product'` (default), COs are generated using the Cartesian
@@ -102,6 +310,7 @@ class COMET(MCDA_method):
         >>> [round(preference, 4) for preference in body(matrix)]
         [0.5433, 0.3447, 0.6115, 0.6168, 0.6060, 0.4842, 0.5516, 0.6100, 0.5719, 0.4711, 0.4979, 0.1452]
     """
+    _streamable = True
     _tables = [
         TableDesc(caption='Final preference value',
                   label='pref', symbol='$P_i$', rows='A', cols=None)
@@ -111,38 +320,61 @@ class COMET(MCDA_method):
         cvalues_validator(cvalues)
         if co_ordering not in ('product', 'gray_code'):
             raise ValueError("co_ordering must be either 'product' or 'gray_code'")
-        self.co_ordering = product if co_ordering == 'product' else _gray_code_product
 
-        co = self.co_ordering(*cvalues)
-        co = np.array(list(co))
+        space = CharacteristicObjects(cvalues, gray_code=co_ordering == 'gray_code')
+        n_co = len(space)
+
+        # Expert functions which support it get the COs computed on demand
+        co = space if getattr(expert_function, '_lazy_co', False) else np.asarray(space)
 
         # Determine how MEJ and SJ is calculated
         sj, mej = expert_function(co)
-        self.mej = mej
-        if sj.shape[0] != co.shape[0] or (mej is not None and not mej.shape[0] == mej.shape[1] == co.shape[0]):
+        if sj.shape[0] != n_co or (mej is not None and not mej.shape[0] == mej.shape[1] == n_co):
             raise ValueError(
                     'Expert function must returns vector with same length as number of characteristic objects. '
                     'And the None or MEJ matrix which is square matrix with same size as length of characteristic '
                     'objects.'
-                    f'Expected length: {co.shape[0]}, but returned vector has length {sj.shape[0]}. '
-                    f'Expected MEJ shape {(co.shape[0], co.shape[0])}, but returned matrix has shape {mej.shape}.'
+                    f'Expected length: {n_co}, but returned vector has length {sj.shape[0]}. '
+                    f'Expected MEJ shape {(n_co, n_co)}, but returned matrix has shape '
+                    f'{None if mej is None else mej.shape}.'
                     )
 
-        uniq, idx, counts = np.unique(sj, return_counts=True, return_inverse=True)
+        uniq, idx = np.unique(sj, return_inverse=True)
         k = uniq.shape[0]
         p = (np.arange(k) / (k - 1))[idx]
 
+        self._from_identified(cvalues, space, p, mej, expert_function)
+
+    def _from_identified(self, cvalues, space, p, mej, expert_function=None):
+        """ Set up the model from the identified preferences `p` of the
+            characteristic objects of the `space` (shared by `__init__` and
+            `load`).
+        """
         self.criterion_number = len(cvalues)
         self.cvalues = cvalues
+        self._gray_code = space.gray_code
+        self.co_ordering = _gray_code_product if space.gray_code else product
         self.expert_function = expert_function
+        self.mej = mej
         self.p = p
-        self.tfns = [COMET._make_tfns(chv) for chv in cvalues]
-        
+        self.co_space = space
+        self._cvalues = [np.asarray(cv, dtype='float') for cv in cvalues]
+
+    @property
+    def tfns(self):
+        """ Membership functions of the triangular fuzzy numbers of the
+            characteristic values: list of functions `mu(x)` for each
+            criterion.
+        """
+        return [[partial(_tfn_membership, cv=cv, index=i) for i in range(cv.shape[0])]
+                for cv in self._cvalues]
+
     def __call__(self, matrix,
                  weights=None,
                  types=None,
                  validation=True,
-                 verbose=False):
+                 verbose=False,
+                 profile=False):
         """Rank alternatives from decision matrix `matrix`.
 
             Parameters
@@ -166,66 +398,166 @@ class COMET(MCDA_method):
                     Explain the MCDA, i.e. provide matrices and vectors from
                     all the steps of the method, instead of return just the
                     preference vector. Default is False.
+
+                profile : bool
+                    Measure wall-time and peak memory allocation of the
+                    validation and of each step of the method. Implies
+                    `verbose`, the measurements are stored in the `profile`
+                    attribute of the returned MCDA_results. Profiling slows
+                    the evaluation down. Default is False.
         """
         matrix = np.asarray(matrix, dtype='float')
+        return self._evaluate(matrix, weights, types, validation, verbose, profile)
 
-        if validation:
-            self._additional_validation(matrix, weights, types)
+    def _validate(self, matrix, weights, types):
+        self._additional_validation(matrix, weights, types)
 
-        if verbose:
-            return self._method_explained(matrix, weights, types)
-        else:
-            return self._method(matrix, weights, types)[-1]
+    def _validate_chunk(self, matrix, weights, types):
+        array_dimension_validator(matrix, 2, 'Matrix')
+        self._additional_validation(matrix, weights, types)
 
     def _method(self, matrix, weights, types):
-        tfns = self.tfns
-
-        pref_level_vectors = [[tfn(values) for tfn in tfns_icrit]
-                              for values, tfns_icrit in zip(matrix.T, tfns)]
-
-        tfns_values_product = self.co_ordering(*pref_level_vectors)
-        multiplayed_co = (reduce(lambda a, b: a * b, co_values) * p
-                          for p, co_values in zip(self.p, tfns_values_product))
-        return sum(multiplayed_co),
+        # Each alternative activates at most 2^m COs, i.e. the corners of the
+        # cell in which it lies, so only those COs are combined. Rows are
+        # processed in chunks to bound memory used by the n x 2^m arrays.
+        n_corners = 2 ** self.criterion_number
+        chunk = max(1, _EVAL_CHUNK_SIZE // n_corners)
+        pref = np.empty(matrix.shape[0])
+        for start in range(0, matrix.shape[0], chunk):
+            pref[start:start + chunk] = self._evaluate_cells(matrix[start:start + chunk])
+        self._checkpoint()
+        return pref,
+
+    def _evaluate_cells(self, matrix):
+        n = matrix.shape[0]
+        positions = np.zeros((n, 1), dtype=np.int64)
+        mu = np.ones((n, 1))
+        for values, cv in zip(matrix.T, self._cvalues):
+            k = cv.shape[0]
+            cell, left, right = _tfn_memberships(values, cv)
+
+            # Position of the CO in the co_ordering, extended by one criterion
+            digits = np.stack((cell, cell + 1), axis=1)[:, None, :]
+            positions = positions[:, :, None]
+            if self._gray_code:
+                # In the gray code ordering odd prefixes are followed by the reversed pool
+                digits = np.where(positions % 2 == 1, k - 1 - digits, digits)
+            positions = (positions * k + digits).reshape(n, -1)
+            mu = (mu[:, :, None] * np.stack((left, right), axis=1)[:, None, :]).reshape(n, -1)
+
+        return np.sum(mu * self.p[positions], axis=1)
 
     def _additional_validation(self, matrix, weights, types):
         matrix_cvalues_validator(matrix, self.cvalues)
 
-    def get_MEJ(self):
-        """ Return the Matrix Expert Judgment (MEJ) generated from the feature object comparisons. """
+    def get_MEJ(self, lazy: bool = False):
+        """ Return the Matrix Expert Judgment (MEJ) generated from the feature object comparisons.
+
+            Parameters
+            ----------
+                lazy : bool, optional
+                    If True and the MEJ was not returned by the expert
+                    function, a view which computes the requested elements,
+                    rows and blocks of the MEJ from the preferences of the
+                    COs is returned, so the k x k matrix is not allocated.
+                    Such view is not stored in the model. Default is False.
+
+            Returns
+            -------
+                ndarray or MEJ view
+                    MEJ matrix, where element (i, j) is 1 if i-th CO is
+                    preferred over j-th CO, 0.5 if they are equally preferred
+                    and 0 otherwise.
+        """
         if self.mej is not None:
             return self.mej
 
-        p = self.p
-        lenp = len(p)
-        mej = np.diag(np.ones(lenp) / 2)
-        for i in range(lenp):
-            for j in range(i + 1, lenp):
-                if p[i] < p[j]:
-                    mej[i, j] = 0.0
-                    mej[j, i] = 1.0
-                elif p[i] == p[j]:
-                    mej[i, j] = 0.5
-                    mej[j, i] = 0.5
-                else:
-                    mej[i, j] = 1.0
-                    mej[j, i] = 0.0
-        self.mej = mej
-        return mej
+        view = _MEJView(self.p)
+        if lazy:
+            return view
+        self.mej = np.asarray(view)
+        return self.mej
 
-    @staticmethod
-    def _make_tfns(chv):
-        tfns = []
-        # First TFN
-        tfns.append(_TFN(chv[0], chv[0], chv[1]))
+    def save(self, path, mej: bool = True):
+        """ Save the identified COMET model (characteristic values, preferences
+            of the characteristic objects and optionally the MEJ) to the NumPy
+            `.npz` file, so it could be loaded with `COMET.load` without
+            running the expert function again.
+
+            Parameters
+            ----------
+                path : str or file-like
+                    File where the model will be saved. The `.npz` extension is
+                    appended to the file name if it is not already there.
+
+                mej : bool, optional
+                    Whether the MEJ matrix should be saved, if it is available.
+                    MEJ which contains only values 0, 0.5 and 1 is bit-packed
+                    (2 bits per element). Default is True.
 
-        for i in range(1, len(chv) - 1):
-            tfns.append(_TFN(chv[i - 1], chv[i], chv[i + 1]))
+            Examples
+            --------
+            >>> comet.save('model.npz')
+            >>> comet = COMET.load('model.npz')
+        """
+        cvalues = [np.asarray(cv) for cv in self.cvalues]
+        data = dict(
+            cvalues=np.concatenate(cvalues),
+            cvalues_lengths=np.array([len(cv) for cv in cvalues]),
+            cvalues_dtypes=np.array([cv.dtype.str for cv in cvalues]),
+            cvalues_matrix=np.array(isinstance(self.cvalues, np.ndarray) and self.cvalues.dtype != object),
+            gray_code=np.array(self._gray_code),
+            p=self.p,
+        )
+        if mej and self.mej is not None:
+            m = np.asarray(self.mej)
+            ones, halves = m == 1, m == 0.5
+            if np.all(ones | halves | (m == 0)):
+                data.update(mej_shape=np.array(m.shape),
+                            mej_ones=np.packbits(ones),
+                            mej_halves=np.packbits(halves))
+            else:
+                data.update(mej=m)
+        np.savez(path, **data)
+
+    @classmethod
+    def load(cls, path):
+        """ Load the COMET model saved with `COMET.save`.
+
+            The loaded model evaluates alternatives in the same way as the
+            saved one, however its `expert_function` is None.
 
-        # Last TFN
-        tfns.append(_TFN(chv[-2], chv[-1], chv[-1]))
+            Parameters
+            ----------
+                path : str or file-like
+                    File with the saved model.
 
-        return tfns
+            Returns
+            -------
+                COMET
+                    The loaded model.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            cvalues = np.split(data['cvalues'], np.cumsum(data['cvalues_lengths'])[:-1])
+            if 'cvalues_dtypes' in data:
+                cvalues = [cv.astype(dtype) for cv, dtype in zip(cvalues, data['cvalues_dtypes'])]
+            if data['cvalues_matrix']:
+                cvalues = np.array(cvalues)
+
+            mej = None
+            if 'mej' in data:
+                mej = data['mej']
+            elif 'mej_shape' in data:
+                shape = tuple(data['mej_shape'])
+                size = int(np.prod(shape))
+                ones = np.unpackbits(data['mej_ones'], count=size).reshape(shape)
+                halves = np.unpackbits(data['mej_halves'], count=size).reshape(shape)
+                mej = ones + halves / 2
+
+            comet = cls.__new__(cls)
+            space = CharacteristicObjects(cvalues, gray_code=bool(data['gray_code']))
+            comet._from_identified(cvalues, space, data['p'], mej)
+        return comet
 
     @staticmethod
     def make_cvalues(matrix, numbers_of_cvalues=3):
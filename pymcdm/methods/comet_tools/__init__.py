@@ -7,6 +7,7 @@ from .triads_consistency import triads_consistency
 from .structural_comet import Submodel, StructuralCOMET
 from .esp_expert import ESPExpert
 from .local_weights import get_local_weights
+from ..comet import CharacteristicObjects
 
 __all__ = [
         'MethodExpert',
@@ -18,5 +19,6 @@ __all__ = [
         'get_local_weights',
         'Submodel',
         'StructuralCOMET',
-        'ESPExpert'
+        'ESPExpert',
+        'CharacteristicObjects'
         ]
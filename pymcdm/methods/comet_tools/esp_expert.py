@@ -52,6 +52,13 @@ class ESPExpert:
                 such criterion: [0, 1, 3, 5, 10] (the psi part of the
                 distance between all domain is substracted and added).
 
+            mej : bool
+                If True, the MEJ matrix is created, which requires memory
+                quadratic in the number of characteristic objects. Otherwise
+                SJ vector is computed by sorting the distances and the MEJ
+                is not returned (`COMET.get_MEJ` computes it from the
+                preferences of the COs when needed). Default is False.
+
         Examples
         --------
             >>> import numpy as np
@@ -76,6 +83,7 @@ class ESPExpert:
             >>> plt.tight_layout()
             >>> plt.show()
     """
+    _lazy_co = True
 
     def __init__(self,
                  esps,
@@ -84,7 +92,8 @@ class ESPExpert:
                  distance_function=None,
                  distance_aggregation=np.min,
                  cvalues_psi=None,
-                 full_domain_psi=False
+                 full_domain_psi=False,
+                 mej=False
                  ):
         self.esps = esps
         self.bounds = bounds
@@ -98,6 +107,7 @@ class ESPExpert:
         self.distance_aggregation = distance_aggregation
         self.psi = cvalues_psi
         self.full_domain_psi = full_domain_psi
+        self.mej = mej
         self._validate_input()
 
     def _validate_input(self):
@@ -140,17 +150,34 @@ class ESPExpert:
 
             Parameters
             ----------
-            co : np.array
-                Characteristic objects which should be compared.
+            co : np.array or CharacteristicObjects
+                Characteristic objects which should be compared. COs from the
+                `CharacteristicObjects` space are evaluated in chunks.
 
             Returns
             -------
                 sj : np.array
                     SJ vector (see the COMET procedure for more info).
 
-                mej : np.array
-                    Identified MEJ matrix.
+                mej : np.array or None
+                    Identified MEJ matrix, or None if it was not requested.
         """
+        chunks = [co] if isinstance(co, np.ndarray) else co.chunks()
+        distances = np.concatenate([self._distances(chunk) for chunk in chunks])
+
+        if not self.mej:
+            return self._call_sorted(distances)
+
+        try:
+            result = self._call_mej(distances)
+        except MemoryError:
+            warnings.warn('Optimized version is used,'
+                          ' MEJ will be not created.')
+            result = self._call_sorted(distances)
+
+        return result
+
+    def _distances(self, co):
         co = self._normalize(co)
         nesps = self._normalize(self.esps)
 
@@ -161,16 +188,7 @@ class ESPExpert:
         distances = []
         for nesp in nesps:
             distances.append(distance_function(co, nesp))
-        distances = self.distance_aggregation(distances, axis=0)
-
-        try:
-            result = self._call_mej(distances)
-        except MemoryError:
-            warnings.warn('Optimized version is used,'
-                          ' MEJ will be not created.')
-            result = self._call_optimized(distances)
-
-        return result
+        return self.distance_aggregation(distances, axis=0)
 
     def _call_mej(self, distances):
         mej = np.zeros((distances.shape[0], distances.shape[0]),
@@ -181,17 +199,18 @@ class ESPExpert:
         mej[~mask_better] = 0
         mej[mask_ties] = 0.5
 
-        return mej.sum(axis=1).astype(np.float32), mej
+        return self._call_sorted(distances)[0], mej
 
-    def _call_optimized(self, distances):
-        sj = np.zeros(distances.shape[0], dtype=np.float16)
-        for dist_i in distances:
-            mask_better = distances < dist_i
-            mask_ties = distances == dist_i
-            sj[mask_better] += 1
-            sj[mask_ties] += 0.5
-
-        return sj.astype(np.float32), None
+    @staticmethod
+    def _call_sorted(distances):
+        # SJ is the number of COs with larger distance, plus half of the COs
+        # with the same distance (including the CO itself)
+        sorted_distances = np.sort(distances)
+        left = np.searchsorted(sorted_distances, distances, side='left')
+        right = np.searchsorted(sorted_distances, distances, side='right')
+        sj = (distances.shape[0] - right) + (right - left) / 2
+
+        return sj, None
 
     def make_cvalues_psi(self):
         """ Generate the characteristic values array based on provided
@@ -2,7 +2,6 @@
 
 import os
 import numpy as np
-from tabulate import tabulate
 
 class ManualExpert:
     """ Create object of the ManualExpert expert function which allows to 
@@ -193,6 +192,8 @@ class ManualExpert:
         return ''.join(letters[::-1])
 
     def _show_mej(self, mej):
+        from tabulate import tabulate
+
         mapper = {-1: '', 0.5: '1/2', 1.0: 1, 0.0: 0}
         table = [[self.co_names[i]] + [mapper[v] for v in mej[i]]
                   for i in range(mej.shape[0])]
@@ -200,6 +201,8 @@ class ManualExpert:
         print(table)
 
     def _show_co(self, characteristic_objects, co_names):
+        from tabulate import tabulate
+
         table = tabulate(
                 [
                     [n, *co]
@@ -1,5 +1,8 @@
 # Copyright (c) 2023-2026 Andrii Shekhovtsov
 
+import numpy as np
+
+
 class MethodExpert:
     """ Create an object which will rate characteristic objects with any MCDA method.
 
@@ -29,6 +32,8 @@ class MethodExpert:
         >>> expert_function = MethodExpert(TOPSIS(), weights, types)
         >>> comet = COMET(cvalues, expert_function)
     """
+    _lazy_co = True
+
     def __init__(self, method, weights, types):
         self.method = method
         self.weights = weights
@@ -39,8 +44,11 @@ class MethodExpert:
 
             Parameters
             ----------
-            co : np.array
-                Characteristic objects which should be compared.
+            co : np.array or CharacteristicObjects
+                Characteristic objects which should be compared. If the
+                method evaluates each alternative independently (see
+                `MCDA_method.score_stream`), COs from the
+                `CharacteristicObjects` space are evaluated in chunks.
 
             Returns
             -------
@@ -51,6 +59,10 @@ class MethodExpert:
                     Because of how this method works MEJ matrix is not
                     generated.
         """
-        p = self.method(co, self.weights, self.types, validation=False)
+        if isinstance(co, np.ndarray) or not getattr(self.method, '_streamable', False):
+            p = self.method(np.asarray(co), self.weights, self.types, validation=False)
+        else:
+            p = np.concatenate(list(self.method.score_stream(co.chunks(), self.weights, self.types,
+                                                             validation=False)))
         r = self.method.rank(p)
         return r.shape[0] - r, None
@@ -4,7 +4,7 @@ import numpy as np
 
 from ..comet import COMET
 from ..mcda_method import MCDA_method
-from ...io import TableDesc,  Table, MCDA_results
+from ...io import TableDesc
 
 
 class Submodel:
@@ -174,6 +174,8 @@ class StructuralCOMET(MCDA_method):
         if not verbose:
             return results[self._final_submodel_struct]
 
+        from ...io import MCDA_results
+
         return MCDA_results(
             method=self,
             matrix=matrix,
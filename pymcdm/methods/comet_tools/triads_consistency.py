@@ -1,9 +1,8 @@
 # Copyright (c) 2023-2026 Andrii Shekhovtsov
 
-from itertools import combinations
-from math import factorial
+from math import comb
 
-from ..comet import COMET
+from ..comet import COMET, _EVAL_CHUNK_SIZE
 
 import numpy as np
 
@@ -46,6 +45,19 @@ T_strong_inc_rules = (
     (0.0, 0.0, 1.0),
     )
 
+
+def _codes(x):
+    """ Codes 0, 1 and 2 of the MEJ values 0, 0.5 and 1, and 3 for other values. """
+    x = np.asarray(x) * 2
+    return np.where((x == 0) | (x == 1) | (x == 2), x, 3).astype(np.int8)
+
+
+# Inconsistent triads, indexed with 16 * code(i, j) + 4 * code(j, k) + code(i, k)
+_INCONSISTENT = np.zeros(64, dtype=bool)
+for _rule in T_weak_inc_rules + T_strong_inc_rules:
+    _INCONSISTENT[np.dot(_codes(_rule), [16, 4, 1])] = True
+
+
 def triads_consistency(comet_or_mej):
     """ MEJ consistency coefficient based on inconsistence triads [#triads1]_.
 
@@ -53,6 +65,8 @@ def triads_consistency(comet_or_mej):
         ----------
             comet_or_mej : COMET or np.array
                 Either identified COMET method object or MEJ matrix from it.
+                For the COMET object the MEJ is computed block by block if it
+                was not returned by the expert function.
 
         Returns
         -------
@@ -78,7 +92,7 @@ def triads_consistency(comet_or_mej):
         0.75
     """
     if isinstance(comet_or_mej, COMET):
-        mej = comet_or_mej.get_MEJ()
+        mej = comet_or_mej.get_MEJ(lazy=True)
     else:
         mej = comet_or_mej
 
@@ -86,11 +100,16 @@ def triads_consistency(comet_or_mej):
     if n < 3:
         return 1
 
-    T = factorial(n) / (factorial(n - 3) * factorial(3))
+    # Triads (i, j, k), i < j < k, are counted for each middle CO j, with
+    # blocks of rows i bounded to keep the memory usage low
+    T = comb(n, 3)
     T_inc = 0
-    for i, j, k in combinations(range(n), 3):
-        for cond1, cond2, concl in T_weak_inc_rules + T_strong_inc_rules:
-            if mej[i, j] == cond1 and mej[j, k] == cond2 and mej[i, k] == concl:
-                T_inc += 1
+    for j in range(1, n - 1):
+        ij = _codes(mej[:j, j]).astype(np.intp)
+        jk = _codes(mej[j, j + 1:]).astype(np.intp)
+        chunk = max(1, _EVAL_CHUNK_SIZE // (n - j - 1))
+        for start in range(0, j, chunk):
+            ik = _codes(mej[start:min(start + chunk, j), j + 1:])
+            T_inc += int(np.count_nonzero(_INCONSISTENT[16 * ij[start:start + chunk, None] + 4 * jk + ik]))
 
     return 1 - (T_inc / T)
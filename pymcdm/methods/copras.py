@@ -54,19 +54,42 @@ class COPRAS(MCDA_method):
     ]
 
     def _method(self, matrix, weights, types):
-        if np.all(types == 1.0):
-            raise ValueError('types array contains only profit criteria.'
-                             ' COPRAS method requires at least one cost'
-                             ' criterion.')
-
-        nmatrix = matrix / np.sum(matrix, axis=0)
+        nmatrix = self._normalize(matrix, types)
+        self._checkpoint()
 
         # Weighted normalized decision-making matrix
         wmatrix = nmatrix * weights
+        self._checkpoint()
 
-        Sp = np.sum(wmatrix[:, types == 1], axis=1)
         Sm = np.sum(wmatrix[:, types == -1], axis=1)
+        self._checkpoint()
+        Sp = np.sum(wmatrix[:, types == 1], axis=1)
+        self._checkpoint()
 
         Q = Sp + ((np.min(Sm) * Sm) / (Sm * (np.min(Sm) / Sm)))
+        self._checkpoint()
+
+        U = Q / np.max(Q)
+        self._checkpoint()
+
+        return nmatrix, wmatrix, Sm, Sp, Q, U
+
+    def _method_batch(self, matrix, weights, types):
+        nmatrix = self._normalize(matrix, types)
+
+        Sp = weights[:, types == 1] @ nmatrix[:, types == 1].T
+        Sm = weights[:, types == -1] @ nmatrix[:, types == -1].T
+
+        Sm_min = np.min(Sm, axis=1, keepdims=True)
+        Q = Sp + ((Sm_min * Sm) / (Sm * (Sm_min / Sm)))
+
+        return Q / np.max(Q, axis=1, keepdims=True)
+
+    @staticmethod
+    def _normalize(matrix, types):
+        if np.all(types == 1.0):
+            raise ValueError('types array contains only profit criteria.'
+                             ' COPRAS method requires at least one cost'
+                             ' criterion.')
 
-        return nmatrix, wmatrix, Sm, Sp, Q, Q / np.max(Q)
+        return matrix / np.sum(matrix, axis=0)
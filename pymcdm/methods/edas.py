@@ -2,6 +2,7 @@
 # Copyright (c) 2024-2026 Andrii Shekhovtsov
 
 import numpy as np
+from .. import normalizations
 from .mcda_method import MCDA_method
 from ..io import TableDesc
 
@@ -55,8 +56,39 @@ class EDAS(MCDA_method):
     ]
 
     def _method(self, matrix, weights, types):
+        amatrix, pda, nda = self._distances(matrix, types)
+
+        sp = np.sum(weights * pda, axis=1)
+        self._checkpoint()
+        sn = np.sum(weights * nda, axis=1)
+        self._checkpoint()
+
+        nsp = sp / np.max(sp, axis=0)
+        self._checkpoint()
+        nsn = 1 - sn / np.max(sn, axis=0)
+        self._checkpoint()
+
+        score = (nsp + nsn) / 2
+        self._checkpoint()
+
+        return amatrix, pda, nda, sp, sn, nsp, nsn, score
+
+    def _method_batch(self, matrix, weights, types):
+        _, pda, nda = self._distances(matrix, types)
+
+        sp = weights @ pda.T
+        sn = weights @ nda.T
+
+        nsp = sp / np.max(sp, axis=1, keepdims=True)
+        nsn = 1 - sn / np.max(sn, axis=1, keepdims=True)
+
+        return (nsp + nsn) / 2
+
+    def _distances(self, matrix, types, amatrix=None):
         _, m = matrix.shape
-        amatrix = np.mean(matrix, axis=0)
+        if amatrix is None:
+            amatrix = np.mean(matrix, axis=0)
+        self._checkpoint()
 
         pda = np.zeros(matrix.shape)
         nda = np.zeros(matrix.shape)
@@ -71,14 +103,26 @@ class EDAS(MCDA_method):
                 nda[:, j] = (amatrix[j] - matrix[:, j]) / amatrix[j]
 
         pda = np.where(pda >= 0, pda, 0)
+        self._checkpoint()
         nda = np.where(nda >= 0, nda, 0)
+        self._checkpoint()
 
-        sp = np.sum(weights * pda, axis=1)
-        sn = np.sum(weights * nda, axis=1)
+        return amatrix, pda, nda
 
-        nsp = sp / np.max(sp, axis=0)
-        nsn = 1 - sn / np.max(sn, axis=0)
+    def _score_passes(self, read, weights, types):
+        statistics = normalizations._ColumnStatistics.from_chunks(read(), ('sum',))
+        amatrix = statistics.sum / statistics.n
 
-        score = (nsp + nsn) / 2
+        def weighted_sums(chunk):
+            _, pda, nda = self._distances(chunk, types, amatrix)
+            return np.sum(weights * pda, axis=1), np.sum(weights * nda, axis=1)
 
-        return amatrix, pda, nda, sp, sn, nsp, nsn, score
+        sp_max = sn_max = -np.inf
+        for chunk in read():
+            sp, sn = weighted_sums(chunk)
+            sp_max = max(sp_max, np.max(sp, initial=-np.inf))
+            sn_max = max(sn_max, np.max(sn, initial=-np.inf))
+
+        for chunk in read():
+            sp, sn = weighted_sums(chunk)
+            yield (sp / sp_max + 1 - sn / sn_max) / 2
@@ -109,9 +109,12 @@ class ERVD(MCDA_method):
         ref = self.ref_point
         lambd = self.lambd
         alpha = self.alpha
+        self._checkpoint()
 
         nmatrix = helpers.normalize_matrix(matrix, normalizations.sum_normalization, None)
+        self._checkpoint()
         nref = ref / matrix.sum(axis=0)
+        self._checkpoint()
 
         vnmatrix = nmatrix.copy()
         for j in range(nmatrix.shape[1]):
@@ -123,12 +126,18 @@ class ERVD(MCDA_method):
                 ind = (nmatrix[:, j] < nref[j])
                 vnmatrix[ind, j] = (nref[j] - nmatrix[ind, j]) ** alpha
                 vnmatrix[~ind, j] = - lambd * (nmatrix[~ind, j] - nref[j]) ** alpha
+        self._checkpoint()
 
         v_plus = np.max(vnmatrix, axis=0)
+        self._checkpoint()
         v_minus = np.min(vnmatrix, axis=0)
+        self._checkpoint()
 
         S_plus = np.sum(weights * np.abs(vnmatrix - v_plus), axis=1)
+        self._checkpoint()
         S_minus = np.sum(weights * np.abs(vnmatrix - v_minus), axis=1)
+        self._checkpoint()
 
         p = S_minus / (S_plus + S_minus)
+        self._checkpoint()
         return ref, nmatrix, nref, vnmatrix, v_plus, v_minus, S_plus, S_minus, p
@@ -60,12 +60,16 @@ class LMAW(MCDA_method):
             else:
                 m = np.min(col)
                 smatrix[:, j] = (col + m) / col
+        self._checkpoint()
 
         phi_matrix = np.log(smatrix) / np.log(np.prod(smatrix, axis=0))
+        self._checkpoint()
 
         xi_matrix = (2 * phi_matrix**weights) / ((2 - phi_matrix)**weights + phi_matrix**weights)
+        self._checkpoint()
 
         q_values = np.sum(xi_matrix, axis=1)
+        self._checkpoint()
 
         return smatrix, phi_matrix, xi_matrix, q_values
 
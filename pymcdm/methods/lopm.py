@@ -96,7 +96,8 @@ class LoPM(MCDA_method):
                  weights: np.ndarray | list | tuple,
                  types: np.ndarray | list | tuple = None,
                  validation: bool = True,
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 profile: bool = False):
         """ Rank alternatives from decision matrix `matrix`, with criteria
             weights `weights` and criteria types `types`.
 
@@ -126,24 +127,40 @@ class LoPM(MCDA_method):
                     Explain the MCDA, i.e. provide matrices and vectors from
                     all the steps of the method, instead of return just the
                     preference vector. Default is False.
+
+                profile : bool
+                    Measure wall-time and peak memory allocation of the
+                    validation and of each step of the method. Implies
+                    `verbose`, the measurements are stored in the `profile`
+                    attribute of the returned MCDA_results. Profiling slows
+                    the evaluation down. Default is False.
         """
         matrix = np.asarray(matrix, dtype='float')
         weights = np.asarray(weights, dtype='float')
-
-        if validation:
-            if types is not None:
-                types = np.asarray(types)
-                matrix_validator(matrix, types)
-                types_validator(matrix, types)
-            elif self.property_types is None:
-                raise ValueError('Either types (in call) or property_types (in init) should be provided.')
-            weights_validator(matrix, weights)
-            self._additional_validation(matrix, weights, types)
-
-        if verbose:
-            return self._method_explained(matrix, weights, types)
-        else:
-            return self._method(matrix, weights, types)[-1]
+        if types is not None:
+            types = np.asarray(types)
+
+        return self._evaluate(matrix, weights, types, validation, verbose, profile)
+
+    def _validate(self, matrix, weights, types):
+        if types is not None:
+            matrix_validator(matrix, types)
+            types_validator(matrix, types)
+        elif self.property_types is None:
+            raise ValueError('Either types (in call) or property_types (in init) should be provided.')
+        weights_validator(matrix, weights)
+        self._additional_validation(matrix, weights, types)
+
+    def _validate_chunk(self, matrix, weights, types):
+        # Streaming requires property_limits and property_types, so types are not used
+        array_dimension_validator(matrix, 2, 'Matrix')
+        weights_validator(matrix, weights)
+        self._additional_validation(matrix, weights, types)
+
+    @property
+    def _streamable(self):
+        # Limits derived from the matrix require the whole matrix
+        return self.property_limits is not None
 
     def _method(self, matrix, weights, types):
         if self.property_limits is not None:
@@ -158,10 +175,14 @@ class LoPM(MCDA_method):
         target_mask = (types == 0)
 
         lower = np.sum(weights[lower_mask] * (limits[lower_mask] / matrix[:, lower_mask]), axis=1)
+        self._checkpoint()
         upper = np.sum(weights[upper_mask] * (matrix[:, upper_mask] / limits[upper_mask]), axis=1)
+        self._checkpoint()
         target = np.sum(weights[target_mask] * np.abs((matrix[:, target_mask] / limits[target_mask]) - 1), axis=1)
+        self._checkpoint()
 
         m = lower + upper + target
+        self._checkpoint()
         return lower, upper, target, m
 
     def _additional_validation(self, matrix, weights, types):
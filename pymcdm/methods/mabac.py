@@ -8,6 +8,13 @@ from .mcda_method import MCDA_method
 from ..io import TableDesc
 
 
+def _sum_log(x):
+    # Geometric means are computed from the sums of logarithms (as in the
+    # streaming evaluation), because the products underflow for many alternatives
+    with np.errstate(divide='ignore'):
+        return np.sum(np.log(x), axis=0)
+
+
 class MABAC(MCDA_method):
     """ Multi-Attributive Border Approximation Area Comparison (MABAC) method.
 
@@ -63,14 +70,40 @@ class MABAC(MCDA_method):
     def _method(self, matrix, weights, types):
         nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
         n, m = nmatrix.shape
+        self._checkpoint()
         # Calculation of the elements from the weighted matrix
         weighted_matrix = (nmatrix + 1) * weights
+        self._checkpoint()
 
         # Determining the border approximation area matrix
-        G = np.prod(weighted_matrix, axis=0) ** (1 / n)
+        G = np.exp(_sum_log(weighted_matrix) / n)
+        self._checkpoint()
 
         # Calculation of the distance border approximation area
         Q = weighted_matrix - G
+        self._checkpoint()
 
         score = np.sum(Q, axis=1)
+        self._checkpoint()
         return nmatrix, weighted_matrix, G, Q, score
+
+    def _method_batch(self, matrix, weights, types):
+        nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        n, m = nmatrix.shape
+
+        # G_j = w_j * geometric mean of (r_ij + 1), so the score is linear in weights
+        G = np.exp(_sum_log(nmatrix + 1) / n)
+
+        return weights @ (nmatrix + 1 - G).T
+
+    def _score_passes(self, read, weights, types):
+        statistics = normalizations._ColumnStatistics.from_chunks(read(), self._statistics_fields())
+
+        def weighted(chunk):
+            return (helpers.normalize_matrix(chunk, self.normalization, types, statistics=statistics) + 1) * weights
+
+        weighted_statistics = normalizations._ColumnStatistics.from_chunks((weighted(chunk) for chunk in read()),
+                                                                            ('sum_log',))
+        G = np.exp(weighted_statistics.sum_log / statistics.n)
+        for chunk in read():
+            yield np.sum(weighted(chunk) - G, axis=1)
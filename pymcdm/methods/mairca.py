@@ -63,16 +63,22 @@ class MAIRCA(MCDA_method):
     def _method(self, matrix, weights, types):
         n, _ = matrix.shape
 
+        nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        self._checkpoint()
+
         # Creating theoretical ranking matrix
         Tp = 1 / n * weights
+        self._checkpoint()
 
         # Creating real rating matrix
-        nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
         Tr = nmatrix * Tp
+        self._checkpoint()
 
         # Calculation of Total Gap Matrix
         G = Tp - Tr
+        self._checkpoint()
 
         # Calculation of the final values of criteria functions
         score = np.sum(G, axis=1)
+        self._checkpoint()
         return nmatrix, Tp, Tr, G, score
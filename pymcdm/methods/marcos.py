@@ -111,22 +111,30 @@ class MARCOS(MCDA_method):
             else:
                 exmatrix[-2, i] = min_values[i]
                 exmatrix[-1, i] = max_maxes[i]
+        self._checkpoint()
 
         # Normalization
         n_exmatrix = helpers.normalize_matrix(exmatrix,
                                               self.normalization, types)
+        self._checkpoint()
 
         # Weighting
         weighted_matrix = n_exmatrix * weights
+        self._checkpoint()
 
         # Utility degree
         S = weighted_matrix.sum(axis=1)
         k_neg = (S / S[-1])[:-2]
+        self._checkpoint()
         k_pos = (S / S[-2])[:-2]
+        self._checkpoint()
 
         # Utility functions
-        f_k_pos = k_neg / (k_pos + k_neg)
         f_k_neg = k_pos / (k_pos + k_neg)
+        self._checkpoint()
+        f_k_pos = k_neg / (k_pos + k_neg)
+        self._checkpoint()
         f_k = (k_pos + k_neg) / (1 + (1 - f_k_pos) / f_k_pos + (1 - f_k_neg) / f_k_neg)
+        self._checkpoint()
 
         return exmatrix, n_exmatrix, weighted_matrix, k_neg, k_pos, f_k_neg, f_k_pos, f_k
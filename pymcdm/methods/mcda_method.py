@@ -1,21 +1,109 @@
 # Copyright (c) 2020-2026 Andrii Shekhovtsov
 
+import time
+import tracemalloc
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from warnings import warn
 
 import numpy as np
 
+from .. import normalizations
 from ..helpers import rankdata
-from ..validators import validate_decision_problem
-from ..io import MCDA_results
+from ..validators import (validate_decision_problem, matrix_validator, weights_validator,
+                          weights_batch_validator, types_validator, array_dimension_validator,
+                          _validation_cache)
+
+
+# Maximum number of elements in the (weights x alternatives x criteria)
+# arrays created during the batch evaluation
+_BATCH_CHUNK_SIZE = 2 ** 22
+
+# Default number of elements in the chunks of the decision matrix evaluated
+# by `MCDA_method.score_chunks`
+_STREAM_CHUNK_SIZE = 2 ** 22
+
+
+# Profiler of the method evaluated with `profile=True` in the current context
+_active_profiler = ContextVar('_active_profiler', default=None)
+
+
+class _StepProfiler:
+    """ Measure wall-time and peak memory allocation of the steps of the
+        MCDA method `method`.
+
+        Steps end with explicit checkpoints: after the validation, after
+        each intermediate result computed by the method's `_method` (which
+        calls `MCDA_method._checkpoint`) and after the results are created.
+        Each step gets the time and the peak memory allocated (in bytes,
+        relative to the memory allocated at the beginning of the step) since
+        the previous checkpoint. The steps of the method are named after its
+        intermediate results, so it should mark exactly one checkpoint for
+        each of them (it is warned otherwise).
+    """
+
+    def __init__(self, method):
+        self.method = method
+        self._stop_tracemalloc = not tracemalloc.is_tracing()
+        if self._stop_tracemalloc:
+            tracemalloc.start()
+        self.steps = []
+        self._start_step()
+
+    def _start_step(self):
+        tracemalloc.reset_peak()
+        self._memory = tracemalloc.get_traced_memory()[0]
+        self._time = time.perf_counter()
+
+    def checkpoint(self, step=None):
+        """ End the step started by the previous checkpoint. """
+        t = time.perf_counter()
+        peak = tracemalloc.get_traced_memory()[1]
+        self.steps.append({'step': step, 'time': t - self._time, 'peak_memory': peak - self._memory})
+        self._start_step()
+
+    def stop(self, results):
+        """ Stop profiling and name the steps of the method after the
+            tables of the `results`. """
+        if self._stop_tracemalloc:
+            tracemalloc.stop()
+
+        steps = [s for s in self.steps if s['step'] is None]
+        if not steps:
+            # Method does not mark its steps, so the last step includes all of it
+            self.steps[-1]['step'] = 'Method'
+        elif results is not None and len(steps) == len(results.results):
+            for s, table in zip(steps, results.results):
+                s['step'] = table.desc.caption
+        else:
+            if results is not None:
+                warn(f'{self.method.__class__.__name__} method marked {len(steps)} steps, but returned '
+                     f'{len(results.results)} intermediate results, so the steps are not named after them.')
+            for i, s in enumerate(steps, 1):
+                s['step'] = f'Step {i}'
+        return self.steps
 
 
 class MCDA_method(ABC):
     _reverse_ranking = True
     _tables = None
+    # True if the preference of each alternative depends only on its
+    # values (and the method's parameters), so the decision matrix can be
+    # evaluated in chunks of rows
+    _streamable = False
+    # Methods which need column statistics of the whole decision matrix can
+    # evaluate it in chunks in a few passes. They implement this method as
+    # generator `_score_passes(read, weights, types)`, where each call of
+    # `read()` returns new iterator over the chunks of the decision matrix.
+    _score_passes = None
+    # True if `_method` computes some intermediate results only when it is
+    # called with `save_results=True`, as in `_method_explained`
+    _save_results = False
 
     def __call__(self, matrix: np.ndarray | list | tuple, weights: np.ndarray | list | tuple, types: np.ndarray | list | tuple,
                  validation: bool = True,
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 profile: bool = False):
         """ Rank alternatives from decision matrix `matrix`, with criteria
             weights `weights` and criteria types `types`.
 
@@ -42,33 +130,324 @@ class MCDA_method(ABC):
                     Explain the MCDA, i.e. provide matrices and vectors from
                     all the steps of the method, instead of return just the
                     preference vector. Default is False.
+
+                profile : bool
+                    Measure wall-time and peak memory allocation of the
+                    validation and of each step of the method. Implies
+                    `verbose`, the measurements are stored in the `profile`
+                    attribute of the returned MCDA_results. Profiling slows
+                    the evaluation down. Default is False.
         """
         matrix = np.asarray(matrix, dtype='float')
         weights = np.asarray(weights, dtype='float')
         types = np.asarray(types)
 
+        return self._evaluate(matrix, weights, types, validation, verbose, profile)
+
+    def _evaluate(self, matrix, weights, types, validation, verbose, profile):
+        if profile:
+            return self._profile(matrix, weights, types, validation)
+
         if validation:
-            validate_decision_problem(matrix, weights, types)
-            self._additional_validation(matrix, weights, types)
+            self._validate(matrix, weights, types)
 
         if verbose:
             return self._method_explained(matrix, weights, types)
         else:
             return self._method(matrix, weights, types)[-1]
 
+    def _profile(self, matrix, weights, types, validation):
+        profiler = _StepProfiler(self)
+        token = _active_profiler.set(profiler)
+        results = None
+        try:
+            if validation:
+                self._validate(matrix, weights, types)
+            profiler.checkpoint('Validation')
+            results = self._method_explained(matrix, weights, types)
+            profiler.checkpoint('Results')
+        finally:
+            _active_profiler.reset(token)
+            profile = profiler.stop(results)
+        results.profile = profile
+        return results
+
+    def _checkpoint(self):
+        """ Mark the end of the computation of the next intermediate result
+            of `_method`, if the method is profiled. Methods call it after
+            each result they return, in the order of `_tables`.
+        """
+        profiler = _active_profiler.get()
+        if profiler is not None and profiler.method is self:
+            profiler.checkpoint()
+
+    def _validate(self, matrix, weights, types):
+        validate_decision_problem(matrix, weights, types)
+        self._additional_validation(matrix, weights, types)
+
+    def batch(self, matrix: np.ndarray | list | tuple, weights: np.ndarray | list | tuple,
+              types: np.ndarray | list | tuple,
+              validation: bool = True):
+        """ Evaluate alternatives from decision matrix `matrix` for each
+            of the weight vectors stacked in `weights`, with criteria types
+            `types`.
+
+            This is equivalent to calling the method for each weight vector
+            separately, however the input is converted and validated once,
+            and methods which support it reuse the normalized matrix and
+            compute preferences for many weight vectors at once.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Two dimensional array (K x M) with one criteria weights
+                    vector in each row. Sum of the weights in each row should
+                    be 1.
+
+                types : ndarray
+                    Array with definitions of criteria types:
+                    1 if criteria is profit and -1 if criteria is cost for
+                    each criteria in `matrix`.
+
+                validation : bool
+                    Enable or disable validation of the all input data. True - validation is enabled,
+                    False - validation is disabled. Default is True.
+
+            Returns
+            -------
+                ndarray
+                    Array of shape (K, N) with preference values of the N
+                    alternatives for each of the K weight vectors.
+
+            Examples
+            --------
+            >>> import numpy as np
+            >>> from pymcdm.methods import TOPSIS
+            >>> matrix = np.array([[1, 2, 5],
+            ...                    [3000, 3750, 4500]]).T
+            >>> weights = np.array([[0.5, 0.5],
+            ...                     [0.2, 0.8]])
+            >>> types = np.array([-1, 1])
+            >>> TOPSIS().batch(matrix, weights, types).round(3)
+            array([[0.5  , 0.617, 0.5  ],
+                   [0.2  , 0.515, 0.8  ]])
+        """
+        matrix = np.asarray(matrix, dtype='float')
+        weights = np.asarray(weights, dtype='float')
+        types = np.asarray(types)
+
+        if validation:
+            matrix_validator(matrix, types)
+            weights_batch_validator(matrix, weights)
+            types_validator(matrix, types)
+            self._additional_validation(matrix, weights, types)
+
+        # Split weight vectors to bound memory used by broadcasting
+        chunk = max(1, _BATCH_CHUNK_SIZE // max(1, matrix.size))
+        return np.vstack([self._method_batch(matrix, weights[i:i + chunk], types)
+                          for i in range(0, weights.shape[0], chunk)])
+
+    def _statistics_fields(self):
+        """ Column statistics (`_ColumnStatistics` fields) which are needed
+            to normalize the chunks of the decision matrix, None if the
+            normalization can not be computed from the column statistics.
+        """
+        normalization = getattr(self, 'normalization', None)
+        if normalization is None:
+            return ()
+        return normalizations._STATISTICS_FIELDS.get(normalization)
+
+    def score_stream(self, chunks, weights=None, types=None, validation: bool = True):
+        """ Evaluate alternatives delivered in chunks of rows of the decision
+            matrix, e.g. read from a file or database which does not fit in
+            the memory. Preferences of the alternatives in each chunk are
+            yielded before the next chunk is read.
+
+            Methods in which the preference of each alternative depends
+            only on its values and the method's parameters (e.g. bounds,
+            characteristic values or reference points), such as SPOTIS,
+            BalancedSPOTIS, RAFSI, RIM, COMET or LoPM with `property_limits`
+            provided, read the chunks once.
+
+            Methods which need only column statistics of the whole matrix
+            (TOPSIS, VIKOR, WSM, EDAS and MABAC) read the chunks a few times:
+            the statistics are accumulated in the first passes and the
+            alternatives are evaluated in the last one. The chunks should be
+            a sequence in this case, and the normalization function should be
+            one from `pymcdm.normalizations`. The results are the same as for
+            the whole matrix, up to the floating point rounding of the sums.
+
+            Parameters
+            ----------
+                chunks : Iterable[ndarray]
+                    Iterable of two dimensional arrays with the alternatives
+                    in rows and criteria in columns.
+
+                weights : ndarray
+                    Criteria weights. Sum of the weights should be 1.
+
+                types : ndarray
+                    Array with definitions of criteria types:
+                    1 if criteria is profit and -1 if criteria is cost for
+                    each criteria in `matrix`.
+
+                validation : bool
+                    Enable or disable validation of the input data. Each chunk
+                    is validated separately, checks which require the whole
+                    decision matrix (dominated alternatives) are skipped.
+                    Default is True.
+
+            Returns
+            -------
+                Iterator[ndarray]
+                    Preference values of the alternatives in each chunk.
+
+            Raises
+            ------
+                ValueError
+                    If the method requires other statistics of the whole
+                    decision matrix to evaluate the alternatives, or if it
+                    reads the matrix several times and `chunks` is an
+                    iterator.
+
+            Examples
+            --------
+            >>> import numpy as np
+            >>> from pymcdm.methods import SPOTIS
+            >>> matrix = np.array([[1, 2, 5],
+            ...                    [3000, 3750, 4500]]).T
+            >>> spotis = SPOTIS(SPOTIS.make_bounds(matrix))
+            >>> chunks = (matrix[i:i + 2] for i in range(0, 3, 2))
+            >>> [p.round(3) for p in spotis.score_stream(chunks, [0.5, 0.5], [-1, 1])]
+            [array([0.5  , 0.375]), array([0.5])]
+        """
+        if not self._streamable and self._score_passes is None:
+            raise ValueError(f'{self.__class__.__name__} method uses statistics of the whole decision matrix, '
+                             'so the alternatives can not be evaluated in separate chunks.')
+
+        if weights is not None:
+            weights = np.asarray(weights, dtype='float')
+        if types is not None:
+            types = np.asarray(types)
+
+        if self._streamable:
+            return (self._method(chunk, weights, types)[-1]
+                    for chunk in self._chunks(chunks, weights, types, validation))
+
+        if iter(chunks) is chunks:
+            raise ValueError(f'{self.__class__.__name__} method reads the decision matrix several times, so the '
+                             'chunks should be provided as a sequence (e.g. list of memory mapped arrays) '
+                             'instead of an iterator.')
+
+        if self._statistics_fields() is None:
+            normalization = self.normalization
+            raise ValueError(f'Normalization {getattr(normalization, "__name__", normalization)} can not be '
+                             'computed from the column statistics, so the alternatives can not be evaluated '
+                             'in separate chunks.')
+
+        passes = 0
+
+        def read():
+            nonlocal passes
+            passes += 1
+            return self._chunks(chunks, weights, types, validation and passes == 1)
+
+        return self._score_passes(read, weights, types)
+
+    def _chunks(self, chunks, weights, types, validation):
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype='float')
+            if validation:
+                # Chunks are rarely evaluated again, so they are not cached
+                with _validation_cache.bypass():
+                    self._validate_chunk(chunk, weights, types)
+            yield chunk
+
+    def score_chunks(self, matrix, weights=None, types=None,
+                     chunk_size: int | None = None,
+                     validation: bool = True):
+        """ Evaluate alternatives from decision matrix `matrix` in chunks of
+            `chunk_size` rows, see `score_stream`. The matrix can be a memory
+            mapped array (`numpy.memmap` or `numpy.load` with `mmap_mode`),
+            in which case only the evaluated chunk is loaded to the memory.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Criteria weights. Sum of the weights should be 1.
+
+                types : ndarray
+                    Array with definitions of criteria types:
+                    1 if criteria is profit and -1 if criteria is cost for
+                    each criteria in `matrix`.
+
+                chunk_size : int or None
+                    Number of rows in each chunk. If None, chunks have about
+                    4 million elements. Default is None.
+
+                validation : bool
+                    Enable or disable validation of the input data. Default is True.
+
+            Returns
+            -------
+                Iterator[ndarray]
+                    Preference values of the alternatives in each chunk.
+        """
+        if not isinstance(matrix, np.ndarray):
+            matrix = np.asarray(matrix, dtype='float')
+
+        if chunk_size is None:
+            chunk_size = max(1, _STREAM_CHUNK_SIZE // max(1, matrix.shape[1]))
+        elif chunk_size < 1:
+            raise ValueError(f'chunk_size should be positive, but its value is {chunk_size}.')
+
+        # Slices of memory mapped arrays are read only when they are used
+        chunks = [matrix[i:i + chunk_size] for i in range(0, matrix.shape[0], chunk_size)]
+        return self.score_stream(chunks, weights, types, validation)
+
+    def _validate_chunk(self, matrix, weights, types):
+        array_dimension_validator(matrix, 2, 'Matrix')
+        weights_validator(matrix, weights)
+        types_validator(matrix, types)
+        self._additional_validation(matrix, weights, types)
+
+    def _method_batch(self, matrix, weights, types):
+        return np.array([self._method(matrix, w, types)[-1] for w in weights])
+
     def _additional_validation(self, matrix, weights, types):
         return
 
     def _method_explained(self, matrix, weights, types):
-        results = self._method(matrix, weights, types)
+        from ..io import MCDA_results
+
+        if self._save_results:
+            results = self._method(matrix, weights, types, save_results=True)
+        else:
+            results = self._method(matrix, weights, types)
         return MCDA_results(
             method=self,
             matrix=matrix,
-            results=[t.create_table(r) for t, r in zip(self._tables, results)]
+            results=self._create_tables(results)
             )
 
-    def rank(self, a):
-        return rankdata(a, reverse=self._reverse_ranking)
+    def _create_tables(self, results):
+        """ Tables of the intermediate `results` returned by `_method`. """
+        return [t.create_table(r) for t, r in zip(self._tables, results)]
+
+    def rank(self, a, axis=-1):
+        """ Rank preference values `a` according to the method's preference
+            direction. If `a` is 2d array, each vector along `axis` is ranked
+            separately (see `pymcdm.helpers.rankdata`).
+        """
+        return rankdata(a, reverse=self._reverse_ranking, axis=axis)
 
     @abstractmethod
     def _method(self, matrix, weights, types):
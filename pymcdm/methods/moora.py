@@ -50,10 +50,13 @@ class MOORA(MCDA_method):
                              ' criterion.')
 
         nmatrix = matrix / np.sqrt(np.sum(matrix ** 2, axis=0))
+        self._checkpoint()
 
         # Difficult normalized decision-making matrix
         wmatrix = nmatrix * weights
+        self._checkpoint()
         # Calculate the composite score
         cscore = np.sum(wmatrix[:, types == 1], axis=1) - np.sum(wmatrix[:, types == -1], axis=1)
+        self._checkpoint()
 
         return nmatrix, wmatrix, cscore
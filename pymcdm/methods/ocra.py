@@ -68,19 +68,25 @@ class OCRA(MCDA_method):
     def _method(self, matrix, weights, types):
         n, m = matrix.shape
 
-        # Calculate preference ratings for cost and profit criteria
+        # Calculate preference ratings and linear preference ratings for cost criteria
         I = np.zeros(n)
-        O = np.zeros(n)
         for j in range(m):
             if types[j] == -1:
                 I += weights[j] * self.normalization(matrix[:, j], cost=True)
-            else:
-                O += weights[j] * self.normalization(matrix[:, j], cost=False)
-
-        # Calculate linear preference ratings for cost and profit criteria
+        self._checkpoint()
         Il = I - np.min(I)
+        self._checkpoint()
+
+        # Calculate preference ratings and linear preference ratings for profit criteria
+        O = np.zeros(n)
+        for j in range(m):
+            if types[j] != -1:
+                O += weights[j] * self.normalization(matrix[:, j], cost=False)
+        self._checkpoint()
         Ol = O - np.min(O)
+        self._checkpoint()
 
         # Calculate overall preference rating
         P = (Il + Ol) - np.min(Il + Ol)
+        self._checkpoint()
         return I, Il, O, Ol, P
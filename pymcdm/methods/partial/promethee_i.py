@@ -1,11 +1,16 @@
 # Copyright (c) 2020-2026 Andrii Shekhovtsov
 
-from itertools import repeat
+from itertools import chain, repeat
 from functools import partial, wraps
+from numbers import Real
 import numpy as np
 
 from ..mcda_method import MCDA_method
-from ...io import TableDesc, MCDA_results
+from ...io import TableDesc
+
+# Maximum number of elements of the preference table held in memory at once
+_BLOCK_SIZE = 2 ** 22
+
 
 def _preference_function_wrapper(f):
     @wraps(f)
@@ -70,6 +75,15 @@ class PROMETHEE_I(MCDA_method):
             q : ndarray or list
                 q values for each criterion. Can be either float values or function. If function, q value will be calculated based on difference table.
 
+            block_size : int or None
+                Number of alternatives (rows of the preference table) processed at once.
+                Flows are accumulated block by block, so only a block of the preference
+                table is held in memory. If None, block size is chosen automatically.
+                For 'usual', and for 'vshape' and 'vshape_2' with numeric p and q values,
+                flows are calculated from the sorted criterion values instead, in O(n log n) time.
+                Full difference and preference tables are computed only if `verbose=True`,
+                or if p or q values are given as functions, as they need the whole difference table.
+                Default is None.
 
         References
         ----------
@@ -90,6 +104,7 @@ class PROMETHEE_I(MCDA_method):
         >>> body(matrix, weights, types)
         (array([0.55, 0.35, 0.6 ]), array([0.45, 0.65, 0.4 ]))
     """
+    _save_results = True
     _tables = [
         # Additionally there will be a group of difference tables which will generated dynamically
         TableDesc(caption='Aggregated preference indices',
@@ -98,24 +113,46 @@ class PROMETHEE_I(MCDA_method):
                   label='flows', symbol=None, rows='A', cols=('$\\phi^+(A_i)$', '$\\phi^-(A_i)$'))
     ]
 
-    def __init__(self, preference_function, p=None, q=None):
+    def __init__(self, preference_function, p=None, q=None, block_size=None):
         pf = getattr(_PreferenceFunctions, preference_function)
         # p and q can be provided as list of values or list of functions
         if p is None and q is None:
             pfs = repeat(partial(pf, p=None, q=None))
         elif p is None and q is not None:
-            pfs = (partial(_preference_function_wrapper(pf), p=None, q=q_)
-                   for q_ in q)
+            pfs = [partial(_preference_function_wrapper(pf), p=None, q=q_)
+                   for q_ in q]
         elif p is not None and q is None:
-            pfs = (partial(_preference_function_wrapper(pf), p=p_, q=None)
-                   for p_ in p)
+            pfs = [partial(_preference_function_wrapper(pf), p=p_, q=None)
+                   for p_ in p]
         else:
-            pfs = (partial(_preference_function_wrapper(pf), p=p_, q=q_)
-                   for p_, q_ in zip(p, q))
+            pfs = [partial(_preference_function_wrapper(pf), p=p_, q=q_)
+                   for p_, q_ in zip(p, q)]
 
         self.pfs = pfs
+        self.preference_function = preference_function
+        self.p = p
+        self.q = q
+        self.block_size = block_size
+        # Thresholds calculated from the difference tables require full tables
+        self._blockable = not any(callable(v) for v in chain(p if p is not None else (),
+                                                             q if q is not None else ()))
 
     def _method(self, matrix, weights, types, save_results=False):
+        if not save_results and self._blockable:
+            return None, None, self._flows(matrix, weights, types)
+
+        N, M = matrix.shape
+        diff_tables, pi_table = self._preference_table(matrix, weights, types, save_results)
+
+        F_plus = np.sum(pi_table, axis=1) / (N-1)
+        F_minus = np.sum(pi_table, axis=0) / (N-1)
+        self._checkpoint()
+
+        return diff_tables, pi_table, (F_plus, F_minus)
+
+    def _preference_table(self, matrix, weights, types, save_results):
+        """ Calculate difference tables (only if `save_results` is True,
+            otherwise None is returned) and the aggregated preference table. """
         pfs = self.pfs
 
         N, M = matrix.shape
@@ -125,28 +162,123 @@ class PROMETHEE_I(MCDA_method):
         diff_tables = ((c - crit if ct == 1 else crit - c)
                        for crit, c, ct in zip(matrix.T, c_tables, types))
         if save_results:
-            diff_tables = list(diff_tables)
+            tables = []
+            for diff_table in diff_tables:
+                tables.append(diff_table)
+                self._checkpoint()
+            diff_tables = tables
 
         pi_table = sum(w * pf(d)
                        for w, d, pf in zip(weights, diff_tables, pfs))
+        self._checkpoint()
 
-        F_plus = np.sum(pi_table, axis=1) / (N-1)
-        F_minus = np.sum(pi_table, axis=0) / (N-1)
+        return diff_tables if save_results else None, pi_table
 
-        return diff_tables, pi_table, (F_plus, F_minus)
+    def _flows(self, matrix, weights, types):
+        """ Calculate positive and negative flows without the full preference table.
 
-    def _method_explained(self, matrix, weights, types):
-        diff_tables, pi_table, (F_plus, F_minus) = self._method(matrix, weights, types, save_results=True)
+            Flows for the criteria with piecewise linear preference functions
+            ('usual', 'vshape' and 'vshape_2') are calculated from the sorted
+            criterion values, other criteria are processed in blocks.
+        """
+        N, M = matrix.shape
+
+        # Difference tables are calculated as d(A_i, A_j) = x_i - x_j for the profit criteria
+        oriented = matrix * np.where(types == 1, 1, -1)
+        pfs = [pf for _, pf in zip(range(M), self.pfs)]
+
+        F_plus = np.zeros(N)
+        F_minus = np.zeros(N)
+        blocked = []
+        for i in range(M):
+            thresholds = self._linear_thresholds(i)
+            if thresholds is None:
+                blocked.append(i)
+            else:
+                plus, minus = self._sorted_flows(oriented[:, i], *thresholds)
+                F_plus += weights[i] * plus
+                F_minus += weights[i] * minus
+
+        if blocked:
+            plus, minus = self._blocked_flows(oriented[:, blocked], weights[blocked],
+                                              [pfs[i] for i in blocked])
+            F_plus += plus
+            F_minus += minus
+
+        return F_plus / (N-1), F_minus / (N-1)
+
+    def _linear_thresholds(self, i):
+        """ Return thresholds (a, b) if the preference function for the i-th
+            criterion is 0 for d <= a, (d - a) / (b - a) for a < d <= b and 1
+            for d > b, otherwise return None. """
+        p = None if self.p is None else self.p[i]
+        q = None if self.q is None else self.q[i]
+
+        if self.preference_function == 'usual':
+            return 0, 0
+        if self.preference_function == 'vshape' and isinstance(p, Real) and p > 0:
+            return 0, p
+        if (self.preference_function == 'vshape_2' and isinstance(p, Real)
+                and isinstance(q, Real) and p > q):
+            return q, p
+        return None
+
+    @staticmethod
+    def _sorted_flows(x, a, b):
+        """ Sums of rows and columns of the preference table for one criterion
+            with piecewise linear preference function, calculated in O(n log n)
+            with sorted values and prefix sums. """
+        # Preferences depend only on differences, centering improves precision of the prefix sums
+        x = x - np.mean(x)
+        # Calculations are made in sorted order, as sorted queries make searchsorted faster
+        order = np.argsort(x, kind='stable')
+        s = x[order]
+        prefix = np.concatenate(([0], np.cumsum(s)))
+
+        # Row sums: A_j with x_i - x_j > b are strictly preferred,
+        # A_j with a < x_i - x_j <= b are preferred in the linear part
+        low = np.searchsorted(s, s - b, side='left')
+        plus = low.astype(float)
+
+        # Column sums: A_i with x_i - x_j > b, and a < x_i - x_j <= b
+        high = np.searchsorted(s, s + b, side='right')
+        minus = (s.shape[0] - high).astype(float)
+
+        if b > a:
+            up = np.searchsorted(s, s - a, side='left')
+            plus += ((up - low) * (s - a) - (prefix[up] - prefix[low])) / (b - a)
+
+            down = np.searchsorted(s, s + a, side='right')
+            minus += ((prefix[high] - prefix[down]) - (high - down) * (s + a)) / (b - a)
+
+        flows = np.empty((2, s.shape[0]))
+        flows[:, order] = plus, minus
+        return flows
+
+    def _blocked_flows(self, oriented, weights, pfs):
+        """ Sums of rows and columns of the preference table accumulated
+            over the blocks of rows. """
+        N, M = oriented.shape
+        block_size = self.block_size or max(1, _BLOCK_SIZE // N)
+
+        plus = np.zeros(N)
+        minus = np.zeros(N)
+        for start in range(0, N, block_size):
+            block = oriented[start:start + block_size]
+            pi_block = sum(w * pf(b.reshape(-1, 1) - crit)
+                           for w, b, crit, pf in zip(weights, block.T, oriented.T, pfs))
+            plus[start:start + block_size] = np.sum(pi_block, axis=1)
+            minus += np.sum(pi_block, axis=0)
+
+        return plus, minus
+
+    def _create_tables(self, results):
+        diff_tables, pi_table, (F_plus, F_minus) = results
 
         tables = self._generate_diff_tables(diff_tables)
         tables.append(self._tables[0].create_table(pi_table))
         tables.append(self._tables[1].create_table(np.array((F_plus, F_minus)).T))
-
-        return MCDA_results(
-            method=self,
-            matrix=matrix,
-            results=tables
-        )
+        return tables
 
     @staticmethod
     def _generate_diff_tables(diff_tables):
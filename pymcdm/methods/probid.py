@@ -7,9 +7,21 @@ from .. import normalizations
 from ..methods.mcda_method import MCDA_method
 from ..io import TableDesc
 
+# Maximum number of elements of the pairwise differences held in memory at once
+_BLOCK_SIZE = 2 ** 22
+
+
 class PROBID(MCDA_method):
     """ Preference Ranking on the Basis of Ideal-Average Distance Method [#probid1]_.
 
+    Parameters
+    ----------
+        block_size : int or None
+            Number of alternatives for which distances to the ideal solutions are calculated at once.
+            Only the overall positive-ideal and negative-ideal distances are accumulated, so the full
+            matrix of distances is calculated only if `verbose=True`. If None, block size is chosen
+            automatically. Default is None.
+
     References
     ----------
     .. [#probid1] Wang, Z., Rangaiah, G. P., & Wang, X. (2021). Preference ranking on the basis of ideal-average distance method for multi-criteria decision-making. Industrial & Engineering Chemistry Research, 60(30), 11216-11230.
@@ -36,6 +48,7 @@ class PROBID(MCDA_method):
     >>> print(pref)
     [0.8568, 0.7826, 0.9362, 0.9369, 0.9379, 0.8716, 0.5489, 0.7231, 0.7792, 0.3331, 0.3387]
     """
+    _save_results = True
     _tables = [
         TableDesc(caption='Normalized decision matrix',
                   label='nmatrix', symbol='$r_{ij}$', rows='A', cols='C'),
@@ -59,27 +72,47 @@ class PROBID(MCDA_method):
                   label='pref', symbol='$P_i$', rows='A', cols=None),
     ]
 
-    def _method(self, matrix, weights, types):
+    def __init__(self, block_size=None):
+        self.block_size = block_size
+
+    def _method(self, matrix, weights, types, save_results=False):
         nmatrix = helpers.normalize_matrix(matrix,
                                            normalizations.vector_normalization,
                                            None)
+        self._checkpoint()
 
         wnmatrix = nmatrix * weights
+        self._checkpoint()
 
-        pis_matrix = wnmatrix.copy()
-        for i in range(wnmatrix.shape[1]):
-            if types[i] == 1:
-                pis_matrix[:, i] = np.sort(wnmatrix[:, i])[::-1]
-            else:
-                pis_matrix[:, i] = np.sort(wnmatrix[:, i])
+        # Ideal solutions are sorted columns, best values first
+        pis_matrix = np.sort(wnmatrix, axis=0)
+        pis_matrix = np.where(types == 1, pis_matrix[::-1], pis_matrix)
+        self._checkpoint()
 
         average_pis = np.mean(pis_matrix, axis=0)
-
-        Si = np.zeros((wnmatrix.shape[0], wnmatrix.shape[0]))
-        for i, alt in enumerate(wnmatrix):
-            Si[i] = np.sqrt(np.sum((alt - pis_matrix)**2, axis=1))
-
-        Si_average = np.sqrt(np.sum((wnmatrix - average_pis)**2, axis=1))
+        self._checkpoint()
+
+        pos_coef, neg_coef = self._ideal_coefficients(wnmatrix.shape[0])
+        if save_results:
+            Si = self._ideal_distances(wnmatrix, pis_matrix)
+            self._checkpoint()
+            Si_average = np.sqrt(np.sum((wnmatrix - average_pis)**2, axis=1))
+            self._checkpoint()
+            Si_pos_ideal = Si @ pos_coef
+            self._checkpoint()
+            Si_neg_ideal = Si @ neg_coef
+            self._checkpoint()
+        else:
+            Si = None
+            n, m = wnmatrix.shape
+            block_size = self.block_size or max(1, _BLOCK_SIZE // (n * m))
+            Si_pos_ideal = np.zeros(n)
+            Si_neg_ideal = np.zeros(n)
+            for i in range(0, n, block_size):
+                Si_block = self._ideal_distances(wnmatrix[i:i + block_size], pis_matrix)
+                Si_pos_ideal[i:i + block_size] = Si_block @ pos_coef
+                Si_neg_ideal[i:i + block_size] = Si_block @ neg_coef
+            Si_average = np.sqrt(np.sum((wnmatrix - average_pis)**2, axis=1))
 
         return (nmatrix,
                 wnmatrix,
@@ -87,26 +120,32 @@ class PROBID(MCDA_method):
                 average_pis,
                 Si,
                 Si_average,
-                *self._final_preference_calculation(Si, Si_average))
+                *self._final_preference_calculation(Si_pos_ideal, Si_neg_ideal, Si_average))
 
-    def _final_preference_calculation(self, Si, Si_average):
-        m = Si.shape[0]
+    @staticmethod
+    def _ideal_distances(wnmatrix, pis_matrix):
+        """ Euclidean distances between alternatives (rows) and ideal solutions (columns). """
+        return np.sqrt(np.sum((wnmatrix[:, np.newaxis] - pis_matrix)**2, axis=2))
 
-        Si_pos_ideal = np.zeros(m)
-        Si_neg_ideal = np.zeros(m)
+    @staticmethod
+    def _ideal_coefficients(m):
+        """ Coefficients of the distances to the ideal solutions in the
+            overall positive-ideal and negative-ideal distances. """
+        k = np.arange(1, m + 1)
 
         if m % 2 == 1:
             lim = (m + 1) // 2
         else:
             lim = m // 2
 
-        for k in range(1, lim + 1):
-            Si_pos_ideal += Si[:, k - 1] / k
-
-        for k in range(lim, m + 1):
-            Si_neg_ideal += Si[:, k - 1] / (m - k + 1)
+        pos_coef = np.where(k <= lim, 1 / k, 0)
+        neg_coef = np.where(k >= lim, 1 / (m - k + 1), 0)
+        return pos_coef, neg_coef
 
+    def _final_preference_calculation(self, Si_pos_ideal, Si_neg_ideal, Si_average):
         Ri = Si_pos_ideal / Si_neg_ideal
+        self._checkpoint()
 
         p = 1 / (1 + Ri**2) + Si_average
+        self._checkpoint()
         return Si_pos_ideal, Si_neg_ideal, Ri, p
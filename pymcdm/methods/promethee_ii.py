@@ -1,7 +1,9 @@
 # Copyright (c) 2023-2026 Andrii Shekhovtsov
 
+import numpy as np
+
 from .partial import PROMETHEE_I
-from ..io import TableDesc, MCDA_results
+from ..io import TableDesc
 
 
 class PROMETHEE_II(PROMETHEE_I):
@@ -20,6 +22,16 @@ class PROMETHEE_II(PROMETHEE_I):
             q : ndarray or list
                 q values for each criterion. Can be either float values or function. If function, q value will be calculated based on difference table.
 
+            block_size : int or None
+                Number of alternatives (rows of the preference table) processed at once.
+                Flows are accumulated block by block, so only a block of the preference
+                table is held in memory. If None, block size is chosen automatically.
+                For 'usual', and for 'vshape' and 'vshape_2' with numeric p and q values,
+                flows are calculated from the sorted criterion values instead, in O(n log n) time.
+                Full difference and preference tables are computed only if `verbose=True`,
+                or if p or q values are given as functions, as they need the whole difference table.
+                Default is None.
+
         References
         ----------
             .. [#promethee2] Mareschal, B., De Smet, Y., & Nemery, P. (2008, December). Rank reversal in the PROMETHEE II method:
@@ -49,22 +61,27 @@ class PROMETHEE_II(PROMETHEE_I):
     ]
 
     def _method(self, matrix, weights, types, save_results=False):
-        *other, (F_plus, F_minus) = super()._method(matrix, weights, types,
-                                                    save_results=True)
+        if not save_results and self._blockable:
+            F_plus, F_minus = self._flows(matrix, weights, types)
+            return None, None, F_plus, F_minus, F_plus - F_minus
+
+        N, M = matrix.shape
+        diff_tables, pi_table = self._preference_table(matrix, weights, types, save_results)
+
+        F_plus = np.sum(pi_table, axis=1) / (N-1)
+        self._checkpoint()
+        F_minus = np.sum(pi_table, axis=0) / (N-1)
+        self._checkpoint()
 
         FI = F_plus - F_minus
+        self._checkpoint()
 
-        return *other, F_plus, F_minus, FI
+        return diff_tables, pi_table, F_plus, F_minus, FI
 
-    def _method_explained(self, matrix, weights, types):
-        diff_tables, *other_tables = self._method(matrix, weights, types, save_results=True)
+    def _create_tables(self, results):
+        diff_tables, *other_tables = results
 
         tables = self._generate_diff_tables(diff_tables)
         tables.extend([t.create_table(data)
                        for t, data in zip(self._tables, other_tables)])
-
-        return MCDA_results(
-            method=self,
-            matrix=matrix,
-            results=tables
-        )
\ No newline at end of file
+        return tables
\ No newline at end of file
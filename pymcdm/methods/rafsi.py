@@ -36,6 +36,7 @@ class RAFSI(MCDA_method):
         .. [#rafsi1] Žižović, M., Pamučar, D., Albijanić, M., Chatterjee, P., & Pribićević, I. (2020). Eliminating rank reversal problem using a new multi-attribute model—the RAFSI method. Mathematics, 8(6), 1015.
         """
     _reverse_ranking = True
+    _streamable = True
     _tables = [
         TableDesc(caption='Standarized decision matrix',
                   label='smatrix', symbol='$s_{ij}$', rows='A', cols='C'),
@@ -67,6 +68,7 @@ class RAFSI(MCDA_method):
 
     def _method(self, matrix, weights, types):
         smatrix = (self.first * matrix + self.second)
+        self._checkpoint()
 
         snmatrix = np.empty_like(matrix, dtype='float')
         for j in range(matrix.shape[1]):
@@ -74,8 +76,10 @@ class RAFSI(MCDA_method):
                 snmatrix[:, j] = smatrix[:, j] / (2 * self.a_value)
             else:
                 snmatrix[:, j] = self.h_value / (2 * smatrix[:, j])
+        self._checkpoint()
 
         vai = np.sum(snmatrix * weights, axis=1)
+        self._checkpoint()
         return smatrix, snmatrix, vai
 
     def _additional_validation(self, matrix, weights, types):
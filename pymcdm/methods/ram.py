@@ -64,16 +64,21 @@ class RAM(MCDA_method):
 
     def _method(self, matrix, weights, types):
         nmatrix = helpers.normalize_matrix(matrix, self.normalization, None)
+        self._checkpoint()
 
         # Every row of nmatrix is multiplayed by weights
         wnmatrix = nmatrix * weights
+        self._checkpoint()
 
         # Vectors of PIS and NIS
         mask = (types == 1)
         Spi = wnmatrix[:, mask].sum(axis=1)
+        self._checkpoint()
         Smi = wnmatrix[:, ~mask].sum(axis=1)
+        self._checkpoint()
 
         ri = (2 + Spi) ** (1 / (2 + Smi))
+        self._checkpoint()
 
         return nmatrix, wnmatrix, Spi, Smi, ri
 
@@ -2,41 +2,12 @@
 
 import numpy as np
 
+from .. import normalizations
 from .mcda_method import MCDA_method
 from ..validators import bounds_validator, matrix_bounds_validator, ref_ideal_bounds_validator
 from ..io import TableDesc
 
 
-def _dmin(x, c, d):
-    """ Helper for the RIM normalization function."""
-    return min(abs(x - c), abs(x - d))
-
-
-def _f(x, a, b, c, d):
-    """ RIM normalization function.
-
-    Parameters
-    ----------
-    x: float
-        Value which should be normalized. x ∈ [a, b]
-    a, b: float
-        Range that belongs to a universe of discourse.
-    c, d: float
-        The reference ideal.
-
-    Returns
-    -------
-        float
-            Normalized value
-    """
-    if c <= x <= d:
-        return 1
-    elif (a <= x < c) and (a != c):
-        return 1 - (_dmin(x, c, d) / abs(a - c))
-    elif (d < x <= b) and (d != b):
-        return 1 - (_dmin(x, c, d) / abs(d - b))
-
-
 class RIM(MCDA_method):
     """ Reference Ideal Method [#rim1]_.
 
@@ -91,6 +62,7 @@ class RIM(MCDA_method):
     >>>  print(rank)
     ...  [3. 1. 5. 4. 2.]
     """
+    _streamable = True
     _tables = [
         TableDesc(caption='Reference ideal',
                   label='ref_ideal', symbol='$s_j$', rows='C', cols=['$s_{j}^{(min)}$', '$s_{j}^{(max)}$']),
@@ -140,18 +112,20 @@ class RIM(MCDA_method):
         range_t = self.bounds
         if ref_ideal_s is None:
             ref_ideal_s = self.get_ideal_from_bounds(self.bounds, types)
+        self._checkpoint()
 
-        nmatrix = matrix.astype('float')
-
-        for i in range(matrix.shape[0]):
-            for j in range(matrix.shape[1]):
-                nmatrix[i, j] = _f(matrix[i, j], *range_t[j], *ref_ideal_s[j])
+        nmatrix = normalizations.rim_normalization(matrix, range_t, ref_ideal_s)
+        self._checkpoint()
 
         wnmatrix = nmatrix * weights
+        self._checkpoint()
 
         i_plus = np.sqrt(np.sum((wnmatrix - weights) ** 2, axis=1))
+        self._checkpoint()
         i_minus = np.sqrt(np.sum(wnmatrix ** 2, axis=1))
+        self._checkpoint()
 
         p = i_minus / (i_plus + i_minus)
+        self._checkpoint()
 
         return ref_ideal_s, nmatrix, wnmatrix, i_plus, i_minus, p
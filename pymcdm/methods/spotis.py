@@ -45,6 +45,7 @@ class SPOTIS(MCDA_method):
         [0.1989, 0.3705, 0.3063, 0.7491]
     """
     _reverse_ranking = False
+    _streamable = True
     _tables = [
         TableDesc(caption='Ideal/Expected Solution Point (ISP/ESP)',
                   label='esp_isp', symbol='$S^{*}$/$S^{+}$', rows='C', cols=None),
@@ -73,19 +74,37 @@ class SPOTIS(MCDA_method):
             esp_bounds_validator(self.esp, self.bounds)
 
     def _method(self, matrix, weights, types):
+        esp = self._esp(types)
+        self._checkpoint()
+        nmatrix = self._normalized_distances(matrix, esp)
+        self._checkpoint()
+        # Distances to ISP (smaller means better alt)
+        raw_scores = np.sum(nmatrix * weights, axis=1)
+        self._checkpoint()
+        return esp, nmatrix, raw_scores
+
+    def _method_batch(self, matrix, weights, types):
+        _, nmatrix = self._distances(matrix, types)
+        return weights @ nmatrix.T
+
+    def _distances(self, matrix, types):
+        esp = self._esp(types)
+        return esp, self._normalized_distances(matrix, esp)
+
+    def _esp(self, types):
         bounds = self.bounds
         esp = self.esp
         if esp is None:
             # Determine ESP based on criteria bounds. In this case ESP == ISP.
             esp = bounds[np.arange(bounds.shape[0]),
                          ((types+1)//2).astype('int')]
+        return esp
 
+    def _normalized_distances(self, matrix, esp):
+        bounds = self.bounds
         # Normalized distances matrix (d_{ij})
-        nmatrix = np.abs((matrix - esp)/
-                         (bounds[:,0] - bounds[:,1]))
-        # Distances to ISP (smaller means better alt)
-        raw_scores = np.sum(nmatrix * weights, axis=1)
-        return esp, nmatrix, raw_scores
+        return np.abs((matrix - esp)/
+                      (bounds[:,0] - bounds[:,1]))
 
     def _additional_validation(self, matrix, weights, types):
         matrix_bounds_validator(matrix, self.bounds)
@@ -14,23 +14,21 @@ class SPROBID(PROBID):
                   label='pref', symbol='$P_i$', rows='A', cols=None),
     ]
 
-    def _final_preference_calculation(self, Si, Si_average):
-        m = Si.shape[0]
-
-        Si_pos_ideal = np.zeros(m)
-        Si_neg_ideal = np.zeros(m)
+    @staticmethod
+    def _ideal_coefficients(m):
+        k = np.arange(1, m + 1)
 
         if m >= 4:
-            for k in range(1, m // 4 + 1):
-                Si_pos_ideal += Si[:, k - 1] / k
-
-            for k in range(m + 1 - (m // 4), m + 1):
-                Si_neg_ideal += Si[:, k - 1] / (m - k + 1)
-
+            pos_coef = np.where(k <= m // 4, 1 / k, 0)
+            neg_coef = np.where(k >= m + 1 - (m // 4), 1 / (m - k + 1), 0)
         else:
-            Si_pos_ideal = Si[0]
-            Si_neg_ideal = Si[-1]
+            pos_coef = (k == 1).astype(float)
+            neg_coef = (k == m).astype(float)
+
+        return pos_coef, neg_coef
 
+    def _final_preference_calculation(self, Si_pos_ideal, Si_neg_ideal, Si_average):
         p = Si_neg_ideal / Si_pos_ideal
+        self._checkpoint()
 
         return Si_pos_ideal, Si_neg_ideal, p
@@ -61,18 +61,57 @@ class TOPSIS(MCDA_method):
 
     def _method(self, matrix, weights, types):
         nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        self._checkpoint()
 
         # Every row of nmatrix is multiplied by weights
         weighted_matrix = nmatrix * weights
+        self._checkpoint()
 
-        # Vectors of PIS and NIS
-        pis = np.max(weighted_matrix, axis=0)
+        # Vectors of NIS and PIS
         nis = np.min(weighted_matrix, axis=0)
+        self._checkpoint()
+        pis = np.max(weighted_matrix, axis=0)
+        self._checkpoint()
 
-        # PIS and NIS are substracted from every row of weighted matrix
-        Dp = np.sqrt(np.sum((weighted_matrix - pis) ** 2, axis=1))
+        # NIS and PIS are substracted from every row of weighted matrix
         Dm = np.sqrt(np.sum((weighted_matrix - nis) ** 2, axis=1))
+        self._checkpoint()
+        Dp = np.sqrt(np.sum((weighted_matrix - pis) ** 2, axis=1))
+        self._checkpoint()
 
         p = Dm / (Dm + Dp)
+        self._checkpoint()
 
         return nmatrix, weighted_matrix, nis, pis, Dm, Dp, p
+
+    def _method_batch(self, matrix, weights, types):
+        nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+
+        # (w * r_ij - max_i(w * r_ij))^2 == w^2 * (r_ij - max_i(r_ij))^2 for
+        # positive w, so squared distances are weighted sums of squared
+        # distances from the column max and min.
+        dmax = (nmatrix - np.max(nmatrix, axis=0)) ** 2
+        dmin = (nmatrix - np.min(nmatrix, axis=0)) ** 2
+        positive = weights >= 0
+        w2 = weights ** 2
+        w2_pos = np.where(positive, w2, 0)
+        w2_neg = np.where(positive, 0, w2)
+
+        Dp = np.sqrt(w2_pos @ dmax.T + w2_neg @ dmin.T)
+        Dm = np.sqrt(w2_pos @ dmin.T + w2_neg @ dmax.T)
+
+        return Dm / (Dm + Dp)
+
+    def _score_passes(self, read, weights, types):
+        statistics = normalizations._ColumnStatistics.from_chunks(read(), self._statistics_fields())
+
+        def weighted(chunk):
+            return helpers.normalize_matrix(chunk, self.normalization, types, statistics=statistics) * weights
+
+        # PIS and NIS are maximum and minimum of the weighted matrix
+        extremes = normalizations._ColumnStatistics.from_chunks((weighted(chunk) for chunk in read()), ('min', 'max'))
+        for chunk in read():
+            weighted_matrix = weighted(chunk)
+            Dp = np.sqrt(np.sum((weighted_matrix - extremes.max) ** 2, axis=1))
+            Dm = np.sqrt(np.sum((weighted_matrix - extremes.min) ** 2, axis=1))
+            yield Dm / (Dm + Dp)
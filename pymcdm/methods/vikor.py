@@ -2,6 +2,7 @@
 
 import numpy as np
 from .. import helpers
+from .. import normalizations
 from .mcda_method import MCDA_method
 from ..validators import param_validator
 from ..io import TableDesc
@@ -73,11 +74,43 @@ class VIKOR(MCDA_method):
         self.v = v
 
     def _method(self, matrix, weights, types):
-        v = self.v
-        nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        nmatrix, fminus, fstar, ff = self._distances(matrix, types)
+
+        weighted_ff = weights * ff
+        S = np.sum(weighted_ff, axis=1)
+        self._checkpoint()
+        R = np.max(weighted_ff, axis=1)
+        self._checkpoint()
+
+        Q = self._compromise(S, R)
+        self._checkpoint()
+
+        return nmatrix, fminus, fstar, S, R, Q
+
+    def _method_batch(self, matrix, weights, types):
+        *_, ff = self._distances(matrix, types)
+
+        S = weights @ ff.T
+        R = np.max(weights[:, None, :] * ff, axis=2)
+
+        return self._compromise(S, R)
 
-        fstar = np.max(nmatrix, axis=0)
-        fminus = np.min(nmatrix, axis=0)
+    def _normalize(self, matrix, types, statistics=None):
+        if statistics is not None and self.normalization is _fake_normalization:
+            return np.where(types == -1, statistics.max - matrix, matrix).astype('float')
+        return helpers.normalize_matrix(matrix, self.normalization, types, statistics=statistics)
+
+    def _distances(self, matrix, types, statistics=None, extremes=None):
+        nmatrix = self._normalize(matrix, types, statistics)
+        self._checkpoint()
+
+        if extremes is None:
+            fminus = np.min(nmatrix, axis=0)
+            self._checkpoint()
+            fstar = np.max(nmatrix, axis=0)
+            self._checkpoint()
+        else:
+            fstar, fminus = extremes
 
         if np.any(fstar == fminus):
             eq = np.arange(fstar.shape[0])[fstar == fminus]
@@ -87,16 +120,44 @@ class VIKOR(MCDA_method):
                 f'MCDA method.'
             )
 
-        weighted_ff = weights * ((fstar - nmatrix) / (fstar - fminus))
-        S = np.sum(weighted_ff, axis=1)
-        R = np.max(weighted_ff, axis=1)
+        return nmatrix, fminus, fstar, (fstar - nmatrix) / (fstar - fminus)
 
-        Sstar = np.min(S)
-        Sminus = np.max(S)
-        Rstar = np.min(R)
-        Rminus = np.max(R)
+    def _compromise(self, S, R, extremes=None):
+        v = self.v
+
+        if extremes is None:
+            # Alternatives are in the last axis, so S and R could be stacked for many weights vectors
+            Sstar = np.min(S, axis=-1, keepdims=True)
+            Sminus = np.max(S, axis=-1, keepdims=True)
+            Rstar = np.min(R, axis=-1, keepdims=True)
+            Rminus = np.max(R, axis=-1, keepdims=True)
+        else:
+            Sstar, Sminus, Rstar, Rminus = extremes
 
-        Q = v * (S - Sstar) / (Sminus - Sstar) \
+        return v * (S - Sstar) / (Sminus - Sstar) \
             + (1 - v) * (R - Rstar) / (Rminus - Rstar)
 
-        return nmatrix, fminus, fstar, S, R, Q
+    def _statistics_fields(self):
+        if self.normalization is _fake_normalization:
+            return ('max',)
+        return super()._statistics_fields()
+
+    def _score_passes(self, read, weights, types):
+        statistics = normalizations._ColumnStatistics.from_chunks(read(), self._statistics_fields())
+        nstatistics = normalizations._ColumnStatistics.from_chunks(
+            (self._normalize(chunk, types, statistics) for chunk in read()), ('min', 'max'))
+
+        def SR(chunk):
+            *_, ff = self._distances(chunk, types, statistics, (nstatistics.max, nstatistics.min))
+            weighted_ff = weights * ff
+            return np.sum(weighted_ff, axis=1), np.max(weighted_ff, axis=1)
+
+        Sstar = Rstar = np.inf
+        Sminus = Rminus = -np.inf
+        for chunk in read():
+            S, R = SR(chunk)
+            Sstar, Sminus = min(Sstar, np.min(S, initial=np.inf)), max(Sminus, np.max(S, initial=-np.inf))
+            Rstar, Rminus = min(Rstar, np.min(R, initial=np.inf)), max(Rminus, np.max(R, initial=-np.inf))
+
+        for chunk in read():
+            yield self._compromise(*SR(chunk), (Sstar, Sminus, Rstar, Rminus))
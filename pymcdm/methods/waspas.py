@@ -64,9 +64,22 @@ class WASPAS(MCDA_method):
     def _method(self, matrix, weights, types):
         l = self.l
         nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        self._checkpoint()
 
         q_sum = np.sum(nmatrix * weights, axis=1)
+        self._checkpoint()
         q_prod = np.prod(nmatrix ** weights, axis=1)
+        self._checkpoint()
 
         p = l * q_sum + (1 - l) * q_prod
+        self._checkpoint()
         return nmatrix, q_sum, q_prod, p
+
+    def _method_batch(self, matrix, weights, types):
+        l = self.l
+        nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+
+        q_sum = weights @ nmatrix.T
+        q_prod = np.prod(nmatrix ** weights[:, None, :], axis=2)
+
+        return l * q_sum + (1 - l) * q_prod
@@ -55,8 +55,15 @@ class WPM(MCDA_method):
 
     def _method(self, matrix, weights, types):
         nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        self._checkpoint()
         # Every row of nmatrix is compounded by weights
         weighted_matrix = nmatrix ** weights
+        self._checkpoint()
 
         p = np.prod(weighted_matrix, axis=1)
+        self._checkpoint()
         return nmatrix, weighted_matrix, p
+
+    def _method_batch(self, matrix, weights, types):
+        nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        return np.prod(nmatrix ** weights[:, None, :], axis=2)
@@ -55,8 +55,21 @@ class WSM(MCDA_method):
 
     def _method(self, matrix, weights, types):
         nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        self._checkpoint()
         # Every row of nmatrix is multiplayed by weights
         weighted_matrix = nmatrix * weights
+        self._checkpoint()
 
         p = np.sum(weighted_matrix, axis=1)
+        self._checkpoint()
         return nmatrix, weighted_matrix, p
+
+    def _method_batch(self, matrix, weights, types):
+        nmatrix = helpers.normalize_matrix(matrix, self.normalization, types)
+        return weights @ nmatrix.T
+
+    def _score_passes(self, read, weights, types):
+        statistics = normalizations._ColumnStatistics.from_chunks(read(), self._statistics_fields())
+        for chunk in read():
+            nmatrix = helpers.normalize_matrix(chunk, self.normalization, types, statistics=statistics)
+            yield np.sum(nmatrix * weights, axis=1)
@@ -12,7 +12,8 @@ __all__ = [
     'linear_normalization',
     'nonlinear_normalization',
     'enhanced_accuracy_normalization',
-    'zavadskas_turskis_normalization'
+    'zavadskas_turskis_normalization',
+    'rim_normalization'
 ]
 
 
@@ -22,7 +23,8 @@ def minmax_normalization(x, cost=False):
     Parameters
     ----------
         x : ndarray
-            One-dimensional numpy array of values to be normalized
+            One-dimensional numpy array of values to be normalized, or two-dimensional
+            numpy array which columns should be normalized.
 
         cost : bool, optional
             Vector type. Default profit type.
@@ -30,14 +32,18 @@ def minmax_normalization(x, cost=False):
     Returns
     -------
         ndarray
-            One-dimensional numpy array of normalized values.
+            Numpy array of normalized values with the same shape as `x`.
     """
-    if np.min(x) == np.max(x):  # If all values are equal
-        return np.ones(x.shape)
-
-    if cost:
-        return (np.max(x) - x) / (np.max(x) - np.min(x))
-    return (x - np.min(x)) / (np.max(x) - np.min(x))
+    x_min = np.min(x, axis=0)
+    x_max = np.max(x, axis=0)
+    # If all values are equal, normalized values are ones
+    equal = x_min == x_max
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if cost:
+            nx = (x_max - x) / (x_max - x_min)
+        else:
+            nx = (x - x_min) / (x_max - x_min)
+    return np.where(equal, 1.0, nx)
 
 
 def max_normalization(x, cost=False):
@@ -46,7 +52,8 @@ def max_normalization(x, cost=False):
     Parameters
     ----------
         x : ndarray
-            One-dimensional numpy array of values to be normalized
+            One-dimensional numpy array of values to be normalized, or two-dimensional
+            numpy array which columns should be normalized.
 
         cost : bool, optional
             Vector type. Default profit type.
@@ -54,11 +61,11 @@ def max_normalization(x, cost=False):
     Returns
     -------
         ndarray
-            One-dimensional numpy array of normalized values.
+            Numpy array of normalized values with the same shape as `x`.
     """
     if cost:
-        return 1 - x / np.max(x)
-    return x / np.max(x)
+        return 1 - x / np.max(x, axis=0)
+    return x / np.max(x, axis=0)
 
 
 def sum_normalization(x, cost=False):
@@ -67,7 +74,8 @@ def sum_normalization(x, cost=False):
     Parameters
     ----------
         x : ndarray
-            One-dimensional numpy array of values to be normalized. All values must be strictly positive (> 0).
+            One-dimensional numpy array of values to be normalized, or two-dimensional numpy array which
+            columns should be normalized. All values must be strictly positive (> 0).
 
         cost : bool, optional
             Vector type. Default profit type.
@@ -75,15 +83,15 @@ def sum_normalization(x, cost=False):
     Returns
     -------
         ndarray
-            One-dimensional numpy array of normalized values.
+            Numpy array of normalized values with the same shape as `x`.
     """
     # Input validation: sum normalization requires strictly positive values
     if np.any(x <= 0):
         raise ValueError('sum_normalization requires all positive values.')
 
     if cost:
-        return (1 / x) / np.sum(1 / x)
-    return x / np.sum(x)
+        return (1 / x) / np.sum(1 / x, axis=0)
+    return x / np.sum(x, axis=0)
 
 
 def vector_normalization(x, cost=False):
@@ -92,7 +100,8 @@ def vector_normalization(x, cost=False):
     Parameters
     ----------
         x : ndarray
-            One-dimensional numpy array of values to be normalized
+            One-dimensional numpy array of values to be normalized, or two-dimensional
+            numpy array which columns should be normalized.
 
         cost : bool, optional
             Vector type. Default profit type.
@@ -100,11 +109,11 @@ def vector_normalization(x, cost=False):
     Returns
     -------
         ndarray
-            One-dimensional numpy array of normalized values.
+            Numpy array of normalized values with the same shape as `x`.
     """
     if cost:
-        return 1 - (x / np.sqrt(np.sum(x ** 2)))
-    return x / np.sqrt(np.sum(x ** 2))
+        return 1 - (x / np.sqrt(np.sum(x ** 2, axis=0)))
+    return x / np.sqrt(np.sum(x ** 2, axis=0))
 
 
 def logarithmic_normalization(x, cost=False):
@@ -113,7 +122,8 @@ def logarithmic_normalization(x, cost=False):
     Parameters
     ----------
         x : ndarray
-            One-dimensional numpy array of values to be normalized. All values must be strictly positive (> 0)
+            One-dimensional numpy array of values to be normalized, or two-dimensional numpy array which
+            columns should be normalized. All values must be strictly positive (> 0)
             because the logarithm is undefined for zero or negative inputs.
 
         cost : bool, optional
@@ -122,16 +132,17 @@ def logarithmic_normalization(x, cost=False):
     Returns
     -------
         ndarray
-            One-dimensional numpy array of normalized values.
+            Numpy array of normalized values with the same shape as `x`.
     """
     # Input validation: logarithmic normalization requires strictly positive values
     if np.any(x <= 0):
         raise ValueError('logarithmic_normalization requires all positive values.')
 
-    prod = np.prod(x)
+    # log of the column product computed as the sum of logs, so it does not overflow or underflow
+    log_prod = np.sum(np.log(x), axis=0)
     if cost:
-        return (1 - (np.log(x) / np.log(prod))) / (x.shape[0] - 1)
-    return np.log(x) / np.log(prod)
+        return (1 - (np.log(x) / log_prod)) / (x.shape[0] - 1)
+    return np.log(x) / log_prod
 
 
 def linear_normalization(x, cost=False):
@@ -140,7 +151,8 @@ def linear_normalization(x, cost=False):
     Parameters
     ----------
         x : ndarray
-            One-dimensional numpy array of values to be normalized. Values must be non-zero, as division by zero
+            One-dimensional numpy array of values to be normalized, or two-dimensional numpy array which
+            columns should be normalized. Values must be non-zero, as division by zero
             would occur when computing the normalization.
 
         cost : bool, optional
@@ -149,15 +161,15 @@ def linear_normalization(x, cost=False):
     Returns
     -------
         ndarray
-            One-dimensional numpy array of normalized values.
+            Numpy array of normalized values with the same shape as `x`.
     """
     # Input validation: linear normalization cannot handle zeros when using division
     if np.any(x == 0):
         raise ValueError('linear_normalization cannot handle zero values.')
 
     if cost:
-        return np.min(x) / x
-    return x / np.max(x)
+        return np.min(x, axis=0) / x
+    return x / np.max(x, axis=0)
 
 
 def nonlinear_normalization(x, cost=False):
@@ -166,7 +178,8 @@ def nonlinear_normalization(x, cost=False):
     Parameters
     ----------
         x : ndarray
-            One-dimensional numpy array of values to be normalized
+            One-dimensional numpy array of values to be normalized, or two-dimensional
+            numpy array which columns should be normalized.
 
         cost : bool, optional
             Vector type. Default profit type.
@@ -174,11 +187,11 @@ def nonlinear_normalization(x, cost=False):
     Returns
     -------
         ndarray
-            One-dimensional numpy array of normalized values.
+            Numpy array of normalized values with the same shape as `x`.
     """
     if cost:
-        return (np.min(x) / x) ** 3
-    return (x / np.max(x)) ** 2
+        return (np.min(x, axis=0) / x) ** 3
+    return (x / np.max(x, axis=0)) ** 2
 
 
 def enhanced_accuracy_normalization(x, cost=False):
@@ -187,7 +200,8 @@ def enhanced_accuracy_normalization(x, cost=False):
     Parameters
     ----------
         x : ndarray
-            One-dimensional numpy array of values to be normalized
+            One-dimensional numpy array of values to be normalized, or two-dimensional
+            numpy array which columns should be normalized.
 
         cost : bool, optional
             Vector type. Default profit type.
@@ -195,11 +209,11 @@ def enhanced_accuracy_normalization(x, cost=False):
     Returns
     -------
         ndarray
-            One-dimensional numpy array of normalized values.
+            Numpy array of normalized values with the same shape as `x`.
     """
     if cost:
-        return 1 - (x - np.min(x)) / np.sum(x - np.min(x))
-    return 1 - (np.max(x) - x) / np.sum(np.max(x) - x)
+        return 1 - (x - np.min(x, axis=0)) / np.sum(x - np.min(x, axis=0), axis=0)
+    return 1 - (np.max(x, axis=0) - x) / np.sum(np.max(x, axis=0) - x, axis=0)
 
 
 def zavadskas_turskis_normalization(x, cost=False):
@@ -208,7 +222,8 @@ def zavadskas_turskis_normalization(x, cost=False):
     Parameters
     ----------
         x : ndarray
-            One-dimensional numpy array of values to be normalized
+            One-dimensional numpy array of values to be normalized, or two-dimensional
+            numpy array which columns should be normalized.
 
         cost : bool, optional
             Vector type. Default profit type.
@@ -216,8 +231,226 @@ def zavadskas_turskis_normalization(x, cost=False):
     Returns
     -------
         ndarray
-            One-dimensional numpy array of normalized values.
+            Numpy array of normalized values with the same shape as `x`.
+    """
+    if cost:
+        return 1 - np.abs((np.min(x, axis=0) - x) / np.min(x, axis=0))
+    return 1 - np.abs((np.max(x, axis=0) - x) / np.max(x, axis=0))
+
+
+# Normalization functions which normalize each column of two-dimensional arrays separately
+_COLUMN_NORMALIZATIONS = {
+    minmax_normalization,
+    max_normalization,
+    sum_normalization,
+    vector_normalization,
+    logarithmic_normalization,
+    linear_normalization,
+    nonlinear_normalization,
+    enhanced_accuracy_normalization,
+    zavadskas_turskis_normalization
+}
+
+
+class _ColumnStatistics:
+    """ Aggregates of the columns of a matrix, which can be accumulated from
+        chunks of the matrix rows. They are used to normalize chunks of the
+        decision matrix in the same way as the whole matrix is normalized.
+
+        Only the aggregates listed in `fields` (and the number of rows `n`)
+        are accumulated, see `_STATISTICS_FIELDS` for the aggregates used by
+        each normalization.
     """
+    # Aggregates and their initial values
+    _FIELDS = {
+        'min': np.inf,
+        'max': -np.inf,
+        'sum': 0.0,
+        'sum_squares': 0.0,
+        'sum_inverse': 0.0,
+        'sum_log': 0.0,
+    }
+
+    def __init__(self, m, fields=tuple(_FIELDS)):
+        self.n = 0
+        self.fields = tuple(fields)
+        for name in self.fields:
+            setattr(self, name, np.full(m, self._FIELDS[name]))
+
+    def update(self, x):
+        """ Add rows `x` to the statistics. """
+        self.n += x.shape[0]
+        fields = self.fields
+        if 'min' in fields:
+            np.minimum(self.min, np.min(x, axis=0, initial=np.inf), out=self.min)
+        if 'max' in fields:
+            np.maximum(self.max, np.max(x, axis=0, initial=-np.inf), out=self.max)
+        if 'sum' in fields:
+            self.sum += np.sum(x, axis=0)
+        if 'sum_squares' in fields:
+            self.sum_squares += np.sum(x ** 2, axis=0)
+        if 'sum_inverse' in fields:
+            with np.errstate(divide='ignore'):
+                self.sum_inverse += np.sum(1 / x, axis=0)
+        if 'sum_log' in fields:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self.sum_log += np.sum(np.log(x), axis=0)
+        return self
+
+    @classmethod
+    def from_chunks(cls, chunks, fields=tuple(_FIELDS)):
+        """ Statistics of the matrix consisting of the `chunks` of rows. """
+        statistics = None
+        for chunk in chunks:
+            if statistics is None:
+                statistics = cls(chunk.shape[1], fields)
+            statistics.update(chunk)
+        if statistics is None:
+            raise ValueError('At least one chunk of the decision matrix should be provided.')
+        return statistics
+
+    def __getitem__(self, columns):
+        """ Statistics of the selected `columns`. """
+        statistics = _ColumnStatistics(0, self.fields)
+        statistics.n = self.n
+        for name in self.fields:
+            setattr(statistics, name, getattr(self, name)[columns])
+        return statistics
+
+
+def _positive_values(x, name):
+    if np.any(x <= 0):
+        raise ValueError(f'{name} requires all positive values.')
+
+
+def _minmax_statistics(x, s, cost):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if cost:
+            nx = (s.max - x) / (s.max - s.min)
+        else:
+            nx = (x - s.min) / (s.max - s.min)
+    return np.where(s.min == s.max, 1.0, nx)
+
+
+def _max_statistics(x, s, cost):
+    if cost:
+        return 1 - x / s.max
+    return x / s.max
+
+
+def _sum_statistics(x, s, cost):
+    _positive_values(x, 'sum_normalization')
+    if cost:
+        return (1 / x) / s.sum_inverse
+    return x / s.sum
+
+
+def _vector_statistics(x, s, cost):
     if cost:
-        return 1 - np.abs((np.min(x) - x) / np.min(x))
-    return 1 - np.abs((np.max(x) - x) / np.max(x))
+        return 1 - (x / np.sqrt(s.sum_squares))
+    return x / np.sqrt(s.sum_squares)
+
+
+def _logarithmic_statistics(x, s, cost):
+    _positive_values(x, 'logarithmic_normalization')
+    if cost:
+        return (1 - (np.log(x) / s.sum_log)) / (s.n - 1)
+    return np.log(x) / s.sum_log
+
+
+def _linear_statistics(x, s, cost):
+    if np.any(x == 0):
+        raise ValueError('linear_normalization cannot handle zero values.')
+    if cost:
+        return s.min / x
+    return x / s.max
+
+
+def _nonlinear_statistics(x, s, cost):
+    if cost:
+        return (s.min / x) ** 3
+    return (x / s.max) ** 2
+
+
+def _enhanced_accuracy_statistics(x, s, cost):
+    if cost:
+        return 1 - (x - s.min) / (s.sum - s.n * s.min)
+    return 1 - (s.max - x) / (s.n * s.max - s.sum)
+
+
+def _zavadskas_turskis_statistics(x, s, cost):
+    if cost:
+        return 1 - np.abs((s.min - x) / s.min)
+    return 1 - np.abs((s.max - x) / s.max)
+
+
+# Equivalents of the normalization functions which use the statistics of
+# the whole matrix (`_ColumnStatistics`) to normalize chunks of its rows
+_STATISTICS_NORMALIZATIONS = {
+    minmax_normalization: _minmax_statistics,
+    max_normalization: _max_statistics,
+    sum_normalization: _sum_statistics,
+    vector_normalization: _vector_statistics,
+    logarithmic_normalization: _logarithmic_statistics,
+    linear_normalization: _linear_statistics,
+    nonlinear_normalization: _nonlinear_statistics,
+    enhanced_accuracy_normalization: _enhanced_accuracy_statistics,
+    zavadskas_turskis_normalization: _zavadskas_turskis_statistics,
+}
+
+# Aggregates of the columns (`_ColumnStatistics` fields) used by the above equivalents
+_STATISTICS_FIELDS = {
+    minmax_normalization: ('min', 'max'),
+    max_normalization: ('max',),
+    sum_normalization: ('sum', 'sum_inverse'),
+    vector_normalization: ('sum_squares',),
+    logarithmic_normalization: ('sum_log',),
+    linear_normalization: ('min', 'max'),
+    nonlinear_normalization: ('min', 'max'),
+    enhanced_accuracy_normalization: ('min', 'max', 'sum'),
+    zavadskas_turskis_normalization: ('min', 'max'),
+}
+
+
+def rim_normalization(x, bounds, ref_ideal):
+    """Calculate the normalized values using the Reference Ideal Method (RIM) normalization.
+
+    Values within the reference ideal are normalized to 1, and values outside of it
+    decrease linearly to 0 at the bounds. Unlike other normalizations, it requires
+    the criteria bounds and the reference ideal, so it can't be used with `normalize_matrix`.
+
+    Parameters
+    ----------
+        x : ndarray
+            One-dimensional numpy array of values of one criterion, or two-dimensional
+            numpy array with criteria in columns. Values should be within `bounds`.
+
+        bounds : ndarray
+            [min, max] bounds of the criterion, or two-dimensional array with
+            [min, max] bounds for each criterion in rows.
+
+        ref_ideal : ndarray
+            [min, max] reference ideal interval of the criterion, or two-dimensional
+            array with reference ideal interval for each criterion in rows.
+
+    Returns
+    -------
+        ndarray
+            Array of normalized values with the same shape as `x`. Values outside
+            of the `bounds` are NaN.
+    """
+    x = np.asarray(x, dtype='float')
+    bounds = np.asarray(bounds, dtype='float')
+    ref_ideal = np.asarray(ref_ideal, dtype='float')
+    a, b = bounds[..., 0], bounds[..., 1]
+    c, d = ref_ideal[..., 0], ref_ideal[..., 1]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        below = 1 - (c - x) / (c - a)
+        above = 1 - (x - d) / (b - d)
+
+    nx = np.full(x.shape, np.nan)
+    np.copyto(nx, above, where=(d < x) & (x <= b) & (d != b))
+    np.copyto(nx, below, where=(a <= x) & (x < c) & (a != c))
+    np.copyto(nx, 1.0, where=(c <= x) & (x <= d))
+    return nx
@@ -0,0 +1,274 @@
+# Copyright (c) 2026 Andrii Shekhovtsov
+
+import numpy as np
+
+from .validators import array_dimension_validator, types_validator
+
+__all__ = [
+    'smaa',
+    'sample_weights'
+]
+
+
+def sample_weights(n: int, m: int, rng: np.random.Generator | int | None = None) -> np.ndarray:
+    """ Sample `n` weight vectors uniformly distributed on the simplex,
+        i.e. each vector has `m` non-negative weights which sum up to 1.
+
+        Parameters
+        ----------
+            n : int
+                Number of weight vectors.
+
+            m : int
+                Number of criteria.
+
+            rng : Generator or int or None
+                Random number generator or seed used to create one.
+
+        Returns
+        -------
+            ndarray
+                Array of shape (n, m) with one weight vector in each row.
+
+        Examples
+        --------
+        >>> from pymcdm.smaa import sample_weights
+        >>> w = sample_weights(1000, 3, rng=42)
+        >>> w.shape
+        (1000, 3)
+    """
+    rng = np.random.default_rng(rng)
+    return rng.dirichlet(np.ones(m), size=n)
+
+
+def _sample_matrix(matrix_bounds, rng, size=None):
+    if size is not None:
+        size = (size, *matrix_bounds.shape[:-1])
+    return rng.uniform(matrix_bounds[..., 0], matrix_bounds[..., 1], size=size)
+
+
+def _best_shares(method, prefs):
+    """ Share of the first position of each alternative (along the last
+        axis of `prefs`), tied best alternatives share it equally. """
+    if method._reverse_ranking:
+        best = np.max(prefs, axis=-1, keepdims=True)
+    else:
+        best = np.min(prefs, axis=-1, keepdims=True)
+    is_best = prefs == best
+    return is_best / np.sum(is_best, axis=-1, keepdims=True)
+
+
+def _position_counts(method, prefs):
+    """ Matrix (N x N) where element [i, r] is the number of rows of `prefs`
+        in which alternative i is on position r + 1. Tied alternatives share
+        their positions equally, e.g. two alternatives tied for the first
+        place count as a half on the first and a half on the second position.
+    """
+    s, n = prefs.shape
+    order = np.argsort(-prefs if method._reverse_ranking else prefs, axis=1, kind='stable')
+    sorted_prefs = np.take_along_axis(prefs, order, axis=1)
+
+    # First and last positions of the group of tied alternatives
+    positions = np.broadcast_to(np.arange(n), (s, n))
+    new_group = np.ones((s, n), dtype=bool)
+    new_group[:, 1:] = sorted_prefs[:, 1:] != sorted_prefs[:, :-1]
+    first = np.maximum.accumulate(np.where(new_group, positions, 0), axis=1)
+    last_in_group = np.ones((s, n), dtype=bool)
+    last_in_group[:, :-1] = new_group[:, 1:]
+    last = np.minimum.accumulate(np.where(last_in_group, positions, n - 1)[:, ::-1], axis=1)[:, ::-1]
+    share = 1 / (last - first + 1)
+
+    # Each alternative gets `share` on positions first..last, accumulated as differences
+    diffs = np.bincount(np.concatenate(((order * (n + 1) + first).ravel(), (order * (n + 1) + last + 1).ravel())),
+                        np.concatenate((share.ravel(), -share.ravel())), minlength=n * (n + 1))
+    return np.cumsum(diffs.reshape(n, n + 1), axis=1)[:, :n]
+
+
+def _acceptability_chunk(method, matrix, types, matrix_bounds, weights_per_matrix, size, seed):
+    """ Evaluate `size` samples and return partial sums of the statistics. """
+    rng = np.random.default_rng(seed)
+    n, m = matrix.shape
+
+    weights = sample_weights(size, m, rng)
+    if matrix_bounds is None:
+        prefs = method.batch(matrix, weights, types, validation=False)
+    else:
+        matrices = _sample_matrix(matrix_bounds, rng, -(-size // weights_per_matrix))
+        prefs = np.vstack([
+            method.batch(x, weights[i:i + weights_per_matrix], types, validation=False)
+            for x, i in zip(matrices, range(0, size, weights_per_matrix))
+        ])
+
+    counts = _position_counts(method, prefs)
+    weights_sum = _best_shares(method, prefs).T @ weights
+
+    return counts, weights_sum
+
+
+def _confidence_chunk(method, types, matrix_bounds, alternatives, central_weights, size, seed):
+    """ Count how many times each alternative is the best one with its central weights. """
+    rng = np.random.default_rng(seed)
+
+    # Each sampled matrix is evaluated with all the central weights at once
+    prefs = np.stack([method.batch(x, central_weights, types, validation=False)
+                      for x in _sample_matrix(matrix_bounds, rng, size)])
+    shares = _best_shares(method, prefs)
+    return np.sum(shares[:, np.arange(alternatives.shape[0]), alternatives], axis=0)
+
+
+def _run_chunks(func, args, n_jobs):
+    if n_jobs == 1:
+        yield from (func(*a) for a in args)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            yield from executor.map(func, *zip(*args))
+
+
+def smaa(method,
+         matrix: np.ndarray | list | tuple,
+         types: np.ndarray | list | tuple,
+         samples: int = 10000,
+         matrix_bounds: np.ndarray | None = None,
+         weights_per_matrix: int = 1,
+         memory_limit: int = 2 ** 26,
+         seed: int | None = None,
+         n_jobs: int = 1):
+    """ Stochastic Multicriteria Acceptability Analysis (SMAA) [#smaa1]_ of
+        the alternatives with any MCDA method.
+
+        Criteria weights are sampled uniformly from the simplex (i.e. no
+        weight information is assumed) and, optionally, the decision matrix
+        values are sampled uniformly within the given bounds. Samples are
+        evaluated in chunks with `method.batch`, and the statistics are
+        accumulated chunk by chunk, so samples are never stored.
+
+        Parameters
+        ----------
+            method : MCDA_method
+                Any object of the MCDA method inherited from MCDA_method.
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            types : ndarray
+                Array with definitions of criteria types:
+                1 if criteria is profit and -1 if criteria is cost for each criteria in `matrix`.
+
+            samples : int
+                Number of Monte Carlo samples (weight vectors). Default is 10000.
+
+            matrix_bounds : ndarray or None
+                Array of shape (N, M, 2) with [min, max] bounds for each
+                value of the decision matrix. If provided, the decision matrix
+                is sampled uniformly within these bounds. If None, `matrix` is
+                used as is. Default is None.
+
+            weights_per_matrix : int
+                Number of weight vectors evaluated with each sampled decision
+                matrix. Only used when `matrix_bounds` is provided. Larger
+                values make the computation faster, as more weight vectors are
+                evaluated in one batch, however the samples are then less
+                independent. Default is 1.
+
+            memory_limit : int
+                Approximate limit (in bytes) of the memory used by a single
+                chunk of samples. Default is 64 MiB.
+
+            seed : int or None
+                Seed for the random number generator. Results are
+                reproducible for the same seed, independently of `n_jobs`.
+
+            n_jobs : int
+                Number of processes used to evaluate chunks in parallel.
+                `method` should be picklable if `n_jobs` > 1. Default is 1.
+
+        Returns
+        -------
+            acceptability : ndarray
+                Rank acceptability indices, i.e. matrix (N x N) where element
+                [i, r] is the share of samples in which alternative i was on
+                position r + 1. Tied alternatives share their positions
+                equally, e.g. each of two alternatives tied for the first
+                place counts as a half on the first and the second position.
+
+            central_weights : ndarray
+                Central weight vectors (N x M), i.e. the average weight vector
+                for which the alternative was the best one. Rows for
+                alternatives which were never the best are filled with NaN.
+
+            confidence : ndarray
+                Confidence factors, i.e. the probability that the alternative
+                is the best one when its central weight vector is used (tied
+                best alternatives share the first place equally).
+
+        References
+        ----------
+        .. [#smaa1] Lahdelma, R., Hokkanen, J., & Salminen, P. (1998). SMAA - stochastic multiobjective acceptability
+               analysis. European Journal of Operational Research, 106(1), 137-143.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from pymcdm.methods import TOPSIS
+        >>> from pymcdm.smaa import smaa
+        >>> matrix = np.array([[96, 83, 75, 7],
+        ...                    [63, 5, 56, 9],
+        ...                    [72, 30, 32, 48],
+        ...                    [11, 4, 27, 9],
+        ...                    [77, 21, 17, 11]])
+        >>> types = np.array([1, 1, -1, -1])
+        >>> acceptability, central_weights, confidence = smaa(TOPSIS(), matrix, types, seed=42)
+    """
+    matrix = np.asarray(matrix, dtype='float')
+    types = np.asarray(types)
+    array_dimension_validator(matrix, 2, 'Matrix')
+    types_validator(matrix, types)
+    method._additional_validation(matrix, None, types)
+
+    if matrix_bounds is not None:
+        matrix_bounds = np.asarray(matrix_bounds, dtype='float')
+        if matrix_bounds.shape != (*matrix.shape, 2):
+            raise ValueError(f'matrix_bounds should have shape {(*matrix.shape, 2)}, '
+                             f'but it has shape {matrix_bounds.shape}.')
+        if np.any(matrix_bounds[..., 0] > matrix_bounds[..., 1]):
+            raise ValueError('matrix_bounds should contain [min, max] values for each element of the matrix.')
+        method._additional_validation(matrix_bounds[..., 0], None, types)
+        method._additional_validation(matrix_bounds[..., 1], None, types)
+
+    n, m = matrix.shape
+    chunk_size = max(weights_per_matrix, memory_limit // (8 * n * max(n, m)))
+    chunk_size -= chunk_size % weights_per_matrix
+    sizes = [min(chunk_size, samples - i) for i in range(0, samples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes) + 1)
+
+    counts = np.zeros((n, n))
+    weights_sum = np.zeros((n, m))
+    args = [(method, matrix, types, matrix_bounds, weights_per_matrix, size, s)
+            for size, s in zip(sizes, seeds)]
+    for chunk_counts, chunk_weights_sum in _run_chunks(_acceptability_chunk, args, n_jobs):
+        counts += chunk_counts
+        weights_sum += chunk_weights_sum
+
+    acceptability = counts / samples
+
+    first = counts[:, 0]
+    central_weights = np.full((n, m), np.nan)
+    central_weights[first > 0] = weights_sum[first > 0] / first[first > 0, None]
+
+    confidence = np.zeros(n)
+    winners, = np.where(first > 0)
+    if winners.size > 0:
+        if matrix_bounds is None:
+            prefs = method.batch(matrix, central_weights[winners], types, validation=False)
+            confidence[winners] = _best_shares(method, prefs)[np.arange(winners.size), winners]
+        else:
+            conf_seeds = seeds[-1].spawn(len(sizes))
+            args = [(method, types, matrix_bounds, winners, central_weights[winners], size, s)
+                    for size, s in zip(sizes, conf_seeds)]
+            wins = sum(_run_chunks(_confidence_chunk, args, n_jobs))
+            confidence[winners] = wins / samples
+
+    return acceptability, central_weights, confidence
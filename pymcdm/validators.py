@@ -1,10 +1,169 @@
 # Copyright (c) 2024-2026 Andrii Shekhovtsov
 # Copyright (c) 2024-2026 Bartłomiej Kizielewicz
 
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
 from itertools import combinations
+from threading import Lock
 from warnings import warn
+import hashlib
 import numpy as np
 
+from .helpers import pareto_dominance
+
+
+# Warnings raised by the validators in the current context, recorded during
+# the validation by the cached validator (None outside of cached validators)
+_recorded_warnings = ContextVar('_recorded_warnings', default=None)
+
+
+def _warn(message, category=UserWarning):
+    """ Raise the validation warning and record it, so the validation cache
+        can raise it again for the same inputs. """
+    recorded = _recorded_warnings.get()
+    if recorded is not None:
+        recorded.append((message, category))
+    warn(message, category, stacklevel=2)
+
+
+class _ValidationCache:
+    """ LRU cache of the successful validations, keyed by the fingerprints of
+        the validated arrays (shape, dtype and hash of the data). Warnings
+        raised during the validation are stored and raised again on each hit.
+
+        Hashing the data costs about half of the validation of the decision
+        problem, so arrays larger than `max_bytes` are not cached (their
+        validation is repeated, which is not slower than the cache miss).
+    """
+
+    def __init__(self, maxsize=128, max_bytes=2 ** 24):
+        self.enabled = True
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._results = OrderedDict()
+        self._lock = Lock()
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    @contextmanager
+    def bypass(self):
+        """ Run validators without the cache inside the `with` block. """
+        token = _recorded_warnings.set([])
+        try:
+            yield
+        finally:
+            _recorded_warnings.reset(token)
+
+    def __len__(self):
+        return len(self._results)
+
+    def _fingerprint(self, obj):
+        """ Hashable representation of the validator arguments, or None if some argument is not supported. """
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.hasobject or (self.max_bytes is not None and obj.nbytes > self.max_bytes):
+                return None
+            digest = hashlib.sha1(np.ascontiguousarray(obj).data, usedforsecurity=False).digest()
+            return 'ndarray', obj.shape, obj.dtype.str, digest
+        if isinstance(obj, (list, tuple)):
+            items = tuple(self._fingerprint(o) for o in obj)
+            return None if None in items else (type(obj).__name__, items)
+        if isinstance(obj, (str, bool, int, float, np.number, type(None))):
+            return type(obj).__name__, obj
+        return None
+
+    def __call__(self, validator):
+        @wraps(validator)
+        def wrapper(*args, **kwargs):
+            # Nested validators are covered by the outermost cached validator
+            if not self.enabled or _recorded_warnings.get() is not None:
+                return validator(*args, **kwargs)
+
+            key = self._fingerprint((validator.__name__, args, tuple(sorted(kwargs.items()))))
+            if key is None:
+                return validator(*args, **kwargs)
+
+            with self._lock:
+                recorded = self._results.get(key)
+                if recorded is not None:
+                    self._results.move_to_end(key)
+            if recorded is not None:
+                for message, category in recorded:
+                    warn(message, category, stacklevel=2)
+                return None
+
+            recorded = []
+            token = _recorded_warnings.set(recorded)
+            try:
+                validator(*args, **kwargs)
+            finally:
+                _recorded_warnings.reset(token)
+
+            with self._lock:
+                self._results[key] = recorded
+                while len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+
+        return wrapper
+
+
+_validation_cache = _ValidationCache()
+
+
+def set_validation_cache(enabled: bool = True, maxsize: int | None = None):
+    """
+    Enables or disables caching of the validation results.
+
+    Validators of the decision problem (`validate_decision_problem`, `matrix_validator`,
+    `matrix_bounds_validator` and `matrix_cvalues_validator`) remember the fingerprints (shape, dtype
+    and hash of the data) of the inputs which passed the validation, so validation of identical inputs,
+    e.g. when many methods evaluate the same decision problem, is not repeated. Warnings raised during the
+    validation are raised again for the cached inputs. Inputs which fail the validation are not cached.
+    The cache is enabled by default and stores results of 128 most recent validations.
+
+    Hashing the data costs about half of the time of the validation itself, so arrays larger than 16 MB
+    are not cached.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether the validation results should be cached, by default True.
+    maxsize : int or None, optional
+        Maximum number of the cached validation results. If None, the current size is kept.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> set_validation_cache(False)  # Validate the inputs on each call
+    >>> set_validation_cache(True, maxsize=1024)
+    """
+    _validation_cache.enabled = enabled
+    if maxsize is not None:
+        if maxsize < 0:
+            raise ValueError(f'maxsize should be non-negative, but its value is {maxsize}.')
+        _validation_cache.maxsize = maxsize
+        while len(_validation_cache._results) > maxsize:
+            _validation_cache._results.popitem(last=False)
+    if not enabled:
+        _validation_cache.clear()
+
+
+def clear_validation_cache():
+    """
+    Removes all the cached validation results (see `set_validation_cache`).
+
+    Returns
+    -------
+    None
+    """
+    _validation_cache.clear()
+
 
 def param_validator(param: float, name: str):
     """
@@ -128,6 +287,7 @@ def matrix_ref_point_validator(matrix: np.ndarray, ref_point: np.ndarray) -> Non
             f'as number of the criteria {matrix.shape[1]}.')
 
 
+@_validation_cache
 def matrix_cvalues_validator(matrix: np.ndarray, cvalues: list[tuple] | list[list] | np.ndarray):
     """
     Validates that the characteristic values (`cvalues`) align with the criteria in the decision matrix.
@@ -246,6 +406,7 @@ def ref_ideal_bounds_validator(ref_ideal: np.ndarray, bounds: np.ndarray):
                          'ref_ideal values should be ordered in [min, max] order.')
 
 
+@_validation_cache
 def matrix_bounds_validator(matrix: np.ndarray, bounds: np.ndarray):
     """
     Validates that all values in the decision matrix lie within the specified bounds for each criterion.
@@ -455,7 +616,8 @@ def esp_bounds_validator(esp: np.ndarray, bounds: np.ndarray):
         raise ValueError('ESP values should be in range of min and max values (bounds) for each criterion.')
 
 
-def matrix_validator(matrix: np.ndarray, types: np.ndarray | list | tuple):
+@_validation_cache
+def matrix_validator(matrix: np.ndarray, types: np.ndarray | list | tuple, pareto: bool = False):
     """
     Validates the decision matrix and checks for dominant or dominated alternatives.
 
@@ -468,6 +630,9 @@ def matrix_validator(matrix: np.ndarray, types: np.ndarray | list | tuple):
            - Dominant alternatives have the best values for all criteria.
            - Dominated alternatives have the worst values for all criteria.
 
+        3. Optionally, it reports alternatives which are Pareto-dominated by any other alternative
+           (see `pymcdm.helpers.pareto_dominance`).
+
     Parameters
     ----------
     matrix : numpy.ndarray
@@ -476,6 +641,8 @@ def matrix_validator(matrix: np.ndarray, types: np.ndarray | list | tuple):
         A sequence indicating the type of optimization for each criterion. Each element should be:
         - `1` for maximization (profit) criteria.
         - `-1` for minimization (cost) criteria.
+    pareto : bool, optional
+        Whether to search for alternatives dominated by any other alternative, by default False.
 
     Returns
     -------
@@ -490,6 +657,7 @@ def matrix_validator(matrix: np.ndarray, types: np.ndarray | list | tuple):
     UserWarning
         If any alternative in `matrix` is dominant (best in all criteria).
         If any alternative in `matrix` is dominated (worst in all criteria).
+        If `pareto` is True and any alternative in `matrix` is dominated by other alternative.
 
     Examples
     --------
@@ -516,20 +684,24 @@ def matrix_validator(matrix: np.ndarray, types: np.ndarray | list | tuple):
     max_alt = np.max(matrix, axis=0)
     min_alt = np.min(matrix, axis=0)
 
-    dominant = [max_alt[i] if types[i] == 1 else min_alt[i]
-                for i in range(matrix.shape[1])]
-    dominated = [max_alt[i] if types[i] == -1 else min_alt[i]
-                 for i in range(matrix.shape[1])]
+    dominant = np.where(types == 1, max_alt, min_alt)
+    dominated = np.where(types == -1, max_alt, min_alt)
 
-    dominant_alts, = np.where([np.all(dominant == alt) for alt in matrix])
+    dominant_alts, = np.where(np.all(matrix == dominant, axis=1))
     if dominant_alts.size > 0:
-        warn(f'Alternatives with indices {dominant_alts} are dominant. Consider removing them, '
-             'as such alternatives can cause numerical errors in some methods.', UserWarning)
+        _warn(f'Alternatives with indices {dominant_alts} are dominant. Consider removing them, '
+              'as such alternatives can cause numerical errors in some methods.', UserWarning)
 
-    dominated_alts, = np.where([np.all(dominated == alt) for alt in matrix])
+    dominated_alts, = np.where(np.all(matrix == dominated, axis=1))
     if dominated_alts.size > 0:
-        warn(f'Alternatives with indices {dominated_alts} are dominated. Consider removing them, '
-             'as such alternatives can cause numerical errors in some methods.', UserWarning)
+        _warn(f'Alternatives with indices {dominated_alts} are dominated. Consider removing them, '
+              'as such alternatives can cause numerical errors in some methods.', UserWarning)
+
+    if pareto:
+        pareto_alts, = np.where(pareto_dominance(matrix, types))
+        if pareto_alts.size > 0:
+            _warn(f'Alternatives with indices {pareto_alts} are Pareto-dominated by other alternatives.',
+                  UserWarning)
 
 
 def weights_validator(matrix: np.ndarray, weights: np.ndarray):
@@ -581,8 +753,63 @@ def weights_validator(matrix: np.ndarray, weights: np.ndarray):
         raise ValueError('Number of criteria should be same as number of weights.')
 
     if abs(weights.sum() - 1) >= 0.01 or np.any(weights <= 0):
-        warn('Weights should be positive and its sum should be equal one. Now, sum of the weights is '
-             f'{weights.sum()}.', UserWarning)
+        _warn('Weights should be positive and its sum should be equal one. Now, sum of the weights is '
+              f'{weights.sum()}.', UserWarning)
+
+
+def weights_batch_validator(matrix: np.ndarray, weights: np.ndarray):
+    """
+    Validates a stack of weight vectors used for the batch evaluation of a decision matrix.
+
+    This function ensures the following:
+
+    1. The `weights` array is two-dimensional, with one weight vector in each row.
+    2. The number of weights in each row matches the number of criteria (columns) in the decision matrix.
+    3. All weights are positive, and the sum of each row is approximately 1 (within a tolerance of 0.01).
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        A 2D array where each row represents an alternative and each column represents a criterion.
+    weights : np.ndarray
+        A 2D array where each row is a weight vector, i.e. each element represents the weight assigned
+        to a criterion.
+
+    Returns
+    -------
+    None
+        This function does not return a value. It raises an error if validation fails.
+
+    Raises
+    ------
+    ValueError
+        If `weights` is not two-dimensional.
+        If the number of weights in rows does not match the number of criteria in `matrix`.
+
+    UserWarning
+        If any weight vector contains non-positive weights or its sum deviates from 1 by more than 0.01.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> matrix = np.array([[1, 2, 3], [4, 5, 6]])
+    >>> weights = np.array([[0.2, 0.3, 0.5], [0.5, 0.3, 0.2]])
+    >>> weights_batch_validator(matrix, weights) # No output, as validation passes.
+
+    >>> invalid_weights = np.array([[0.2, 0.3, 0.5], [0.2, 0.3, 0.4]])
+    >>> weights_batch_validator(matrix, invalid_weights)
+    UserWarning: Weights should be positive and its sum should be equal one. Check weight vectors with indices [1].
+    """
+    array_dimension_validator(weights, 2, 'Weights')
+
+    if matrix.shape[1] != weights.shape[1]:
+        raise ValueError('Number of criteria should be same as number of weights in each weight vector.')
+
+    invalid, = np.where(np.logical_or(np.abs(weights.sum(axis=1) - 1) >= 0.01,
+                                      np.any(weights <= 0, axis=1)))
+    if invalid.size > 0:
+        _warn('Weights should be positive and its sum should be equal one. '
+              f'Check weight vectors with indices {invalid}.', UserWarning)
 
 
 def types_validator(matrix: np.ndarray, types: np.ndarray):
@@ -639,6 +866,7 @@ def types_validator(matrix: np.ndarray, types: np.ndarray):
                          'or 1.')
 
 
+@_validation_cache
 def validate_decision_problem(matrix: np.ndarray, weights: np.ndarray, types: np.ndarray):
     """
     Validates the components of a decision problem, including the decision matrix, weights, and types.
@@ -3,6 +3,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from ..methods.comet import _tfn_membership_matrix
+
 def comet_tfns(comet,
                criterion_index,
                criterion_name=None,
@@ -80,17 +82,16 @@ def comet_tfns(comet,
             alpha=0.5
         )
 
-    tfns = comet.tfns[criterion_index]
-    cvalues = comet.cvalues[criterion_index]
+    cvalues = np.asarray(comet.cvalues[criterion_index], dtype='float')
 
     x = np.linspace(cvalues[0], cvalues[-1], 512)
     x = np.hstack((cvalues[0], x, cvalues[-1]))
-    for i, tfn in enumerate(tfns):
+    memberships = _tfn_membership_matrix(x, cvalues)
+    memberships[[0, -1]] = 0
+    for i, y in enumerate(memberships.T):
         if colors is not None:
             plot_kwargs['color'] = colors[i % len(colors)]
             fill_kwargs['color'] = colors[i % len(colors)]
-        y = tfn(x)
-        y[[0, -1]] = 0
         ax.plot(x, y, **plot_kwargs)
         if fill:
             ax.fill_between(x, y, 0, **fill_kwargs)
@@ -6,13 +6,14 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 from matplotlib.colors import ListedColormap
 
-def mej_plot(mej, grid_width=2, cmap=None, colorbar=False, ax=None):
+def mej_plot(mej, grid_width=2, cmap=None, colorbar=False, ax=None, max_size=None):
     """ Draw MEJ extracted from COMET object.
 
         Parameters
         ----------
             mej : ndarray
-                MEJ matrix extracted from COMET object.
+                MEJ matrix extracted from COMET object, or its lazy view
+                (`comet.get_MEJ(lazy=True)`).
 
             grid_width : float
                 Width of the grid lines. Default is 2.
@@ -26,6 +27,14 @@ def mej_plot(mej, grid_width=2, cmap=None, colorbar=False, ax=None):
             ax : Axes
                 Axes object to draw on.
 
+            max_size : int or None
+                Maximal number of drawn rows and columns. Larger MEJ is
+                subsampled with the same step in rows and columns, so only
+                the drawn elements are computed for the lazy view (which
+                allows to draw MEJ of models with 10^4+ COs, e.g. with
+                `max_size=1000`). If None, the whole MEJ is drawn. Default
+                is None.
+
         Returns
         -------
             ax : Axes
@@ -56,6 +65,11 @@ def mej_plot(mej, grid_width=2, cmap=None, colorbar=False, ax=None):
     if ax is None:
         ax = plt.gca()
 
+    if max_size is not None and max(mej.shape) > max_size:
+        step = -(-max(mej.shape) // max_size)
+        mej = mej[::step, ::step]
+    mej = np.asarray(mej)
+
     if cmap is None:
         cmap = ListedColormap(['tab:red', 'tab:blue', 'tab:green'])
     im = ax.imshow(mej, cmap=cmap, aspect='auto')
@@ -4,7 +4,6 @@
 import numpy as np
 from ..normalizations import minmax_normalization, sum_normalization, linear_normalization
 from ..correlations import pearson
-from scipy.linalg import null_space
 from ..helpers import correlation_matrix, normalize_matrix
 
 __all__ = [
@@ -165,6 +164,8 @@ def cilos_weights(matrix, types, *args, **kwargs):
     A = nmatrix[np.argmax(nmatrix, axis=0)]
     P = (np.diag(A) - A) / np.diag(A)
     F = P - np.diag(np.sum(P, axis=0))
+    from scipy.linalg import null_space
+
     q = null_space(F)
     return (q / np.sum(q)).flatten()
 
@@ -2,12 +2,15 @@
 # Copyright (c) 2023-2026 Bartłomiej Kizielewicz
 
 import unittest
+from itertools import combinations
+from math import comb
 
 import numpy as np
 
 from pymcdm.methods import TOPSIS, COMET
-from pymcdm.methods.comet_tools import (MethodExpert, Submodel,
+from pymcdm.methods.comet_tools import (MethodExpert, Submodel, ESPExpert,
                                         StructuralCOMET, triads_consistency)
+from pymcdm.methods.comet_tools.triads_consistency import T_weak_inc_rules, T_strong_inc_rules
 
 
 class TestStructuralCOMET(unittest.TestCase):
@@ -94,6 +97,43 @@ class TestStructuralCOMET(unittest.TestCase):
             self.assertListEqual(list(np.round(res[key].data, 4)), reference[key])
 
 
+class TestMethodExpert(unittest.TestCase):
+    """ Test MethodExpert with an MCDA method which is not `MCDA_method`. """
+    def test_duck_typed_method(self):
+        class SumMethod:
+            def __call__(self, matrix, weights, types, validation=True):
+                return matrix @ (weights * types)
+
+            def rank(self, p):
+                return TOPSIS().rank(p)
+
+        cvalues = [[0, 0.5, 1], [0, 1], [0, 0.5, 1]]
+        weights = np.array([0.2, 0.3, 0.5])
+        types = np.array([1, -1, 1])
+        comet = COMET(cvalues, MethodExpert(SumMethod(), weights, types))
+        np.testing.assert_array_equal(np.argsort(comet.p, kind='stable'),
+                                      np.argsort(np.asarray(comet.co_space) @ (weights * types), kind='stable'))
+
+
+class TestESPExpert(unittest.TestCase):
+    """ Test SJ vector computed without the MEJ matrix. """
+    def test_sj(self):
+        bounds = np.array([[0, 1]] * 3, dtype=float)
+        esps = np.array([[0.4, 0.4, 0.2], [0.8, 0.1, 0.5]])
+        cvalues = ESPExpert(esps, bounds, cvalues_psi=0.2).make_cvalues_psi()
+
+        comet = COMET(cvalues, ESPExpert(esps, bounds))
+        comet_mej = COMET(cvalues, ESPExpert(esps, bounds, mej=True))
+        self.assertIsNone(comet.mej)
+        np.testing.assert_array_equal(comet.p, comet_mej.p)
+        np.testing.assert_array_equal(comet.get_MEJ(), comet_mej.mej)
+
+        distances = np.array([0.3, 0.1, 0.3, 0.5, 0.1, 0.3])
+        sj, mej = ESPExpert(esps, bounds)._call_sorted(distances)
+        self.assertIsNone(mej)
+        np.testing.assert_array_equal(sj, [2.5, 5, 2.5, 0.5, 5, 2.5])
+
+
 class TestTriadsConsistency_MEJ(unittest.TestCase):
     """ Test output of the triads_consistency coefficient.
     Sałabun, W., Shekhovtsov, A., & Kizielewicz, B. (2021, June). A new
@@ -146,3 +186,26 @@ class TestTriadsConsistency_COMET(unittest.TestCase):
         comet = COMET(cvalues, MethodExpert(TOPSIS(), np.ones(2)/2, [1, -1]))
 
         self.assertEqual(triads_consistency(comet), 1.0)
+
+    def test_lazy_mej(self):
+        cvalues = [
+                [1, 3, 5],
+                [1, 2, 3, 5],
+                [0, 1]
+                ]
+        comet = COMET(cvalues, MethodExpert(TOPSIS(), np.ones(3)/3, [1, -1, 1]))
+        view = comet.get_MEJ(lazy=True)
+        self.assertIsNone(comet.mej)
+
+        p = comet.p
+        expected = (p[:, None] > p) + (p[:, None] == p) / 2
+        np.testing.assert_array_equal(np.asarray(view), expected)
+        np.testing.assert_array_equal(comet.get_MEJ(), expected)
+        for key in [3, (slice(None), 5), (slice(2, 9), slice(None, None, 3)), ([1, 2], [3, 4])]:
+            np.testing.assert_array_equal(view[key], expected[key])
+
+        mej = np.where(np.random.default_rng(0).random(expected.shape) < 0.1, 1 - expected, expected)
+        self.assertEqual(triads_consistency(view), 1.0)
+        inconsistent = [(i, j, k) for i, j, k in combinations(range(len(mej)), 3)
+                        if (mej[i, j], mej[j, k], mej[i, k]) in T_weak_inc_rules + T_strong_inc_rules]
+        self.assertAlmostEqual(triads_consistency(mej), 1 - len(inconsistent) / comb(len(mej), 3))
@@ -0,0 +1,51 @@
+import unittest
+from itertools import combinations
+
+import numpy as np
+
+from pymcdm import correlations
+
+
+def _pairs_signs(x, y):
+    return [np.sign(x[i] - x[j]) * np.sign(y[i] - y[j]) for i, j in combinations(range(len(x)), 2)]
+
+
+class TestKendallTau(unittest.TestCase):
+
+    def test_output(self):
+        self.assertAlmostEqual(correlations.kendall_tau([1, 2, 3, 4, 5], [1, 2, 3, 4, 5]), 1)
+        self.assertAlmostEqual(correlations.kendall_tau([1, 2, 3, 4, 5], [5, 4, 3, 2, 1]), -1)
+        self.assertAlmostEqual(correlations.kendall_tau([1, 2, 3, 4, 5], [2, 1, 3, 5, 4]), 0.6)
+
+    def test_brute_force(self):
+        rng = np.random.default_rng(42)
+        for n in [2, 3, 10, 50]:
+            for k in [1, 3, n]:
+                x = rng.integers(0, k, n).astype(float)
+                y = rng.integers(0, k, n).astype(float)
+                expected = np.sum(_pairs_signs(x, y)) / (n * (n - 1) / 2)
+                self.assertAlmostEqual(correlations.kendall_tau(x, y), expected)
+
+
+class TestGoodmanKruskalGamma(unittest.TestCase):
+
+    def test_output(self):
+        self.assertAlmostEqual(correlations.goodman_kruskal_gamma([1, 2, 3, 4, 5], [5, 4, 3, 2, 1]), -1)
+        self.assertAlmostEqual(correlations.goodman_kruskal_gamma([1, 1, 2, 3], [1, 2, 3, 3]), 1)
+
+    def test_brute_force(self):
+        rng = np.random.default_rng(42)
+        for n in [3, 10, 50]:
+            for k in [2, 3, n]:
+                x = rng.integers(0, k, n).astype(float)
+                y = rng.integers(0, k, n).astype(float)
+                signs = np.array(_pairs_signs(x, y))
+                if np.all(signs == 0):
+                    continue
+                expected = np.sum(signs) / np.sum(signs != 0)
+                self.assertAlmostEqual(correlations.goodman_kruskal_gamma(x, y), expected)
+
+    def test_no_comparable_pairs(self):
+        with self.assertWarns(UserWarning):
+            with np.errstate(invalid='ignore'):
+                self.assertTrue(np.isnan(correlations.goodman_kruskal_gamma([1, 1, 1], [1, 2, 3])))
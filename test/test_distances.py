@@ -1,6 +1,8 @@
 import unittest
 
-from pymcdm.distances import draWS, kemeny, frobenius
+import numpy as np
+
+from pymcdm.distances import draWS, kemeny, frobenius, _r_to_psm
 
 
 class TestDistancesDraWS(unittest.TestCase):
@@ -66,6 +68,14 @@ class TestDistancesKemeny(unittest.TestCase):
             with self.subTest(r=r, expected_value=ev):
                 self.assertAlmostEqual(kemeny((1, 2, 3), r), ev)
 
+    def test_kemeny_psm(self):
+        rng = np.random.default_rng(42)
+        for n in [1, 2, 10, 50]:
+            r1 = rng.integers(1, n + 1, n)
+            r2 = rng.integers(1, n + 1, n)
+            expected = 0.5 * np.sum(np.abs(_r_to_psm(r1) - _r_to_psm(r2)))
+            self.assertAlmostEqual(kemeny(r1, r2), expected)
+
 
 class TestDistancesFrobenius(unittest.TestCase):
     """
@@ -99,3 +109,11 @@ class TestDistancesFrobenius(unittest.TestCase):
         for r, ev in cases:
             with self.subTest(r=r, expected_value=ev):
                 self.assertAlmostEqual(frobenius((1, 2, 3), r), ev, places=4)
+
+    def test_frobenius_psm(self):
+        rng = np.random.default_rng(42)
+        for n in [1, 2, 10, 50]:
+            r1 = rng.integers(1, n + 1, n)
+            r2 = rng.integers(1, n + 1, n)
+            expected = np.sqrt(np.sum((_r_to_psm(r1) - _r_to_psm(r2)) ** 2))
+            self.assertAlmostEqual(frobenius(r1, r2), expected)
@@ -0,0 +1,85 @@
+import unittest
+
+import numpy as np
+
+from pymcdm import helpers, correlations
+from pymcdm.validators import matrix_validator
+
+
+class TestRankdata(unittest.TestCase):
+
+    def test_output(self):
+        self.assertListEqual(list(helpers.rankdata([0, 3, 2, 5])), [1, 3, 2, 4])
+        self.assertListEqual(list(helpers.rankdata([0, 3, 2, 5], reverse=True)), [4, 2, 3, 1])
+        self.assertListEqual(list(helpers.rankdata([0, 3, 2, 3])), [1, 3.5, 2, 3.5])
+        self.assertListEqual(list(helpers.rankdata([0, 3, 2, 3], reverse=True)), [4, 1.5, 3, 1.5])
+        self.assertListEqual(list(helpers.rankdata([2, 2, 2])), [2, 2, 2])
+
+    def test_axis(self):
+        a = np.array([[0, 3, 2, 3],
+                      [1, 1, 2, 0],
+                      [4, 0, 2, 1]])
+
+        rows = helpers.rankdata(a, reverse=True)
+        for r, ar in zip(rows, a):
+            self.assertListEqual(list(r), list(helpers.rankdata(ar, reverse=True)))
+
+        cols = helpers.rankdata(a, axis=0)
+        for r, ac in zip(cols.T, a.T):
+            self.assertListEqual(list(r), list(helpers.rankdata(ac)))
+
+
+class TestCorrelationMatrix(unittest.TestCase):
+
+    def test_kernels(self):
+        rankings = np.array([[1, 2, 3, 4, 5],
+                             [2, 1, 3, 5, 4],
+                             [5, 4, 3, 2, 1],
+                             [1.5, 1.5, 3, 4.5, 4.5]])
+        weights = np.array([[0.2, 0.2, 0.2, 0.2, 0.2],
+                            [0.1, 0.2, 0.3, 0.3, 0.1],
+                            [0.5, 0.1, 0.1, 0.1, 0.2]])
+
+        for method, data in [(correlations.spearman, rankings),
+                             (correlations.pearson, rankings),
+                             (correlations.weighted_spearman, rankings),
+                             (correlations.rank_similarity_coef, rankings),
+                             (correlations.kendall_tau, rankings),
+                             (correlations.wsc, weights),
+                             (correlations.wsc2, weights)]:
+            with self.subTest(method=method.__name__):
+                expected = [[round(method(a, b), 4) for b in data] for a in data]
+                output = np.round(helpers.correlation_matrix(data, method), 4).tolist()
+                self.assertListEqual(expected, output)
+
+                output = np.round(helpers.correlation_matrix(data.T, method, columns=True), 4).tolist()
+                self.assertListEqual(expected, output)
+
+
+class TestParetoDominance(unittest.TestCase):
+
+    def test_brute_force(self):
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            matrix = rng.integers(0, 4, (rng.integers(1, 60), rng.integers(1, 5)))
+            types = rng.choice([-1, 1], matrix.shape[1])
+            oriented = matrix * types
+            expected = [any(np.all(b >= a) and np.any(b > a) for b in oriented) for a in oriented]
+            self.assertListEqual(expected, helpers.pareto_dominance(matrix, types).tolist())
+
+    def test_blocks(self):
+        rng = np.random.default_rng(1)
+        matrix = rng.random((500, 3))
+        types = np.array([1, -1, 1])
+        expected = helpers.pareto_dominance(matrix, types)
+        block_size = helpers._SKYLINE_BLOCK_SIZE
+        try:
+            helpers._SKYLINE_BLOCK_SIZE = 100
+            np.testing.assert_array_equal(expected, helpers.pareto_dominance(matrix, types))
+        finally:
+            helpers._SKYLINE_BLOCK_SIZE = block_size
+
+    def test_validator(self):
+        matrix = np.array([[1, 5], [2, 4], [1, 4], [3, 3]])
+        with self.assertWarnsRegex(UserWarning, r'\[2\] are Pareto-dominated'):
+            matrix_validator(matrix, [1, 1], pareto=True)
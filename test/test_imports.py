@@ -0,0 +1,29 @@
+import subprocess
+import sys
+import unittest
+
+HEAVY_MODULES = ['matplotlib', 'mpl_toolkits', 'pandas', 'scipy', 'tabulate']
+
+
+def _imported_modules(code):
+    """ Run `code` in a fresh interpreter and return heavy modules it has imported. """
+    code = f'import sys\n{code}\nprint(" ".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return output.stdout.split()
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_import(self):
+        self.assertListEqual(_imported_modules('import pymcdm'), [])
+
+    def test_method_call(self):
+        code = ('import numpy as np\n'
+                'from pymcdm.methods import TOPSIS\n'
+                'TOPSIS()(np.array([[1, 2], [2, 1], [3, 3]]), np.array([0.5, 0.5]), np.array([1, -1]))')
+        self.assertListEqual(_imported_modules(code), [])
+
+    def test_lazy_submodules(self):
+        self.assertIn('pandas', _imported_modules('import pymcdm\npymcdm.io.Table'))
+        self.assertIn('matplotlib', _imported_modules('import pymcdm\npymcdm.visuals'))
+        self.assertListEqual(_imported_modules('import pymcdm\npymcdm.weights'), [])
@@ -1,11 +1,14 @@
 # Copyright (c) 2023-2026 Andrii Shekhovtsov
 # Copyright (c) 2022-2026 Bartłomiej Kizielewicz
 
+import inspect
+import time
 import unittest
+import warnings
 import numpy as np
 from nbformat.v2.rwbase import rejoin_lines
 
-from pymcdm import methods
+from pymcdm import methods, normalizations
 from pymcdm.methods.mcda_method import MCDA_method
 from pymcdm.methods.comet_tools import MethodExpert
 
@@ -20,6 +23,150 @@ class TestMCDA(unittest.TestCase):
             types = np.array([1, -1, -1])
             body(matrix=matrix, weights=weights, types=types)
 
+    def test_batch(self):
+        matrix = np.array([[96, 83, 75, 7],
+                           [63, 5, 56, 9],
+                           [72, 30, 32, 48],
+                           [11, 4, 27, 9],
+                           [77, 21, 17, 11]])
+        types = np.array([1, 1, -1, -1])
+        weights = np.array([[0.25, 0.25, 0.25, 0.25],
+                            [0.4, 0.3, 0.2, 0.1],
+                            [0.1, 0.1, 0.1, 0.7]])
+        bounds = methods.SPOTIS.make_bounds(matrix)
+
+        for body in [methods.WSM(), methods.WPM(), methods.WASPAS(), methods.TOPSIS(), methods.VIKOR(),
+                     methods.SPOTIS(bounds), methods.BalancedSPOTIS(bounds, np.mean(matrix, axis=0)),
+                     methods.COPRAS(), methods.MABAC(), methods.ARAS(), methods.EDAS(), methods.CODAS()]:
+            with self.subTest(method=body.__class__.__name__):
+                output = [list(np.round(body(matrix, w, types), 4)) for w in weights]
+                output_method = [list(np.round(p, 4)) for p in body.batch(matrix, weights, types)]
+                self.assertListEqual(output, output_method)
+
+    def test_score_chunks(self):
+        rng = np.random.default_rng(0)
+        matrix = rng.random((101, 4))
+        weights = np.array([0.1, 0.2, 0.3, 0.4])
+        types = np.array([1, -1, 1, 1])
+        bounds = methods.SPOTIS.make_bounds(matrix)
+        ideal = np.where(types == 1, bounds[:, 1], bounds[:, 0])
+        anti_ideal = np.where(types == 1, bounds[:, 0], bounds[:, 1])
+
+        for body in [methods.SPOTIS(bounds), methods.BalancedSPOTIS(bounds, np.mean(matrix, axis=0)),
+                     methods.RAFSI(ideal, anti_ideal), methods.RIM(bounds), methods.LoPM(anti_ideal, types),
+                     methods.COMET(methods.COMET.make_cvalues(matrix), MethodExpert(methods.TOPSIS(), weights, types))]:
+            with self.subTest(method=body.__class__.__name__):
+                chunks = list(body.score_chunks(matrix, weights, types, chunk_size=10))
+                self.assertEqual(len(chunks), 11)
+                np.testing.assert_allclose(np.concatenate(chunks), body(matrix, weights, types))
+
+        for body in [methods.ARAS(), methods.LoPM()]:
+            with self.subTest(method=body.__class__.__name__):
+                with self.assertRaises(ValueError):
+                    body.score_stream([matrix], weights, types)
+
+    def test_score_chunks_passes(self):
+        rng = np.random.default_rng(0)
+        matrix = rng.random((101, 4)) + 0.5
+        weights = np.array([0.1, 0.2, 0.3, 0.4])
+        types = np.array([1, -1, 1, -1])
+
+        for body in [methods.TOPSIS(), methods.VIKOR(), methods.WSM(), methods.EDAS(), methods.MABAC(),
+                     methods.TOPSIS(normalizations.vector_normalization),
+                     methods.VIKOR(normalizations.minmax_normalization)]:
+            with self.subTest(method=body.__class__.__name__):
+                chunks = list(body.score_chunks(matrix, weights, types, chunk_size=10))
+                self.assertEqual(len(chunks), 11)
+                np.testing.assert_allclose(np.concatenate(chunks), body(matrix, weights, types))
+
+        large_matrix = matrix * 1e300
+        with np.errstate(over='raise'):
+            chunks = list(methods.TOPSIS().score_chunks(large_matrix, weights, types, chunk_size=10))
+        np.testing.assert_allclose(np.concatenate(chunks), methods.TOPSIS()(large_matrix, weights, types))
+
+        with self.assertRaises(ValueError):
+            methods.TOPSIS().score_stream(iter([matrix]), weights, types)
+        with self.assertRaises(ValueError):
+            methods.WSM(lambda x, cost: x).score_stream([matrix], weights, types)
+
+    def test_score_chunks_passes_many_alternatives(self):
+        # Geometric means of thousands of values underflow if computed as products
+        rng = np.random.default_rng(0)
+        matrix = rng.random((2000, 5)) * 10 + 1
+        weights = np.array([0.1, 0.2, 0.3, 0.2, 0.2])
+        types = np.array([1, -1, 1, -1, 1])
+
+        for body in [methods.MABAC(), methods.TOPSIS(normalizations.logarithmic_normalization)]:
+            with self.subTest(method=body.__class__.__name__):
+                expected = body(matrix, weights, types)
+                self.assertTrue(np.all(np.isfinite(expected)))
+                chunks = list(body.score_chunks(matrix, weights, types, chunk_size=500))
+                np.testing.assert_allclose(np.concatenate(chunks), expected)
+                np.testing.assert_allclose(body.batch(matrix, weights[None], types)[0], expected)
+
+    def test_profile(self):
+        matrix = np.array([[96, 83, 75, 7],
+                           [63, 5, 56, 9],
+                           [72, 30, 32, 48],
+                           [11, 4, 27, 9],
+                           [77, 21, 17, 11]])
+        weights = np.array([0.25, 0.25, 0.25, 0.25])
+        types = np.array([1, 1, -1, -1])
+
+        results = methods.TOPSIS()(matrix, weights, types, profile=True)
+        steps = [s['step'] for s in results.profile]
+        self.assertListEqual(steps, ['Validation'] + [t.caption for t in methods.TOPSIS._tables] + ['Results'])
+        for s in results.profile:
+            self.assertGreaterEqual(s['time'], 0)
+            self.assertGreaterEqual(s['peak_memory'], 0)
+        np.testing.assert_array_equal(results.results[-1].data, methods.TOPSIS()(matrix, weights, types))
+        self.assertIs(results.to_dict()['Profile'], results.profile)
+        self.assertIn('"label": "profile"', results.to_json())
+
+        results = methods.TOPSIS()(matrix, weights, types, verbose=True)
+        self.assertIsNone(results.profile)
+        self.assertNotIn('Profile', results.to_dict())
+
+    def test_profile_steps(self):
+        rng = np.random.default_rng(0)
+        matrix = rng.random((200, 4)) + 1
+        weights = np.ones(4) / 4
+        types = np.array([1, -1, 1, -1])
+        bounds = np.array([[1, 2]] * 4)
+        ideal = np.where(types == 1, 2, 1)
+
+        bodies = [getattr(methods, name)() for name in ['ARAS', 'AROMAN', 'COCOSO', 'CODAS', 'COPRAS', 'EDAS',
+                                                        'LMAW', 'LoPM', 'MABAC', 'MAIRCA', 'MARCOS', 'MOORA',
+                                                        'OCRA', 'PROBID', 'RAM', 'SPROBID', 'TOPSIS', 'VIKOR',
+                                                        'WASPAS', 'WPM', 'WSM']]
+        bodies += [methods.SPOTIS(bounds), methods.BalancedSPOTIS(bounds, np.mean(matrix, axis=0)),
+                   methods.RIM(bounds), methods.RAFSI(ideal, 3 - ideal), methods.ERVD(np.mean(matrix, axis=0)),
+                   methods.PROMETHEE_II('usual'), methods.partial.PROMETHEE_I('usual'),
+                   methods.COMET(methods.COMET.make_cvalues(matrix), MethodExpert(methods.TOPSIS(), weights, types))]
+        # Every method should be checked, so a new method can not drop or add a checkpoint unnoticed
+        implemented = {cls for module in (methods, methods.partial) for cls in vars(module).values()
+                       if isinstance(cls, type) and issubclass(cls, MCDA_method) and not inspect.isabstract(cls)}
+        self.assertSetEqual(implemented - {body.__class__ for body in bodies}, set())
+
+        for body in bodies:
+            with self.subTest(method=body.__class__.__name__):
+                start = time.perf_counter()
+                with warnings.catch_warnings():
+                    warnings.filterwarnings('error', message='.* method marked')
+                    results = body(matrix, weights, types, profile=True)
+                total = time.perf_counter() - start
+
+                # One checkpoint after each intermediate result (PROMETHEE adds a table for each criterion)
+                n_tables = len(body._tables)
+                if isinstance(body, methods.partial.PROMETHEE_I):
+                    n_tables += matrix.shape[1]
+                self.assertEqual(len(results.profile), n_tables + 2)
+                steps = [s['step'] for s in results.profile]
+                self.assertListEqual(steps, ['Validation'] + [t.desc.caption for t in results.results] + ['Results'])
+                for s in results.profile:
+                    self.assertGreater(s['time'], 0)
+                self.assertLessEqual(sum(s['time'] for s in results.profile), total)
+
 
 class TestARAS(unittest.TestCase):
     """ Test output method with reference:
@@ -128,6 +275,17 @@ class TestCODAS(unittest.TestCase):
 
         self.assertListEqual(output, output_method)
 
+    def test_blocks(self):
+        matrix = np.random.default_rng(42).random((50, 4))
+        weights = np.array([0.4, 0.3, 0.2, 0.1])
+        types = np.array([1, -1, 1, -1])
+
+        output = methods.CODAS()(matrix, weights, types, verbose=True).results[-1].data
+        for block_size in [1, 7, 50]:
+            with self.subTest(block_size=block_size):
+                body = methods.CODAS(block_size=block_size)
+                self.assertTrue(np.allclose(output, body(matrix, weights, types)))
+
 
 class TestCOMET(unittest.TestCase):
     """ Test output method with reference:
@@ -164,6 +322,46 @@ class TestCOMET(unittest.TestCase):
 
         self.assertListEqual(output, output_method)
 
+    def test_tfn_memberships(self):
+        from pymcdm.methods.comet import _tfn_membership_matrix
+        cv = np.array([0, 0.5, 2])
+        values = np.array([-1, 0, 0.25, 0.5, 1.25, 2, 3])
+        expected = np.array([[0, 0, 0],
+                             [1, 0, 0],
+                             [0.5, 0.5, 0],
+                             [0, 1, 0],
+                             [0, 0.5, 0.5],
+                             [0, 0, 1],
+                             [0, 0, 0]])
+        np.testing.assert_allclose(_tfn_membership_matrix(values, cv), expected)
+
+    def test_save_load(self):
+        import io
+        matrix = np.random.default_rng(0).random((20, 4)) + [0, 0, 0, 1]
+        weights = np.ones(4) / 4
+        types = np.array([1, -1, 1, 1])
+        for co_ordering in ['product', 'gray_code']:
+            with self.subTest(co_ordering=co_ordering):
+                comet = methods.COMET([[0, 0.5, 1], [0, 1], [0, 0.3, 0.6, 1], [1, 2]],
+                                      MethodExpert(methods.TOPSIS(), weights, types),
+                                      co_ordering=co_ordering)
+                f = io.BytesIO()
+                comet.save(f)
+                f.seek(0)
+                loaded = methods.COMET.load(f)
+                np.testing.assert_array_equal(comet(matrix), loaded(matrix))
+                np.testing.assert_array_equal(comet.get_MEJ(), loaded.get_MEJ())
+                self.assertEqual(comet.co_ordering, loaded.co_ordering)
+                self.assertIsNone(loaded.expert_function)
+                for cv, loaded_cv in zip(comet.cvalues, loaded.cvalues):
+                    np.testing.assert_array_equal(cv, loaded_cv)
+                    self.assertEqual(np.asarray(cv).dtype, loaded_cv.dtype)
+
+                f = io.BytesIO()
+                comet.save(f, mej=False)
+                f.seek(0)
+                self.assertIsNone(methods.COMET.load(f).mej)
+
     def test_gray_code(self):
         from pymcdm.methods.comet import _gray_code_product
 
@@ -172,6 +370,41 @@ class TestCOMET(unittest.TestCase):
         expected = [[1, 10], [1, 20], [2, 20], [2, 10]]
         self.assertListEqual(list(result), expected)
 
+    def test_co_space(self):
+        from itertools import product
+        from pymcdm.methods.comet import _gray_code_product
+        from pymcdm.methods.comet_tools import CharacteristicObjects
+
+        cvalues = [[0, 2, 5, 10], [1, 3, 5], [-1, 0, 1], [0.5, 1.5]]
+        for gray_code, ordering in ((False, product), (True, _gray_code_product)):
+            with self.subTest(gray_code=gray_code):
+                space = CharacteristicObjects(cvalues, gray_code)
+                expected = np.array(list(ordering(*cvalues)))
+                np.testing.assert_array_equal(np.asarray(space), expected)
+                np.testing.assert_array_equal(space[[5, -1]], expected[[5, -1]])
+                np.testing.assert_array_equal(space.index(expected), np.arange(len(expected)))
+                np.testing.assert_array_equal(np.concatenate(list(space.chunks(7))), expected)
+
+        bounds = np.array([[0, 10], [1, 5], [-1, 1], [0.5, 1.5]])
+        expert = MethodExpert(methods.SPOTIS(bounds), np.ones(4) / 4, np.array([1, -1, 1, 1]))
+        comet = methods.COMET(cvalues, expert)
+        materialized = methods.COMET(cvalues, lambda co: expert(np.asarray(co)))
+        np.testing.assert_array_equal(comet.p, materialized.p)
+
+    def test_gray_code_output(self):
+        cvalues = [[0, 2, 5, 10], [1, 3, 5], [-1, 0, 1]]
+        matrix = np.array([[0, 1, -1],
+                           [2, 3, 0],
+                           [1, 2, 0.5],
+                           [7.5, 4.2, -0.3],
+                           [10, 5, 1]])
+        expert = MethodExpert(methods.TOPSIS(), np.ones(3) / 3, [1, -1, 1])
+
+        product_pref = methods.COMET(cvalues, expert)(matrix)
+        gray_code_pref = methods.COMET(cvalues, expert, co_ordering='gray_code')(matrix)
+
+        self.assertListEqual(list(np.round(product_pref, 4)), list(np.round(gray_code_pref, 4)))
+
 
 class TestCOPRAS(unittest.TestCase):
     """ Test output method with reference:
@@ -400,6 +633,32 @@ class TestPROMETHEE_II(unittest.TestCase):
 
         self.assertListEqual(output, output_method)
 
+    def test_blocks(self):
+        matrix = np.random.default_rng(42).random((50, 4))
+        weights = np.array([0.4, 0.3, 0.2, 0.1])
+        types = np.array([1, -1, 1, -1])
+
+        for pf in ['usual', 'ushape', 'vshape', 'level', 'vshape_2']:
+            body = methods.PROMETHEE_II(pf, p=[0.3] * 4, q=[0.1] * 4)
+            output = body(matrix, weights, types, verbose=True).results[-1].data
+            for block_size in [1, 7, 50]:
+                with self.subTest(preference_function=pf, block_size=block_size):
+                    body = methods.PROMETHEE_II(pf, p=[0.3] * 4, q=[0.1] * 4, block_size=block_size)
+                    self.assertTrue(np.allclose(output, body(matrix, weights, types)))
+
+    def test_sorted_flows(self):
+        matrix = np.random.default_rng(42).integers(0, 5, (40, 4)).astype(float)
+        weights = np.array([0.4, 0.3, 0.2, 0.1])
+        types = np.array([1, -1, 1, -1])
+
+        for pf, p, q in [('usual', None, None),
+                         ('vshape', [1, 2, 0.5, 3], None),
+                         ('vshape_2', [1, 2, 0.5, 3], [0, 1, 0.25, -1])]:
+            with self.subTest(preference_function=pf):
+                body = methods.PROMETHEE_II(pf, p=p, q=q)
+                output = body(matrix, weights, types, verbose=True).results[-1].data
+                self.assertTrue(np.allclose(output, body(matrix, weights, types)))
+
 
 class TestSPOTIS(unittest.TestCase):
     """ Test output method with reference:
@@ -735,6 +994,18 @@ class TestPROBID(unittest.TestCase):
         output = [2.4246, 2.0596, 3.2806, 3.3702, 3.4374, 2.6435, 1.2628, 1.8158, 2.0885, 0.3399, 0.4279]
         self.assertListEqual(output, output_method)
 
+    def test_blocks(self):
+        matrix = np.random.default_rng(42).random((50, 4))
+        weights = np.array([0.4, 0.3, 0.2, 0.1])
+        types = np.array([1, -1, 1, -1])
+
+        for method in [methods.PROBID, methods.SPROBID]:
+            output = method()(matrix, weights, types, verbose=True).results[-1].data
+            for block_size in [1, 7, 50]:
+                with self.subTest(method=method.__name__, block_size=block_size):
+                    body = method(block_size=block_size)
+                    self.assertTrue(np.allclose(output, body(matrix, weights, types)))
+
 
 class TestWSM(unittest.TestCase):
     """ Test output method with reference:
@@ -228,6 +228,25 @@ class TestZTNormalization2(unittest.TestCase):
             self.assertListEqual(output, output_method)
 
 
+class TestRIMNormalization(unittest.TestCase):
+    """ Test output method without reference """
+
+    def test_output(self):
+        matrix = np.array([[0, 2, 5, 10],
+                           [3, 4, 8, 10],
+                           [10, 0, 3, 0]])
+        bounds = np.array([[0, 10], [0, 4], [3, 8], [0, 10]])
+        ref_ideal = np.array([[0, 0], [4, 4], [4, 6], [0, 10]])
+
+        output = [1.0, 0.5, 1.0, 1.0, 0.7, 1.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+        output_method = [round(val, 8) for val in norm.rim_normalization(matrix, bounds, ref_ideal).reshape(-1)]
+        self.assertListEqual(output, output_method)
+
+        for j in range(matrix.shape[1]):
+            output_method = norm.rim_normalization(matrix[:, j], bounds[j], ref_ideal[j])
+            self.assertListEqual(list(output_method), list(output[j::4]))
+
+
 class TestNormalizeMatrix(unittest.TestCase):
     """ Test output method without reference """
     def setUp(self):
@@ -253,6 +272,39 @@ class TestNormalizeMatrix(unittest.TestCase):
                                                self.good_types).T.reshape(-1))
         self.assertListEqual(output, [1, 0.4, 0.6, 0.3, 0.2, 0.5])
 
+    def test_columns(self):
+        matrix = np.random.default_rng(42).random((10, 6)) + 0.5
+        types = np.array([1, -1, 1, 1, -1, -1])
+        for method in norm._COLUMN_NORMALIZATIONS:
+            with self.subTest(method=method.__name__):
+                expected = np.array([method(col, cost=t == -1) for col, t in zip(matrix.T, types)]).T
+                output = helpers.normalize_matrix(matrix, method, types)
+                self.assertTrue(np.allclose(expected, output))
+
+    def test_statistics(self):
+        matrix = np.random.default_rng(0).random((50, 4)) + 0.5
+        types = np.array([1, -1, 1, -1])
+        chunks = [matrix[i:i + 7] for i in range(0, 50, 7)]
+        for method in norm._STATISTICS_NORMALIZATIONS:
+            with self.subTest(method=method.__name__):
+                statistics = norm._ColumnStatistics.from_chunks(chunks, norm._STATISTICS_FIELDS[method])
+                output = np.vstack([helpers.normalize_matrix(c, method, types, statistics=statistics)
+                                    for c in chunks])
+                np.testing.assert_allclose(output, helpers.normalize_matrix(matrix, method, types))
+
+        self.assertRaises(ValueError, helpers.normalize_matrix,
+                          matrix, lambda x, cost: x, types, statistics=statistics)
+
+    def test_statistics_large_values(self):
+        matrix = np.random.default_rng(0).random((50, 4)) * 1e300 + 1e300
+        types = np.array([1, -1, 1, -1])
+        chunks = [matrix[i:i + 7] for i in range(0, 50, 7)]
+        with np.errstate(over='raise'):
+            statistics = norm._ColumnStatistics.from_chunks(chunks, norm._STATISTICS_FIELDS[norm.logarithmic_normalization])
+        output = np.vstack([helpers.normalize_matrix(c, norm.logarithmic_normalization, types, statistics=statistics)
+                            for c in chunks])
+        np.testing.assert_allclose(np.sum(output[:, types == 1], axis=0), 1)
+
     def test_wrong_data1(self):
         self.assertRaises(
                 ValueError,
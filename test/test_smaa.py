@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from pymcdm import methods
+from pymcdm.smaa import smaa, sample_weights, _position_counts
+
+
+class TestSampleWeights(unittest.TestCase):
+
+    def test_output(self):
+        w = sample_weights(100, 4, rng=1)
+        self.assertEqual(w.shape, (100, 4))
+        self.assertTrue(np.all(w >= 0))
+        self.assertTrue(np.allclose(w.sum(axis=1), 1))
+
+
+class TestSMAA(unittest.TestCase):
+
+    def setUp(self):
+        self.matrix = np.array([[96, 83, 75, 7],
+                                [63, 5, 56, 9],
+                                [72, 30, 32, 48],
+                                [11, 4, 27, 9],
+                                [77, 21, 17, 11]])
+        self.types = np.array([1, 1, -1, -1])
+
+    def test_output(self):
+        acceptability, central_weights, confidence = smaa(methods.TOPSIS(), self.matrix, self.types,
+                                                          samples=2000, seed=1)
+
+        self.assertTrue(np.allclose(acceptability.sum(axis=0), 1))
+        self.assertTrue(np.allclose(acceptability.sum(axis=1), 1))
+
+        winners = acceptability[:, 0] > 0
+        self.assertTrue(np.allclose(central_weights[winners].sum(axis=1), 1))
+        self.assertTrue(np.all(np.isnan(central_weights[~winners])))
+        self.assertTrue(np.all(confidence[~winners] == 0))
+
+    def test_reproducibility(self):
+        matrix_bounds = np.stack((self.matrix * 0.9, self.matrix * 1.1), axis=-1)
+        results = [smaa(methods.WSM(), self.matrix, self.types, samples=500, matrix_bounds=matrix_bounds,
+                        weights_per_matrix=10, memory_limit=2 ** 12, seed=1, n_jobs=n_jobs)
+                   for n_jobs in (1, 2)]
+
+        for a, b in zip(*results):
+            self.assertTrue(np.allclose(a, b, equal_nan=True))
+
+    def test_ties(self):
+        # The last alternative is a copy of the first one
+        matrix = np.vstack((self.matrix, self.matrix[:1]))
+        acceptability, central_weights, confidence = smaa(methods.WSM(), matrix, self.types,
+                                                          samples=2000, seed=1)
+
+        self.assertTrue(np.allclose(acceptability.sum(axis=0), 1))
+        self.assertTrue(np.allclose(acceptability.sum(axis=1), 1))
+        np.testing.assert_allclose(acceptability[0], acceptability[-1])
+        np.testing.assert_allclose(central_weights[0], central_weights[-1])
+        np.testing.assert_allclose(confidence[0], confidence[-1])
+
+    def test_position_counts(self):
+        prefs = np.array([[0.5, 0.9, 0.5, 0.1],
+                          [0.2, 0.2, 0.2, 0.3]])
+        expected = np.array([[0, 0.5, 0.5, 0],
+                             [1, 0, 0, 0],
+                             [0, 0.5, 0.5, 0],
+                             [0, 0, 0, 1]])
+        expected += np.array([[0, 1 / 3, 1 / 3, 1 / 3],
+                              [0, 1 / 3, 1 / 3, 1 / 3],
+                              [0, 1 / 3, 1 / 3, 1 / 3],
+                              [1, 0, 0, 0]])
+        np.testing.assert_allclose(_position_counts(methods.WSM(), prefs), expected)
@@ -0,0 +1,93 @@
+import unittest
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pymcdm import validators
+from pymcdm.methods import SPOTIS
+
+
+class TestValidationCache(unittest.TestCase):
+
+    def setUp(self):
+        validators.set_validation_cache(True, maxsize=128)
+        validators.clear_validation_cache()
+        self.matrix = np.array([[1, 5], [2, 4], [3, 3]], dtype='float')
+        self.weights = np.array([0.5, 0.5])
+        self.types = np.array([1, 1])
+
+    def tearDown(self):
+        validators.set_validation_cache(True, maxsize=128)
+        validators.clear_validation_cache()
+
+    def test_cached(self):
+        validators.validate_decision_problem(self.matrix, self.weights, self.types)
+        validators.validate_decision_problem(self.matrix.copy(), self.weights, self.types)
+        self.assertEqual(len(validators._validation_cache), 1)
+
+        self.matrix[0, 0] = 1.5
+        validators.validate_decision_problem(self.matrix, self.weights, self.types)
+        self.assertEqual(len(validators._validation_cache), 2)
+
+    def test_method_specific(self):
+        method = SPOTIS(SPOTIS.make_bounds(self.matrix))
+        method(self.matrix, self.weights, self.types)
+        method(self.matrix, self.weights, self.types)
+        self.assertEqual(len(validators._validation_cache), 2)
+
+        bounds = np.array([[1, 2], [3, 5]])
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                validators.matrix_bounds_validator(self.matrix, bounds)
+        self.assertEqual(len(validators._validation_cache), 2)
+
+    def test_warnings(self):
+        matrix = np.array([[1, 5], [2, 4], [3, 6]])
+        for _ in range(2):
+            with self.assertWarnsRegex(UserWarning, r'\[2\] are dominant'):
+                validators.matrix_validator(matrix, self.types)
+        self.assertEqual(len(validators._validation_cache), 1)
+
+    def test_warning_filters(self):
+        matrix = np.array([[1, 5], [2, 4], [3, 6]])
+        filters = list(warnings.filters)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            validators.matrix_validator(matrix, self.types)
+        self.assertListEqual(warnings.filters, filters)
+        with self.assertWarnsRegex(UserWarning, r'\[2\] are dominant'):
+            validators.matrix_validator(matrix, self.types)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            with self.assertRaises(UserWarning):
+                validators.matrix_validator(matrix + 1, self.types)
+
+    def test_threads(self):
+        matrices = [self.matrix + i for i in range(8)]
+        filters = list(warnings.filters)
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda m: SPOTIS(SPOTIS.make_bounds(m))(m, self.weights, self.types),
+                              matrices * 10))
+        self.assertListEqual(warnings.filters, filters)
+        self.assertEqual(len(validators._validation_cache), 16)
+
+    def test_large_arrays(self):
+        column = np.arange(validators._validation_cache.max_bytes // 16 + 1, dtype='float')
+        matrix = np.column_stack([column, -column])
+        validators.matrix_validator(matrix, self.types)
+        self.assertEqual(len(validators._validation_cache), 0)
+
+    def test_disable_and_maxsize(self):
+        validators.set_validation_cache(False)
+        validators.matrix_validator(self.matrix, self.types)
+        self.assertEqual(len(validators._validation_cache), 0)
+
+        validators.set_validation_cache(True, maxsize=2)
+        for i in range(4):
+            validators.matrix_validator(self.matrix + i, self.types)
+        self.assertEqual(len(validators._validation_cache), 2)
+
+        validators.clear_validation_cache()
+        self.assertEqual(len(validators._validation_cache), 0)